@@ -0,0 +1 @@
+"""Benchmarks for the Flight Game hot paths (run with `python -m benchmarks`)."""
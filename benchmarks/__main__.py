@@ -0,0 +1,82 @@
+"""
+benchmarks/__main__.py
+======================
+Command line entry point for the benchmark suite.
+
+Example::
+
+    python -m benchmarks --generators finland,clustered --sizes 100,1000,10000
+    python -m benchmarks --save-baseline
+"""
+
+import argparse
+import json
+import os
+import sys
+from .suite import BENCHMARKS, compare, run_suite
+from .synthetic import GENERATORS
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _csv(text: str):
+    return [part.strip() for part in text.split(",") if part.strip()]
+
+
+def main() -> int:
+    """Run the suite, write JSON results and compare them against the baseline."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--bench", type=_csv, default=None,
+        help=f"comma separated subset of: {', '.join(BENCHMARKS)}",
+    )
+    parser.add_argument(
+        "--generators", type=_csv, default=["finland"],
+        help=f"comma separated subset of: {', '.join(GENERATORS)}",
+    )
+    parser.add_argument(
+        "--sizes", type=lambda s: [int(x) for x in _csv(s)], default=[100, 1000, 10000],
+        help="comma separated airport counts (up to 100000)",
+    )
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per case")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store the results as the new baseline"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25,
+        help="allowed slowdown against the baseline median (0.25 = 25%%)",
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.bench or []) - set(BENCHMARKS) | set(args.generators) - set(GENERATORS)
+    if unknown:
+        parser.error(f"unknown benchmark/generator: {', '.join(sorted(unknown))}")
+
+    results = run_suite(
+        args.bench, args.generators, args.sizes, args.min_time,
+        log=lambda line: print(line, file=sys.stderr),
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against (run with --save-baseline).", file=sys.stderr)
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
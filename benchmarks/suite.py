@@ -0,0 +1,346 @@
+"""
+benchmarks/suite.py
+===================
+Timed benchmarks for the game's hot paths.
+
+Every benchmark is a setup function taking a synthetic `AirportTable` and
+returning the callable to time, registered with `register_benchmark`.
+Timings are per call; `measure` repeats a call until a time budget is used.
+
+Includes:
+    - `BENCHMARKS`: registry of benchmark setups by name.
+    - `measure`: run a callable repeatedly and summarize the timings.
+    - `run_suite`: run benchmarks over generators and sizes into a JSON-ready dict.
+"""
+
+from __future__ import annotations
+import itertools
+import platform
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import numpy as np
+from game.cli.renderer import Renderer
+from game.core.commands.command import get_command
+from game.core.entities.airport_table import AirportTable
+from game.core.game import Game
+from game.core.input.input_handler import handle_input
+from game.core.planning.player_rule_route import compute_player_rule_route
+from game.core.world import World
+from game.db import config as db_config
+from game.db.airport_repo import AirportRepository
+from game.db.airport_snapshot import load_snapshot, save_snapshot
+from game.db.memory_repo import InMemoryAirportRepository
+from game.db.sqlite_repo import SQLiteAirportRepository
+from game.utils.distance import ellipsoidal_km
+from .synthetic import GENERATORS
+
+Setup = Callable[[AirportTable], Callable[[], Any]]
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark."""
+
+    name: str
+    setup: Setup
+    # False for benchmarks whose cost does not depend on the airport set.
+    sized: bool = True
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def register_benchmark(name: str, sized: bool = True):
+    """Decorator to register a benchmark setup function under `name`."""
+
+    def wrap(setup: Setup) -> Setup:
+        BENCHMARKS[name] = Benchmark(name, setup, sized)
+        return setup
+
+    return wrap
+
+
+def measure(
+    fn: Callable[[], Any],
+    min_time: float = 0.2,
+    min_runs: int = 3,
+    max_runs: int = 1000,
+) -> Dict[str, float]:
+    """
+    Time `fn` until `min_time` seconds (and at least `min_runs` calls) are spent.
+
+    Returns:
+        Dict[str, float]: Median, p90 and minimum per-call time in microseconds,
+        plus the number of runs.
+    """
+    fn()  # warm-up: lazy caches, imports
+    times: List[float] = []
+    spent = 0.0
+    while len(times) < max_runs and (len(times) < min_runs or spent < min_time):
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        times.append(dt)
+        spent += dt
+    times.sort()
+    return {
+        "median_us": statistics.median(times) * 1e6,
+        "p90_us": times[min(len(times) - 1, int(0.9 * len(times)))] * 1e6,
+        "min_us": times[0] * 1e6,
+        "runs": len(times),
+    }
+
+
+def _started_game(airports: AirportTable) -> Game:
+    """Return a started game over `airports` with a fixed seed."""
+    game = Game(world=World(airports), seed=0)
+    game.start()
+    return game
+
+
+# Benchmarks
+# ------------------------------------------------------------------------- #
+@register_benchmark("game_options")
+def bench_game_options(airports: AirportTable) -> Callable[[], Any]:
+    """Move list for the first turn of a game."""
+    game = _started_game(airports)
+    return game.options
+
+
+@register_benchmark("turn_context")
+def bench_turn_context(airports: AirportTable) -> Callable[[], Any]:
+    """Build the per-turn context (status, options, deltas) from scratch."""
+    game = _started_game(airports)
+
+    def run():
+        game._turn_context = None
+        return game.turn_context()
+
+    return run
+
+
+@register_benchmark("rule_route")
+def bench_rule_route(airports: AirportTable) -> Callable[[], Any]:
+    """Greedy route between fixed random airport pairs (one pair per call)."""
+    world = World(airports)
+    rng = np.random.default_rng(1)
+    pairs = []
+    for s, t in rng.integers(0, len(airports), size=(8, 2)).tolist():
+        target = airports[t]
+        dist = ellipsoidal_km(airports.lat, airports.lon, target.lat, target.lon)
+        pairs.append((airports[s], target, dist))
+    calls = itertools.count()
+
+    def run():
+        start, target, dist = pairs[next(calls) % len(pairs)]
+        return compute_player_rule_route(
+            start,
+            target,
+            airports,
+            fuel_per_km=Game.FUEL_PER_KM,
+            fuel_fixed=Game.FUEL_TAKEOFF_LANDING,
+            index=world.index,
+            target_dist_km=dist,
+        )
+
+    return run
+
+
+@register_benchmark("draw_map")
+def bench_draw_map(airports: AirportTable) -> Callable[[], Any]:
+    """Render the ASCII map with all airports."""
+    renderer = Renderer()
+    current, target = airports[0], airports[len(airports) // 2]
+    return lambda: renderer.draw_map(current, target, airports)
+
+
+@register_benchmark("draw_map_styled")
+def bench_draw_map_styled(airports: AirportTable) -> Callable[[], Any]:
+    """Render the colored map as shown by the map command."""
+    renderer = Renderer()
+    current, target = airports[0], airports[len(airports) // 2]
+    return lambda: renderer.draw_map_styled(current, target, airports)
+
+
+@register_benchmark("get_command", sized=False)
+def bench_get_command(airports: AirportTable) -> Callable[[], Any]:
+    """Match a mix of typed inputs (valid, aliases, invalid) to commands."""
+    inputs = ["1", "3", "fly", "map", "m", "log", "r", "quit", "nonsense", ""]
+    return lambda: [get_command(text) for text in inputs]
+
+
+@register_benchmark("handle_input")
+def bench_handle_input(airports: AirportTable) -> Callable[[], Any]:
+    """Parse and execute cheap commands against a started game."""
+    game = _started_game(airports)
+    inputs = ["refresh", "r", "log", "nonsense"]
+    return lambda: [handle_input(game, text) for text in inputs]
+
+
+class _RowCursor:
+    """Unbuffered cursor stand-in that serves rows from memory."""
+
+    def __init__(self, rows: List[tuple]) -> None:
+        self._rows = rows
+        self._pos = 0
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> None:
+        self._pos = 0
+
+    def fetchmany(self, size: int) -> List[tuple]:
+        batch = self._rows[self._pos : self._pos + size]
+        self._pos += len(batch)
+        return batch
+
+    def close(self) -> None:
+        pass
+
+
+class _RowConnection:
+    """DB-API connection stand-in whose cursors serve the same rows."""
+
+    def __init__(self, rows: List[tuple]) -> None:
+        self._rows = rows
+
+    def cursor(self, *args, **kwargs) -> _RowCursor:
+        return _RowCursor(self._rows)
+
+    def ping(self, reconnect: bool = False) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+@register_benchmark("repo_load_table")
+def bench_repo_load_table(airports: AirportTable) -> Callable[[], Any]:
+    """`AirportRepository.load_table` through the pool, rows served from memory."""
+    # Decimal coordinates as returned by the MariaDB connector would cost
+    # more; floats keep the benchmark about the loading path itself.
+    rows = list(
+        zip(airports.icao, airports.name, airports.country,
+            airports.lat.tolist(), airports.lon.tolist())
+    )
+    pool = db_config.ConnectionPool(lambda: _RowConnection(rows), size=1)
+
+    def run():
+        previous, db_config._pool = db_config._pool, pool
+        try:
+            return AirportRepository.load_table(country=None)
+        finally:
+            db_config._pool = previous
+
+    return run
+
+
+def _records(airports: AirportTable):
+    """Repository source records for a synthetic table (all small airports)."""
+    return [
+        (icao, name, country, "small_airport", lat, lon)
+        for icao, name, country, lat, lon in zip(
+            airports.icao, airports.name, airports.country,
+            airports.lat.tolist(), airports.lon.tolist(),
+        )
+    ]
+
+
+@register_benchmark("sqlite_load_table")
+def bench_sqlite_load_table(airports: AirportTable) -> Callable[[], Any]:
+    """`SQLiteAirportRepository.load_table` from an in-memory SQLite database."""
+    repo = SQLiteAirportRepository(":memory:")
+    repo.import_records(_records(airports))
+    return lambda: repo.load_table(country=None)
+
+
+@register_benchmark("sqlite_bbox")
+def bench_sqlite_bbox(airports: AirportTable) -> Callable[[], Any]:
+    """R*Tree bounding-box query covering southern Finland."""
+    repo = SQLiteAirportRepository(":memory:")
+    repo.import_records(_records(airports))
+    return lambda: repo.within_bbox(59.5, 21.0, 62.0, 28.0)
+
+
+@register_benchmark("memory_load_table")
+def bench_memory_load_table(airports: AirportTable) -> Callable[[], Any]:
+    """`InMemoryAirportRepository.load_table`."""
+    repo = InMemoryAirportRepository(_records(airports))
+    return lambda: repo.load_table(country=None)
+
+
+@register_benchmark("snapshot_load")
+def bench_snapshot_load(airports: AirportTable) -> Callable[[], Any]:
+    """Load (and checksum) the on-disk airport snapshot."""
+    # Removed when the returned callable (which holds it) is dropped.
+    root = tempfile.TemporaryDirectory(prefix="flightgame-bench-")
+    save_snapshot(airports, None, directory=root.name)
+    return lambda: load_snapshot(None, directory=root.name)
+
+
+# Runner
+# ------------------------------------------------------------------------- #
+def run_suite(
+    names: Optional[Iterable[str]] = None,
+    generators: Iterable[str] = ("finland",),
+    sizes: Iterable[int] = (100, 1000, 10000),
+    min_time: float = 0.2,
+    log: Callable[[str], None] = lambda line: None,
+) -> Dict[str, Any]:
+    """
+    Run benchmarks over every generator and size.
+
+    Args:
+        names (Optional[Iterable[str]]): Benchmarks to run (default: all).
+        generators (Iterable[str]): Synthetic airport generators to use.
+        sizes (Iterable[int]): Airport counts.
+        min_time (float): Seconds spent timing each case.
+        log (Callable[[str], None]): Progress sink, called once per finished case.
+
+    Returns:
+        Dict[str, Any]: `{"meta": {...}, "results": {case: timings}}` where a
+        case is `"<benchmark>/<generator>/<size>"`.
+    """
+    selected = [BENCHMARKS[n] for n in (names or BENCHMARKS)]
+    results: Dict[str, Dict[str, float]] = {}
+    for gen in generators:
+        for size in sizes:
+            airports = GENERATORS[gen](size)
+            for bench in selected:
+                case = f"{bench.name}/{gen}/{size}" if bench.sized else bench.name
+                if case in results:
+                    continue
+                results[case] = measure(bench.setup(airports), min_time=min_time)
+                log(f"{case:<36} {results[case]['median_us']:>12.1f} us")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25
+) -> List[str]:
+    """
+    Return a line per case slower than the baseline median by more than `tolerance`.
+
+    Cases missing from either side are ignored.
+    """
+    regressions = []
+    for case, now in current["results"].items():
+        then = baseline.get("results", {}).get(case)
+        if not then:
+            continue
+        ratio = now["median_us"] / then["median_us"]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{case}: {then['median_us']:.1f} us -> {now['median_us']:.1f} us ({ratio:.2f}x)"
+            )
+    return regressions
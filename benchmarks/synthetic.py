@@ -0,0 +1,89 @@
+"""
+benchmarks/synthetic.py
+=======================
+Synthetic airport sets for benchmarks, so they run without MariaDB.
+
+Every generator returns an `AirportTable` whose first row is the game's
+start airport (EFHK), followed by `n - 1` generated airports.
+"""
+
+from typing import Callable, Dict, List, Tuple
+import numpy as np
+from game.core.entities.airport_table import AirportTable
+
+START = ("EFHK", "Helsinki Vantaa Airport", "FI", 60.3172, 24.963301)
+
+# Rough outline of Finland (lat, lon), clockwise from the south-west coast.
+FINLAND_OUTLINE: List[Tuple[float, float]] = [
+    (59.8, 22.9), (60.4, 21.3), (61.5, 21.4), (62.6, 21.0), (63.5, 22.3),
+    (64.6, 24.4), (65.8, 24.1), (67.9, 23.5), (68.6, 21.0), (69.1, 20.6),
+    (69.1, 22.3), (70.1, 27.9), (69.7, 29.3), (68.9, 28.7), (68.1, 30.0),
+    (66.8, 29.1), (65.1, 29.8), (63.8, 30.5), (62.9, 31.5), (61.2, 29.5),
+    (60.5, 27.7),
+]
+
+
+def _table(lat: np.ndarray, lon: np.ndarray, country: str) -> AirportTable:
+    n = len(lat)
+    return AirportTable(
+        [START[0]] + [f"SY{i:06d}" for i in range(n)],
+        [START[1]] + [f"Synthetic Field {i}" for i in range(n)],
+        [START[2]] + [country] * n,
+        np.concatenate(([START[3]], lat)),
+        np.concatenate(([START[4]], lon)),
+    )
+
+
+def uniform(n: int, seed: int = 0) -> AirportTable:
+    """Airports spread uniformly over the whole globe (area-uniform)."""
+    rng = np.random.default_rng(seed)
+    lat = np.degrees(np.arcsin(rng.uniform(-0.97, 0.97, n - 1)))
+    lon = rng.uniform(-180.0, 180.0, n - 1)
+    return _table(lat, lon, "ZZ")
+
+
+def clustered(n: int, seed: int = 0, clusters: int = 40) -> AirportTable:
+    """Airports in Gaussian clusters around random hubs (dense regions, empty oceans)."""
+    rng = np.random.default_rng(seed)
+    hub_lat = rng.uniform(-50.0, 65.0, clusters)
+    hub_lon = rng.uniform(-170.0, 170.0, clusters)
+    pick = rng.integers(0, clusters, n - 1)
+    lat = np.clip(hub_lat[pick] + rng.normal(0.0, 2.5, n - 1), -85.0, 85.0)
+    lon = (hub_lon[pick] + rng.normal(0.0, 4.0, n - 1) + 180.0) % 360.0 - 180.0
+    return _table(lat, lon, "ZZ")
+
+
+def _inside(lat: np.ndarray, lon: np.ndarray, poly: List[Tuple[float, float]]) -> np.ndarray:
+    """Even-odd point-in-polygon test in lat/lon space."""
+    inside = np.zeros(len(lat), dtype=bool)
+    for (la1, lo1), (la2, lo2) in zip(poly, poly[1:] + poly[:1]):
+        crosses = (la1 > lat) != (la2 > lat)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            at_lon = lo1 + (lat - la1) * (lo2 - lo1) / (la2 - la1)
+        inside ^= crosses & (lon < at_lon)
+    return inside
+
+
+def finland(n: int, seed: int = 0) -> AirportTable:
+    """Airports inside a rough outline of Finland, denser in the south."""
+    rng = np.random.default_rng(seed)
+    lat_parts, lon_parts, have = [], [], 0
+    while have < n - 1:
+        batch = 4 * (n - 1 - have) + 64
+        # Squared uniform biases samples towards the southern coast.
+        lat = 59.7 + 10.5 * rng.uniform(0.0, 1.0, batch) ** 1.6
+        lon = rng.uniform(20.5, 31.6, batch)
+        keep = _inside(lat, lon, FINLAND_OUTLINE)
+        lat_parts.append(lat[keep])
+        lon_parts.append(lon[keep])
+        have += int(keep.sum())
+    lat = np.concatenate(lat_parts)[: n - 1]
+    lon = np.concatenate(lon_parts)[: n - 1]
+    return _table(lat, lon, "FI")
+
+
+GENERATORS: Dict[str, Callable[..., AirportTable]] = {
+    "uniform": uniform,
+    "clustered": clustered,
+    "finland": finland,
+}
@@ -2,9 +2,56 @@
 cli/__main__.py
 ===============
 Entry point for running the Flight Game CLI.
+
+Without arguments the interactive game starts. `--script FILE` (or `-` for
+stdin) plays commands non-interactively, see `game.cli.script`.
 """
 
+import argparse
+import sys
 from game.cli.main import main
+from game.core.game import Game
+from game.core.world import World
+from game.replay.journal import open_journal
+from game.utils import colors
+from .script import run_script
+
+
+def cli() -> None:
+    """Parse arguments and run the interactive game or a script."""
+    parser = argparse.ArgumentParser(prog="python -m game.cli")
+    parser.add_argument(
+        "--script", metavar="FILE", help="read commands from FILE ('-' for stdin), no prompts"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="script mode: one JSON record per turn"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed quests and events")
+    parser.add_argument("--color", action="store_true", help="script mode: keep ANSI colors")
+    parser.add_argument(
+        "--country", default=Game.COUNTRY, help="ISO country code, 'world' for all"
+    )
+    args = parser.parse_args()
+
+    if not args.script:
+        main()
+        return
+
+    colors.ENABLE_COLOR = args.color
+    world = World.load(None if args.country == "world" else args.country)
+    game = Game(world=world, seed=args.seed)
+    open_journal(game)
+    game.start()
+    source = sys.stdin if args.script == "-" else open(args.script, encoding="utf-8")
+    try:
+        run_script(game, source, sys.stdout, as_json=args.json)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        game.exit_game()
+        if game.journal is not None:
+            game.journal.close()
+
 
 if __name__ == "__main__":
-    main()
+    cli()
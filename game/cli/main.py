@@ -7,24 +7,19 @@ Handles:
 - Main menu
 - Game loop
 - Option display with distance deltas
-- Colorized CLI output
+- Colorized CLI output, drawn as one frame per turn (see `Screen`)
 - Command input handling
 """
 
 from game.core.game import Game
-from geopy.distance import geodesic
 from game.core.input.input_handler import handle_input
-from .renderer import Renderer
+from game.replay.journal import open_journal
+from .renderer import Renderer, Screen
 from game.utils.colors import ok, warn, err, info, dim, bold
-from typing import Optional
+from typing import List, Optional
 import sys
 
 
-def _clear_console(renderer):
-    """Clear the console using renderer escape codes."""
-    print(renderer.clear_console(), end="")
-
-
 def _main_menu():
     """Display the main menu and return the chosen action."""
     print()
@@ -98,7 +93,9 @@ def _colorize_line(
 def main():
     """Run the flight game main menu and main loop."""
     renderer = Renderer()
+    screen = Screen()
     game = Game()
+    open_journal(game)
     game.start()
 
     # Call main menu before main loop
@@ -106,52 +103,34 @@ def main():
 
     # Outer loop allows returning to a minimal game-over prompt
     while True:
-        # Main loop
+        # Output of the last command, shown under the command list so the
+        # lines above stay put (and are not redrawn) between turns.
+        messages: List[str] = []
+        screen.invalidate()
+
+        # Main loop: one frame per turn, redrawn where it changed.
         while game.is_running():
             if game.state is None:
                 raise ValueError("Game state is None. Call g.start() first.")
 
-            input(renderer.prompt_continue())
-            _clear_console(renderer)
-            # Status only for renderer.
-            st = game.status()
-            print(renderer.draw_game_status(st))
-
-            active_quest = game.state.active_quest
+            # One snapshot of status and options per turn, shared with the commands.
+            ctx = game.turn_context()
+            screen.add(renderer.draw_game_status(ctx.status))
 
             if game.state.system_msg:
-                print(warn(game.state.system_msg))
+                screen.add(warn(game.state.system_msg))
                 game.state.system_msg = ""
 
-            opts = game.options()
-
-            target_airport = game.get_target_airport() if active_quest else None
-            cur_to_target_km = game.remaining_distance_to_target() if active_quest else None
-
-            delta_list = []
-            best_idx = None
-            best_delta = None
-
-            # 1. Calculate best delta for coloring.
-            for i, (a, d) in enumerate(opts, start=1):
-                delta = None
-                if target_airport and cur_to_target_km is not None:
-                    dist_next = geodesic(
-                        (a.lat, a.lon), (target_airport.lat, target_airport.lon)
-                    ).km
-                    delta = cur_to_target_km - int(round(dist_next))
-                    if best_delta is None or delta > best_delta:
-                        best_delta = delta
-                        best_idx = i
-                delta_list.append(delta)
-
-            name_column_width = max(len(a.name + a.icao) for a, _ in opts) + 3
-            distance_column_width = max(len(f"{int(round(d))}") for _, d in opts)
-
-            # 2. Print options and colorize.
-            for i, ((a, d), delta) in enumerate(zip(opts, delta_list), start=1):
+            opts = ctx.options
+
+            name_column_width = max(len(o.airport.name + o.airport.icao) for o in opts) + 3
+            distance_column_width = max(len(f"{int(round(o.leg_km))}") for o in opts)
+
+            # Options, colorized.
+            for o in opts:
+                a, delta = o.airport, o.delta_km
                 name_and_icao = f"{a.name} ({a.icao})"
-                line = f"{i:2}. {name_and_icao:<{name_column_width}}  —  ~{d:>{distance_column_width}.0f} km"
+                line = f"{o.number:2}. {name_and_icao:<{name_column_width}}  —  ~{o.leg_km:>{distance_column_width}.0f} km"
 
                 mark = ""
                 if delta is not None:
@@ -161,33 +140,35 @@ def main():
                         else ("+" if delta >= 5 else ("-" if delta < 0 else "."))
                     )
                 line += f"  → Δdist: {delta:+4d} km  {mark}"
-                is_best = best_idx == i
 
-                print(_colorize_line(line, delta, is_best, target_airport == a))
+                screen.add(_colorize_line(line, delta, o.is_best, o.is_target))
 
-            if best_idx is not None and best_delta is not None and best_delta > 0:
-                best_airport = opts[best_idx - 1][0]
-                print(
+            best = ctx.best
+            if best is not None and best.delta_km > 0:
+                screen.add(
                     ok(
-                        f"\nRecommended next hop: {best_idx}) {best_airport.icao} — cuts {best_delta} km\n"
+                        f"\nRecommended next hop: {best.number}) {best.airport.icao} — cuts {best.delta_km} km\n"
                     )
                 )
 
-            print(renderer.draw_command_list(len(opts)))
+            screen.add(renderer.draw_command_list(len(opts)), *messages)
+            screen.flush(prompt="> ")
 
             # Command pattern implementation
-            raw = input("> ").strip()
-            _clear_console(renderer)
-            result = handle_input(game, raw)
-            for msg in result.messages:
-                print(msg)
+            raw = input().strip()
+            messages = handle_input(game, raw).messages
 
-        # When the game stops (e.g., out of fuel), show a minimal game-over prompt
+        # Last command output (e.g. the final hop), then the game-over prompt
+        if messages:
+            screen.add(*messages)
+            screen.flush()
         action = _game_over_prompt(game)
         if action == "retry":
             game.start()   # new game
             continue
 
         # action == "exit"
+        if game.journal is not None:
+            game.journal.close()
         print()
         sys.exit(0)
@@ -4,16 +4,140 @@ cli/renderer.py
 Handles drawing CLI elements for the flight game.
 
 Includes map rendering, game status, command list, and console utilities.
+The airport layer of the map is binned once per airport set with NumPy and
+cached; each draw only overlays the player and the target.
+`Screen` composes a whole frame in memory and redraws only the terminal
+lines that changed since the previous frame, in a single write.
 """
 
-from typing import List
-from game.utils.math_helpers import clamp, scale_to_index, normalize
-from game.utils.colors import dim, bold, info, warn
+import shutil
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict, List, Optional, TextIO, Tuple
+import numpy as np
+from game.core.entities.airport_table import AirportTable
+from game.utils import colors
+from game.utils.colors import dim, bold, info, warn, err
 from math import ceil
 
-# Finland min max coordinates for the map scaling
-MIN_LAT, MAX_LAT = 59.0, 70.0
-MIN_LON, MAX_LON = 20.0, 32.0
+CLEAR_SCREEN = "\033[H\033[J"
+# Map cells by airport count, sparse to dense (log scale up to the densest cell).
+DENSITY_GLYPHS = ".:*#"
+# Degrees added around the dataset bounds so edge airports are not on the frame.
+MAP_PADDING_DEG = 0.25
+# Styles of the map glyphs; other characters are drawn unstyled.
+MAP_STYLES = {
+    ".": dim,
+    ":": dim,
+    "*": dim,
+    "#": bold,
+    "@": lambda s: bold(info(s)),
+    "X": lambda s: bold(err(s)),
+}
+_MAP_LAYER_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=1024)
+def _styled_run(glyph: str, count: int, enable_color: bool) -> str:
+    """
+    Return `count` copies of a map glyph wrapped in one style span (cached).
+
+    `enable_color` only keys the cache, since the styles depend on it.
+    """
+    style = MAP_STYLES.get(glyph)
+    return style(glyph * count) if style else glyph * count
+
+
+def _style_row(row: str) -> str:
+    """Color one map row, one style span per run of equal glyphs."""
+    enable = colors.ENABLE_COLOR
+    return "".join(_styled_run(ch, len(list(run)), enable) for ch, run in groupby(row))
+
+
+class MapLayer:
+    """Static airport layer of the map: density glyphs binned over the dataset bounds."""
+
+    def __init__(self, airports: AirportTable, width: int, height: int) -> None:
+        """
+        Bin all airports into a `width` x `height` grid.
+
+        Args:
+            airports (AirportTable): Airports to draw.
+            width (int): Map columns.
+            height (int): Map rows.
+        """
+        self.width, self.height = width, height
+        if len(airports):
+            lat_lo, lat_hi = float(airports.lat.min()), float(airports.lat.max())
+            lon_lo, lon_hi = float(airports.lon.min()), float(airports.lon.max())
+        else:
+            lat_lo = lat_hi = lon_lo = lon_hi = 0.0
+        self.min_lat, self.max_lat = lat_lo - MAP_PADDING_DEG, lat_hi + MAP_PADDING_DEG
+        self.min_lon, self.max_lon = lon_lo - MAP_PADDING_DEG, lon_hi + MAP_PADDING_DEG
+
+        x, y = self.cells(airports.lat, airports.lon)
+        counts = np.bincount(y * width + x, minlength=width * height)
+        self.counts = counts.reshape(height, width)
+        self.rows: List[str] = ["".join(row) for row in self._glyphs(self.counts).tolist()]
+        self._styled: Dict[bool, List[str]] = {}
+
+    @staticmethod
+    def _glyphs(counts: np.ndarray) -> np.ndarray:
+        """Map airport counts to density glyphs (blank for empty cells)."""
+        glyphs = np.array([" ", *DENSITY_GLYPHS])
+        top = int(counts.max()) if counts.size else 0
+        if top <= 1:
+            return glyphs[np.minimum(counts, 1)]
+        with np.errstate(divide="ignore"):
+            scaled = np.log(np.maximum(counts, 1)) / np.log(top)
+        levels = 1 + np.floor(scaled * (len(DENSITY_GLYPHS) - 1) + 1e-9).astype(np.int64)
+        return glyphs[np.where(counts > 0, levels, 0)]
+
+    def cells(self, lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert latitudes/longitudes (arrays) to column and row indices."""
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        x_ratio = (lon - self.min_lon) / (self.max_lon - self.min_lon)
+        y_ratio = 1 - (lat - self.min_lat) / (self.max_lat - self.min_lat)  # north on top
+        x = np.clip(np.rint(x_ratio * (self.width - 1)), 0, self.width - 1)
+        y = np.clip(np.rint(y_ratio * (self.height - 1)), 0, self.height - 1)
+        return x.astype(np.int64), y.astype(np.int64)
+
+    def cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        """Column and row of one coordinate."""
+        x, y = self.cells(lat, lon)
+        return int(x), int(y)
+
+    def styled_rows(self) -> List[str]:
+        """Colored airport rows, cached per color setting."""
+        enable = colors.ENABLE_COLOR
+        rows = self._styled.get(enable)
+        if rows is None:
+            rows = self._styled[enable] = [_style_row(row) for row in self.rows]
+        return rows
+
+
+_layers: "OrderedDict[Tuple[str, int, int], MapLayer]" = OrderedDict()
+_layers_lock = threading.Lock()
+
+
+def get_map_layer(airports: AirportTable, width: int, height: int) -> MapLayer:
+    """Return the cached `MapLayer` of an airport set, building it on first use."""
+    key = (airports.fingerprint(), width, height)
+    with _layers_lock:
+        layer = _layers.get(key)
+        if layer is not None:
+            _layers.move_to_end(key)
+            return layer
+    layer = MapLayer(airports, width, height)
+    with _layers_lock:
+        _layers[key] = layer
+        while len(_layers) > _MAP_LAYER_CACHE_SIZE:
+            _layers.popitem(last=False)
+    return layer
 
 
 # Try to return strings with renderer methods instead of directly printing.
@@ -27,40 +151,29 @@ class Renderer:
         self.map_height = 30
         self.first_loop = True
 
-    def _to_grid(self, lat: float, lon: float) -> tuple[int, int]:
-        """Convert latitude/longitude to grid coordinates."""
-        # Horizontal.
-        x_ratio = normalize(lon, MIN_LON, MAX_LON)
-        x = scale_to_index(x_ratio, self.map_width)  # Map to column number.
-        x = clamp(x, 0, self.map_width - 1)
-        # Vertical.
-        y_ratio = normalize(lat, MIN_LAT, MAX_LAT)
-        y_ratio = 1 - y_ratio  # Flip y to make north top row.
-        y = scale_to_index(y_ratio, self.map_height)  # Map to row number.
-        y = clamp(y, 0, self.map_height - 1)
-
-        return x, y
-
-    def draw_map(self, current, target, airports: List) -> str:
-        """Return a string representing the map with current, target, and airports."""
-        map_grid = [[" "] * self.map_width for _ in range(self.map_height)]
-
-        # Place airports in grid.
-        for airport in airports:
-            x, y = self._to_grid(airport.lat, airport.lon)
-            map_grid[y][x] = "*"
-
-        # Mark player's current airport.
-        x, y = self._to_grid(current.lat, current.lon)
-        map_grid[y][x] = "@"
+    def _overlay(self, current, target, airports: AirportTable, styled: bool) -> str:
+        """Draw the cached airport layer with the player and target marked."""
+        layer = get_map_layer(airports, self.map_width, self.map_height)
+        rows = list(layer.styled_rows() if styled else layer.rows)
+        plain: Dict[int, str] = {}
+        # Target last so it stays visible when the player shares its cell.
+        for ap, mark in ((current, "@"), (target, "X")):
+            if ap is None:
+                continue
+            x, y = layer.cell(ap.lat, ap.lon)
+            row = plain.get(y, layer.rows[y])
+            plain[y] = row[:x] + mark + row[x + 1 :]
+        for y, row in plain.items():
+            rows[y] = _style_row(row) if styled else row
+        return "\n".join(rows)
 
-        # Mark current quest target airport.
-        x, y = self._to_grid(target.lat, target.lon)
-        map_grid[y][x] = "X"
-
-        # TODO: Mark 5 nearest airports with &
+    def draw_map(self, current, target, airports: AirportTable) -> str:
+        """Return a string representing the map with current, target, and airports."""
+        return self._overlay(current, target, airports, styled=False)
 
-        return "\n".join("".join(row) for row in map_grid)
+    def draw_map_styled(self, current, target, airports: AirportTable) -> str:
+        """Return `draw_map` with colored glyphs, one style span per run of equal glyphs."""
+        return self._overlay(current, target, airports, styled=True)
 
     def _fuel_progress_bar(self, current: int, max: int = 100) -> str:
         bar_symbols = ("⬜", "🟩", "🟨", "🟥")
@@ -110,8 +223,80 @@ class Renderer:
 
     def clear_console(self) -> str:
         """Return escape codes to clear the console."""
-        return "\033[H\033[J"
+        return CLEAR_SCREEN
 
     def prompt_continue(self) -> str:
         """Return the prompt string for pausing the CLI."""
         return "Press Enter to Continue..."
+
+
+class Screen:
+    """
+    Frame buffer for the terminal.
+
+    Lines of a frame are collected with `add` and written by `flush`. On a
+    terminal only lines that differ from the previous frame are rewritten
+    (cursor-addressed), and everything below the frame is cleared; the
+    whole update goes out in one write. Frames taller than the terminal
+    are redrawn in full since the terminal scrolls them.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Create an empty screen.
+
+        Args:
+            stream (Optional[TextIO]): Output stream (default: sys.stdout).
+        """
+        self.stream = stream or sys.stdout
+        self._frame: List[str] = []
+        # Lines currently on the terminal; None when unknown (full redraw).
+        self._shown: Optional[List[str]] = None
+        self.bytes_written = 0
+
+    def add(self, *blocks: str) -> None:
+        """Append text blocks (possibly multi-line) to the pending frame."""
+        for block in blocks:
+            self._frame.extend(block.split("\n"))
+
+    def invalidate(self) -> None:
+        """Forget the terminal contents, e.g. after printing outside the screen."""
+        self._shown = None
+
+    def render(self, prompt: str = "", interactive: Optional[bool] = None) -> str:
+        """
+        Return the output updating the terminal to the pending frame and start a new one.
+
+        Args:
+            prompt (str): Text placed after the frame (e.g. an input prompt).
+            interactive (Optional[bool]): Use cursor addressing (default: stream is a tty).
+        """
+        lines, self._frame = self._frame, []
+        if interactive is None:
+            isatty = getattr(self.stream, "isatty", None)
+            interactive = bool(isatty and isatty())
+        if not interactive:
+            return "\n".join(lines) + "\n" + prompt
+
+        # Room for the prompt line and the newline of the answer, or the terminal scrolls.
+        fits = len(lines) + 2 <= shutil.get_terminal_size().lines
+        if self._shown is None or not fits:
+            self._shown = lines if fits else None
+            return CLEAR_SCREEN + "\n".join(lines) + "\n" + prompt
+
+        shown, self._shown = self._shown, lines
+        parts = [
+            f"\033[{row};1H{line}\033[K"
+            for row, line in enumerate(lines, start=1)
+            if row > len(shown) or shown[row - 1] != line
+        ]
+        # Clear leftovers of a longer frame and the echoed input below the frame.
+        parts.append(f"\033[{len(lines) + 1};1H\033[J{prompt}")
+        return "".join(parts)
+
+    def flush(self, prompt: str = "") -> None:
+        """Write the pending frame (see `render`) in a single write."""
+        out = self.render(prompt)
+        self.stream.write(out)
+        self.stream.flush()
+        self.bytes_written += len(out.encode("utf-8"))
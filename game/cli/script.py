@@ -0,0 +1,123 @@
+"""
+cli/script.py
+=============
+Non-interactive (script) mode of the CLI.
+
+Feeds commands from a file or stdin through the same command layer as the
+interactive loop, without menus, prompts, screen clears or colors, and
+writes one record per command: a compact text line or a JSON object.
+Blank lines and lines starting with `#` are skipped. The run stops when
+the game ends (out of fuel or `exit`); a final record summarizes it.
+
+Example::
+
+    printf 'fly 2\\nquests\\n3\\n' | python -m game.cli --script - --seed 7 --json
+"""
+
+from __future__ import annotations
+import json
+import time
+from typing import Any, Dict, Iterable, List, TextIO
+from game.core.game import Game
+from game.core.input.input_handler import handle_input
+
+
+def _message_lines(messages: Iterable[str]) -> List[str]:
+    """Split command messages into non-empty, stripped lines."""
+    return [line.strip() for msg in messages for line in msg.split("\n") if line.strip()]
+
+
+def turn_record(
+    game: Game, turn: int, raw: str, status: str, messages: List[str]
+) -> Dict[str, Any]:
+    """Describe the game after one scripted command."""
+    s = game.status()
+    return {
+        "turn": turn,
+        "input": raw,
+        "status": status,
+        "icao": s["icao"],
+        "fuel": round(s["fuel"], 1),
+        "hops": s["hops"],
+        "km_total": s["km_total"],
+        "points": s["points"],
+        "quest_target": s["quest_target"],
+        "quest_distance": s["quest_distance"],
+        "running": game.is_running(),
+        "messages": messages,
+    }
+
+
+def format_record(rec: Dict[str, Any]) -> str:
+    """Render a turn record as one compact text line."""
+    quest = (
+        f"{rec['quest_target']}/{rec['quest_distance']}km" if rec["quest_target"] else "-"
+    )
+    line = (
+        f"{rec['turn']:>4} {json.dumps(rec['input'])} {rec['status']} @{rec['icao']}"
+        f" fuel={rec['fuel']:.1f} hops={rec['hops']} km={rec['km_total']}"
+        f" pts={rec['points']} quest={quest}"
+    )
+    if rec["messages"]:
+        line += " | " + " | ".join(rec["messages"])
+    return line
+
+
+def run_script(
+    game: Game, lines: Iterable[str], out: TextIO, as_json: bool = False
+) -> Dict[str, Any]:
+    """
+    Play scripted commands against a started game.
+
+    Args:
+        game (Game): Started game.
+        lines (Iterable[str]): Input lines, one command each.
+        out (TextIO): Stream receiving one record per command and a summary.
+        as_json (bool): Write JSON objects instead of text lines.
+
+    Returns:
+        Dict[str, Any]: The summary record.
+    """
+    t0 = time.perf_counter()
+    turns = errors = 0
+    for line in lines:
+        raw = line.strip()
+        if not raw or raw.startswith("#"):
+            continue
+        if not game.is_running():
+            break
+        turns += 1
+        result = handle_input(game, raw)
+        messages = _message_lines(result.messages)
+        if game.state and game.state.system_msg:
+            messages.extend(_message_lines([game.state.system_msg]))
+            game.state.system_msg = ""
+        status = result.status.value
+        errors += status != "ok"
+        rec = turn_record(game, turns, raw, status, messages)
+        out.write((json.dumps(rec) if as_json else format_record(rec)) + "\n")
+
+    seconds = time.perf_counter() - t0
+    s = game.status()
+    summary: Dict[str, Any] = {
+        "end": True,
+        "turns": turns,
+        "errors": errors,
+        "points": s["points"],
+        "hops": s["hops"],
+        "km_total": s["km_total"],
+        "running": game.is_running(),
+        "seconds": round(seconds, 6),
+    }
+    if as_json:
+        out.write(json.dumps(summary) + "\n")
+    else:
+        rate = turns / seconds if seconds > 0 else 0.0
+        out.write(
+            f"end turns={turns} errors={errors} pts={s['points']} hops={s['hops']}"
+            f" km={s['km_total']} running={game.is_running()}"
+            f" seconds={seconds:.3f} ({rate:.0f} turns/s)\n"
+        )
+    out.flush()
+    return summary
+
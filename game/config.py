@@ -9,6 +9,34 @@ Environment variables:
     DB_HOST: Database host address (default: 127.0.0.1).
     DB_PORT: Database port number (default: 3306).
     DB_NAME: Database name (default: flight_game).
+    DB_BACKEND: Airport store, "mariadb", "sqlite" or "memory" (default: mariadb).
+    SQLITE_PATH: Database file of the sqlite backend (default: .cache/airports.sqlite3).
+    AIRPORTS_CSV: OurAirports-style airports.csv loaded by the memory backend and
+        imported into an empty sqlite database (default: unset).
+    DB_POOL_SIZE: Maximum open database connections per process (default: 4).
+    DB_POOL_TIMEOUT: Seconds to wait for a free pooled connection (default: 10).
+    SNAPSHOT_DIR: Directory for airport table snapshots, empty disables (default: .cache/airports).
+    SNAPSHOT_VALIDATE: Check snapshot row count against the database (one COUNT(*)) on
+        load, 0 trusts snapshots as they are (default: 1).
+    ROUTE_PLANNER: Planner for the ideal quest route, "rule", "optimal" or "weather"
+        (optimal under the expected weather) (default: rule).
+    ROUTE_CACHE_SIZE: Planned routes memoized in memory per process (default: 4096).
+    ROUTE_CACHE_PATH: SQLite file keeping planned routes across restarts, empty disables (default: empty).
+    ROUTE_TABLE_DIR: Directory of precomputed all-pairs route tables, used when a table
+        matches the game's settings, empty disables (default: .cache/routes, see game.routes).
+    QUEST_DIFFICULTY: Quest targets drawn from the route table's difficulty buckets, e.g.
+        "medium" or "hard,300-600km,3-5hops"; games fail to start without a matching
+        "rule" or "optimal" table; empty picks any airport (default: empty, see
+        game.core.planning.quest_index).
+    JOURNAL_DIR: Directory receiving a replay journal per played game, empty disables
+        (default: empty, see game.replay).
+    SESSION_DIR: Directory where the game server parks idle sessions as snapshots, empty
+        disconnects them instead (default: empty, see game.core.state.snapshot).
+    WEATHER_MODEL: Weather of a hop, "field" (drifting weather systems sampled along the
+        leg) or "random" (uniform per hop) (default: field, see game.core.events.weather_field).
+    WEATHER_CELL_DEG: Cell size of the weather grid in degrees (default: 1.0).
+    DISTANCE_TIER: Distance formula, "haversine", "ellipsoidal", "vincenty" or "geodesic"
+        (default: vincenty, see game.utils.distance).
 """
 
 from dotenv import load_dotenv
@@ -21,3 +49,21 @@ DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
 DB_PORT = os.getenv("DB_PORT", 3306)
 DB_NAME = os.getenv("DB_NAME", "flight_game")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE") or 4)
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT") or 10.0)
+DB_BACKEND = os.getenv("DB_BACKEND") or "mariadb"
+SQLITE_PATH = os.getenv("SQLITE_PATH") or ".cache/airports.sqlite3"
+AIRPORTS_CSV = os.getenv("AIRPORTS_CSV") or ""
+
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", ".cache/airports")
+SNAPSHOT_VALIDATE = os.getenv("SNAPSHOT_VALIDATE", "1") != "0"
+ROUTE_PLANNER = os.getenv("ROUTE_PLANNER") or "rule"
+ROUTE_CACHE_SIZE = int(os.getenv("ROUTE_CACHE_SIZE") or 4096)
+ROUTE_CACHE_PATH = os.getenv("ROUTE_CACHE_PATH") or ""
+ROUTE_TABLE_DIR = os.getenv("ROUTE_TABLE_DIR", ".cache/routes")
+QUEST_DIFFICULTY = os.getenv("QUEST_DIFFICULTY") or ""
+DISTANCE_TIER = os.getenv("DISTANCE_TIER") or "vincenty"
+JOURNAL_DIR = os.getenv("JOURNAL_DIR") or ""
+SESSION_DIR = os.getenv("SESSION_DIR") or ""
+WEATHER_MODEL = os.getenv("WEATHER_MODEL") or "field"
+WEATHER_CELL_DEG = float(os.getenv("WEATHER_CELL_DEG") or 1.0)
@@ -6,25 +6,42 @@ Implements the notorius game programming command pattern.
 Defines the abstract Command interface and concrete game commands.
 (Fly, Map, QuestLog, Refresh, Exit).
 Includes a registry of commands and utilities for matching user input and executing commands.
+Registration compiles a dispatch table (names, aliases and unambiguous
+prefixes -> shared command instances), so resolving an input line is a
+couple of dict lookups.
 """
 
+import shlex
 from abc import ABC, abstractmethod
 from .result import CommandResult, CommandStatus
 from game.cli.renderer import Renderer
-from game.utils.colors import info, warn, err, bold, dim
+from game.utils.colors import ok, info, warn, err, bold, dim
 from typing import Optional
 
 
 class Command(ABC):
-    """Abstract base class for game commands."""
+    """
+    Abstract base class for game commands.
+
+    Commands are stateless: `register_command` creates one shared instance
+    per class, which handles every input that resolves to it.
+    """
 
     name: str
 
     aliases: tuple[str, ...] = ()
 
+    # Whether unambiguous prefixes of the name and aliases also select the command
+    # (off for commands that end the session, so a typo cannot trigger them).
+    prefixes: bool = True
+
+    def keys(self) -> tuple[str, ...]:
+        """Lowercase name and aliases the command is typed as."""
+        return (self.name.lower(), *(a.lower() for a in self.aliases))
+
     def matches(self, text: str) -> bool:
         """Check if `text` matches the command name or any aliases."""
-        return text == self.name.lower() or text in [a.lower() for a in self.aliases]
+        return COMMANDS.get(text) is self
 
     @abstractmethod
     def execute(self, game, args: str = "") -> CommandResult:
@@ -40,35 +57,91 @@ class Command(ABC):
         ...
 
 
-COMMANDS: dict[str, type[Command]] = {}
+# Dispatch tables, filled by `register_command`:
+# exact name/alias -> command, and every unambiguous prefix of those -> command.
+COMMANDS: dict[str, Command] = {}
+_PREFIXES: dict[str, Command] = {}
+_AMBIGUOUS: set[str] = set()
+# Commands with their own `matches` rule (e.g. bare numbers for fly).
+_MATCHERS: list[Command] = []
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split an input line into tokens, honouring quotes ("fly 3", 'fly "3"').
+
+    Unbalanced quotes fall back to splitting on whitespace.
+    """
+    if '"' not in text and "'" not in text:
+        return text.split()
+    try:
+        return shlex.split(text)
+    except ValueError:
+        return text.split()
+
+
+def parse_command(input_text: str) -> tuple[Optional[Command], str]:
+    """
+    Resolve an input line to its command and argument string.
+
+    The first token is looked up as a name or alias, then as an unambiguous
+    prefix of one ("ma" -> map; not for exit, which needs its exact name or
+    an alias); the remaining tokens are the arguments.
+    Otherwise a command with its own `matches` rule may claim the whole
+    line as its arguments ("3" -> fly 3).
+
+    Args:
+        input_text (str): User input text.
+
+    Returns:
+        tuple[Optional[Command], str]: Matched command (or None) and its arguments.
+    """
+    tokens = tokenize(input_text)
+    if not tokens:
+        return None, ""
+    word = tokens[0].lower()
+    cmd = COMMANDS.get(word) or _PREFIXES.get(word)
+    if cmd is not None:
+        return cmd, " ".join(tokens[1:])
+    args = " ".join(tokens)
+    for cmd in _MATCHERS:
+        if cmd.matches(args):
+            return cmd, args
+    return None, ""
 
 
 def get_command(input_text: str) -> Optional[Command]:
     """
-    Get a Command object matching the `input_text`.
+    Get the Command matching the `input_text`.
 
     Args:
         input_text (str): User input text.
 
     Returns:
-        Optional[Command]: Matched Command instance or None.
+        Optional[Command]: Matched (shared) Command instance or None.
     """
-    input_text = input_text.strip().lower()
-    cmd_cls = COMMANDS.get(input_text)
-    if cmd_cls:
-        return cmd_cls()
-    for cls in set(COMMANDS.values()):
-        cmd = cls()
-        if hasattr(cmd, "matches") and cmd.matches(input_text):
-            return cmd
-    return None
+    return parse_command(input_text)[0]
 
 
 def register_command(cls: type[Command]):
-    """Decorator to register a Command class in the COMMAND registry."""
-    COMMANDS[cls.name.lower()] = cls
-    for alias in cls.aliases:
-        COMMANDS[alias.lower()] = cls
+    """Decorator to register a Command class in the dispatch tables (one shared instance)."""
+    cmd = cls()
+    for key in cmd.keys():
+        COMMANDS[key] = cmd
+        if not cmd.prefixes:
+            continue
+        for end in range(1, len(key)):
+            prefix = key[:end]
+            if prefix in _AMBIGUOUS:
+                continue
+            other = _PREFIXES.get(prefix)
+            if other is None:
+                _PREFIXES[prefix] = cmd
+            elif other is not cmd:
+                del _PREFIXES[prefix]
+                _AMBIGUOUS.add(prefix)
+    if type(cmd).matches is not Command.matches:
+        _MATCHERS.append(cmd)
     return cls
 
 
@@ -90,8 +163,8 @@ class FlyCommand(Command):
                 CommandStatus.ERROR,
             )
         idx = int(args)
-        opts = game.options()
-        if not (1 <= idx <= len(opts)):
+        # Same options the player was shown this turn.
+        if game.turn_context().option(idx) is None:
             return CommandResult(
                 [err(f"Invalid option number. {idx}")], CommandStatus.ERROR
             )
@@ -129,14 +202,16 @@ class MapCommand(Command):
         r = Renderer()
 
         current = game.state.player.location
-        target = game.get_target_airport()
+        target = game.turn_context().target
         airports = game.get_airports()
 
-        legend = f"{dim('*')} airports {bold(info('@'))} you {bold(err('X'))} target "
-        raw_map = r.draw_map(current, target, airports)
-        palette = {"*": dim("*"), "@": bold(info("@")), "X": bold(err("X"))}
-        coloured = "".join(palette.get(ch, ch) for ch in raw_map)
-        return CommandResult([legend, coloured], CommandStatus.OK)
+        legend = (
+            f"{dim('. : *')} {bold('#')} airports (sparse to dense) "
+            f"{bold(info('@'))} you {bold(err('X'))} target "
+        )
+        return CommandResult(
+            [legend, r.draw_map_styled(current, target, airports)], CommandStatus.OK
+        )
 
 
 @register_command
@@ -159,7 +234,7 @@ class QuestLogCommand(Command):
         messages.append(info("Active:"))
         active_quest = game.state.active_quest
         if active_quest:
-            rem = game.remaining_distance_to_target()
+            rem = game.turn_context().remaining_km
             rem_txt = f"{rem} km remaining" if rem is not None else "distance unknown"
             messages.append(f"  -> Fly to {bold(active_quest.target_icao)} {dim(f'({rem_txt})')}")
         else:
@@ -200,6 +275,7 @@ class RefreshCommand(Command):
 class ExitCommand(Command):
     name = "exit"
     aliases = ("q", "quit")
+    prefixes = False
 
     def execute(self, game, args="") -> CommandResult:
         game.exit_game()
@@ -4,18 +4,25 @@ core/entities/airport.py
 Defines the Airport data structure for the game.
 
 Basic information of an airport including ICAO code, name,
-country, latitude and longitude coordinates.
+country, latitude and longitude coordinates. Airports are small
+immutable values; bulk airport data lives in `AirportTable`.
 """
 
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class Airport:
     """Represents an aiport with location and basic information."""
 
+    __slots__ = ("icao", "name", "country", "lat", "lon")
+
     icao: str
     name: str
     country: str
     lat: float
     lon: float
+
+    def __reduce__(self):
+        """Pickle by constructor arguments (frozen slotted instances can't set state)."""
+        return (Airport, (self.icao, self.name, self.country, self.lat, self.lon))
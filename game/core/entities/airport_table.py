@@ -0,0 +1,159 @@
+"""
+core/entities/airport_table.py
+==============================
+Defines the AirportTable, a columnar store for all loaded airports.
+
+Coordinates live in contiguous NumPy arrays and ICAO codes, names and
+countries in interned string columns, with a dictionary from ICAO code
+to row for constant-time lookups. `Airport` objects are only created
+when a single row is requested; slicing a table gives a smaller table.
+"""
+
+from __future__ import annotations
+import hashlib
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+import numpy as np
+from .airport import Airport
+
+# (icao, name, country, lat, lon) as returned by the airport queries.
+AirportRow = Tuple[str, str, str, float, float]
+
+
+class AirportTable:
+    """Struct-of-arrays table of airports with O(1) ICAO lookup."""
+
+    def __init__(
+        self,
+        icao: Sequence[str],
+        name: Sequence[str],
+        country: Sequence[str],
+        lat: Sequence[float],
+        lon: Sequence[float],
+    ) -> None:
+        """
+        Build a table from equally long columns.
+
+        Args:
+            icao (Sequence[str]): ICAO codes.
+            name (Sequence[str]): Airport names.
+            country (Sequence[str]): ISO country codes.
+            lat (Sequence[float]): Latitudes in degrees.
+            lon (Sequence[float]): Longitudes in degrees.
+        """
+        self.icao: List[str] = [sys.intern(s) for s in icao]
+        self.name: List[str] = list(name)
+        self.country: List[str] = [sys.intern(s) for s in country]
+        self.lat: np.ndarray = np.ascontiguousarray(lat, dtype=np.float64)
+        self.lon: np.ndarray = np.ascontiguousarray(lon, dtype=np.float64)
+        if not (
+            len(self.icao) == len(self.name) == len(self.country)
+            == len(self.lat) == len(self.lon)
+        ):
+            raise ValueError("AirportTable columns must have equal length")
+
+        self._rows: Dict[str, int] = {}
+        for row, code in enumerate(self.icao):
+            self._rows.setdefault(code, row)
+        self._fingerprint: Optional[str] = None
+
+    @classmethod
+    def from_airports(cls, airports: Iterable[Airport]) -> "AirportTable":
+        """Build a table from Airport objects, keeping their order."""
+        airports = list(airports)
+        return cls(
+            [a.icao for a in airports],
+            [a.name for a in airports],
+            [a.country for a in airports],
+            [a.lat for a in airports],
+            [a.lon for a in airports],
+        )
+
+    @classmethod
+    def from_row_batches(cls, batches: Iterable[Sequence[AirportRow]]) -> "AirportTable":
+        """
+        Build a table incrementally from batches of raw rows.
+
+        Coordinates are appended to compact `array("d")` buffers that become
+        the final NumPy columns without a copy, so peak memory stays close to
+        the finished table plus one batch.
+
+        Args:
+            batches (Iterable[Sequence[AirportRow]]): Row batches, e.g. from
+                `AirportRepository.iter_row_batches`.
+        """
+        icao: List[str] = []
+        name: List[str] = []
+        country: List[str] = []
+        lat, lon = array("d"), array("d")
+        for batch in batches:
+            for code, airport_name, iso_country, la, lo in batch:
+                icao.append(sys.intern(str(code)))
+                name.append(str(airport_name))
+                country.append(sys.intern(str(iso_country)))
+                lat.append(float(la))
+                lon.append(float(lo))
+        return cls(
+            icao,
+            name,
+            country,
+            np.frombuffer(lat, dtype=np.float64) if lat else np.empty(0),
+            np.frombuffer(lon, dtype=np.float64) if lon else np.empty(0),
+        )
+
+    def __len__(self) -> int:
+        return len(self.icao)
+
+    @overload
+    def __getitem__(self, row: int) -> Airport: ...
+
+    @overload
+    def __getitem__(self, row: slice) -> "AirportTable": ...
+
+    def __getitem__(self, row: Union[int, slice]) -> Union[Airport, "AirportTable"]:
+        """Return the airport at `row` as an Airport value, or the rows of a slice as a table."""
+        if isinstance(row, slice):
+            return AirportTable(
+                self.icao[row], self.name[row], self.country[row], self.lat[row], self.lon[row]
+            )
+        return Airport(
+            self.icao[row],
+            self.name[row],
+            self.country[row],
+            float(self.lat[row]),
+            float(self.lon[row]),
+        )
+
+    def __iter__(self) -> Iterator[Airport]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def row_of(self, icao: str) -> Optional[int]:
+        """Return the row of an ICAO code, or None if it is not loaded."""
+        return self._rows.get(icao)
+
+    def get(self, icao: str) -> Optional[Airport]:
+        """Return the airport with the given ICAO code, or None."""
+        row = self._rows.get(icao)
+        return self[row] if row is not None else None
+
+    def __contains__(self, icao: object) -> bool:
+        return icao in self._rows
+
+    def fingerprint(self) -> str:
+        """Return a stable hash of the airport set (codes and coordinates)."""
+        if self._fingerprint is None:
+            h = hashlib.sha1()
+            h.update("\0".join(self.icao).encode("utf-8"))
+            h.update(self.lat.tobytes())
+            h.update(self.lon.tobytes())
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+
+def as_table(airports: Iterable[Airport]) -> AirportTable:
+    """Return `airports` as an AirportTable, converting only when needed."""
+    if isinstance(airports, AirportTable):
+        return airports
+    return AirportTable.from_airports(airports)
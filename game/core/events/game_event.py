@@ -3,12 +3,19 @@ core/events/game_event.py
 =========================
 Defines a GameEvent interface and concrete events for weather conditions and union strikes.
 
-Includes a helper to generate random events.
+Includes helpers to generate the events of a hop: uniformly random weather,
+or the weather along the flown leg from a `WeatherField`.
 """
 
+from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import Enum
 import random
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from game.core.entities.airport import Airport
+    from .weather_field import WeatherField
 
 
 class GameEvent(ABC):
@@ -86,24 +93,46 @@ class WeatherEvent(GameEvent):
         },
     }
 
-    def __init__(self, weather_type: WeatherType) -> None:
-        """Initialize with a specific WeatherType."""
+    def __init__(
+        self,
+        weather_type: WeatherType,
+        rng: Optional[random.Random] = None,
+        fuel_modifier: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize with a specific WeatherType.
+
+        Args:
+            weather_type (WeatherType): Weather reported to the player.
+            rng (Optional[random.Random]): Source for radio chatter (default: global random).
+            fuel_modifier (Optional[float]): Fuel modifier of the leg, e.g. sampled
+                along its path (default: the fixed modifier of `weather_type`).
+        """
         self.weather_type = weather_type
+        self.rng = rng or random
+        self.fuel_modifier = (
+            self._weather_data[weather_type]["fuel_modifier"]
+            if fuel_modifier is None
+            else fuel_modifier
+        )
 
     def description(self) -> str:
         """Return a radio message and update message for a specific weather type."""
         data = self._weather_data[self.weather_type]
-        weather_update = (
-            f"{data['icon']} {self.weather_type.name.capitalize()} -> {data['effect']}"
+        effect = (
+            data["effect"]
+            if self.fuel_modifier == data["fuel_modifier"]
+            else f"{self.fuel_modifier * 100:+.1f}% fuel consumed along the route."
         )
-        return f"\nWEATHER UPDATE: {weather_update} \n[RADIO]: {random.choice(data['messages'])}"
+        weather_update = f"{data['icon']} {self.weather_type.name.capitalize()} -> {effect}"
+        return f"\nWEATHER UPDATE: {weather_update} \n[RADIO]: {self.rng.choice(data['messages'])}"
 
     def trigger(self, game):
         """Apply fuel consumption and save the event message in the game."""
         if not game.state:
             raise ValueError("Game state is None. Call g.start() first.")
 
-        mod = 1.0 + self._weather_data[self.weather_type]["fuel_modifier"]
+        mod = 1.0 + self.fuel_modifier
         if not hasattr(game, "_fuel_factor"):
             game._fuel_factor = 1.0
         game._fuel_factor *= mod
@@ -123,11 +152,41 @@ class UnionStrikeEvent(GameEvent):
         # Currently the event is just placeholder for demo. (not in use)
 
 
-def get_random_events() -> list[GameEvent]:
-    """Generate a list of random game events."""
+def get_random_events(
+    rng: Optional[random.Random] = None, flavor_rng: Optional[random.Random] = None
+) -> list[GameEvent]:
+    """
+    Generate a list of random game events.
+
+    Args:
+        rng (Optional[random.Random]): Source for the events themselves (default: global random).
+        flavor_rng (Optional[random.Random]): Source for their messages (default: `rng`).
+    """
+    rng = rng or random
     events = []
-    events.append(WeatherEvent(random.choice(list(WeatherType))))
+    events.append(WeatherEvent(rng.choice(list(WeatherType)), flavor_rng or rng))
     # Here we can add more events later..
     # if random.randint(1, 10) > 5:
     #    events.append(UnionStrikeEvent())
     return events
+
+
+def get_leg_events(
+    field: WeatherField,
+    tick: int,
+    origin: Airport,
+    dest: Airport,
+    flavor_rng: Optional[random.Random] = None,
+) -> list[GameEvent]:
+    """
+    Generate the events of a leg from the weather along its path.
+
+    Args:
+        field (WeatherField): Weather of the world.
+        tick (int): Weather tick the leg is flown at.
+        origin (Airport): Departure airport.
+        dest (Airport): Arrival airport.
+        flavor_rng (Optional[random.Random]): Source for the messages (default: global random).
+    """
+    leg = field.sample_leg(tick, origin.lat, origin.lon, dest.lat, dest.lon)
+    return [WeatherEvent(leg.weather_type, flavor_rng, leg.fuel_modifier)]
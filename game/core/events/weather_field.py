@@ -0,0 +1,408 @@
+"""
+core/events/weather_field.py
+============================
+Spatially correlated weather over a coarse lat/lon grid.
+
+Weather comes from drifting weather systems (rain or snow areas with storm
+cores) and a prevailing wind. Each system is born at some tick, drifts
+with its own velocity, swells and fades over its lifetime; everything is
+derived from the field seed and the tick, so the weather at any tick can
+be computed directly and a field is safely shared by many games (each
+game walks the timeline from its own starting tick).
+
+A frame (the grid at one tick) is rendered with NumPy in O(grid cells +
+systems) and cached; the cost does not depend on the number of airports.
+A flight leg samples the weather along its great-circle path: the fuel
+modifier of the leg is the mean modifier of the cells it crosses plus the
+head/tailwind component of the wind. Legs flown at a tick without a cached
+frame only evaluate the cells they cross (to the same values), as games
+rarely share a tick.
+
+Includes:
+    - `great_circle_points`: points along many great-circle legs at once.
+    - `WeatherFrame`: weather types and fuel modifiers of every cell at one tick.
+    - `LegWeather`: weather sampled along one flight leg.
+    - `WeatherField`: the seeded, shareable weather timeline of an airport set.
+"""
+
+from __future__ import annotations
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+import numpy as np
+from game.core.entities.airport_table import AirportTable
+from .game_event import WeatherEvent, WeatherType
+
+# Grid cell edge in degrees.
+CELL_DEG = 1.0
+# Degrees added around the airports so systems can drift in from outside.
+FIELD_PADDING_DEG = 4.0
+# Average number of active systems per square degree.
+SYSTEM_DENSITY = 1 / 120
+# Lifetime of a system in ticks (one tick per flown hop).
+SYSTEM_LIFE = (4, 20)
+# Radius (one standard deviation) of a system in degrees.
+SYSTEM_RADIUS_DEG = (1.5, 4.0)
+# Precipitation intensity where rain/snow starts and where it becomes a storm.
+PRECIP_LEVEL = 0.3
+STORM_LEVEL = 0.75
+# Fuel modifier of a full tailwind (a full headwind costs the opposite).
+WIND_MODIFIER = WeatherEvent._weather_data[WeatherType.TAILWIND]["fuel_modifier"]
+# Games start at a random tick below this, so they see different weather.
+START_TICKS = 2**20
+# Frames kept per field.
+FRAME_CACHE_SIZE = 64
+# Consecutive birth ticks whose systems are generated and cached together.
+BIRTH_BLOCK = 32
+# Blocks of births kept per field (a frame needs the last `SYSTEM_LIFE[1]` births).
+BIRTH_CACHE_BLOCKS = 8
+
+_CODES = tuple(WeatherType)
+_CELL_MODIFIER = np.array(
+    [WeatherEvent._weather_data[w]["fuel_modifier"] for w in _CODES], dtype=np.float32
+)
+_CELL_MODIFIER[WeatherType.TAILWIND.value] = 0.0  # wind is applied per leg, not per cell
+
+
+def great_circle_points(
+    lat1, lon1, lat2, lon2, samples: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evenly spaced points along great circles (endpoints included).
+
+    Args:
+        lat1, lon1, lat2, lon2: Leg endpoints in degrees (scalars or 1-D arrays).
+        samples (int): Points per leg (at least 2).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Latitudes and longitudes of
+            shape (legs, samples) and the initial bearings (radians, clockwise
+            from north) of shape (legs,).
+    """
+    p1, l1, p2, l2 = (np.atleast_1d(np.radians(v)) for v in (lat1, lon1, lat2, lon2))
+    a = np.stack((np.cos(p1) * np.cos(l1), np.cos(p1) * np.sin(l1), np.sin(p1)), axis=-1)
+    b = np.stack((np.cos(p2) * np.cos(l2), np.cos(p2) * np.sin(l2), np.sin(p2)), axis=-1)
+    omega = np.arccos(np.clip((a * b).sum(axis=-1), -1.0, 1.0))[:, None]  # (legs, 1)
+    t = np.linspace(0.0, 1.0, samples)[None, :]
+    # Spherical interpolation; (nearly) coincident endpoints interpolate linearly.
+    sin_omega = np.sin(omega)
+    arc = sin_omega > 1e-12
+    safe = np.where(arc, sin_omega, 1.0)
+    wa = np.where(arc, np.sin((1 - t) * omega) / safe, 1 - t)[..., None]
+    wb = np.where(arc, np.sin(t * omega) / safe, t)[..., None]
+    pts = wa * a[:, None, :] + wb * b[:, None, :]
+    lat = np.degrees(np.arcsin(np.clip(pts[..., 2], -1.0, 1.0)))
+    lon = np.degrees(np.arctan2(pts[..., 1], pts[..., 0]))
+    bearing = np.arctan2(
+        np.sin(l2 - l1) * np.cos(p2),
+        np.cos(p1) * np.sin(p2) - np.sin(p1) * np.cos(p2) * np.cos(l2 - l1),
+    )
+    return lat, lon, bearing
+
+
+@dataclass(frozen=True)
+class WeatherFrame:
+    """Weather of every grid cell at one tick."""
+
+    tick: int
+    # WeatherType values per cell (CLEAR, RAIN, SNOW or STORM).
+    codes: np.ndarray
+    # Fuel modifier per cell, e.g. 0.10 for a storm.
+    modifier: np.ndarray
+    # Prevailing wind: direction it blows towards (radians, clockwise from north)
+    # and strength in [0, 1].
+    wind_dir: float
+    wind_speed: float
+
+    def wind_modifier(self, bearing: float) -> float:
+        """Fuel modifier of the wind for a leg flown on `bearing` (radians)."""
+        return _wind_modifier(bearing, self.wind_dir, self.wind_speed)
+
+
+def _wind_modifier(bearing: float, wind_dir: float, wind_speed: float) -> float:
+    """Fuel modifier of a wind for a leg flown on `bearing` (radians)."""
+    return WIND_MODIFIER * wind_speed * math.cos(bearing - wind_dir)
+
+
+@dataclass(frozen=True)
+class LegWeather:
+    """Weather along one flight leg."""
+
+    weather_type: WeatherType
+    fuel_modifier: float
+
+
+class WeatherField:
+    """Seeded weather timeline over a lat/lon box, shared by the games of a world."""
+
+    def __init__(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lon: float,
+        max_lon: float,
+        seed: int,
+        cell_deg: float = CELL_DEG,
+    ) -> None:
+        """
+        Lay the grid over a lat/lon box.
+
+        Args:
+            min_lat, max_lat, min_lon, max_lon (float): Box covered by the field.
+            seed (int): Seed of the weather systems and the wind.
+            cell_deg (float): Grid cell edge in degrees.
+        """
+        self.min_lat = max(-90.0, min_lat)
+        self.min_lon = max(-180.0, min_lon)
+        self.cell_deg = cell_deg
+        self.height = max(1, math.ceil((min(90.0, max_lat) - self.min_lat) / cell_deg))
+        self.width = max(1, math.ceil((min(180.0, max_lon) - self.min_lon) / cell_deg))
+        self.seed = seed & (2**63 - 1)
+        area = self.height * self.width * cell_deg**2
+        self._spawn_rate = area * SYSTEM_DENSITY / np.mean(SYSTEM_LIFE)
+        # Cell-centre latitudes, for the snow line.
+        self._lat = self.min_lat + (np.arange(self.height) + 0.5) * cell_deg
+        rng = np.random.default_rng([self.seed, 2**32])
+        self._wind_phase = rng.uniform(0.0, 2 * math.pi, 3)
+        self._wind_base = rng.uniform(0.0, 2 * math.pi)
+        self._frames: "OrderedDict[int, WeatherFrame]" = OrderedDict()
+        self._births: "OrderedDict[int, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_airports(
+        cls, airports: AirportTable, seed: int, cell_deg: float = CELL_DEG
+    ) -> "WeatherField":
+        """Field covering an airport set (padded), or the whole globe when empty."""
+        if not len(airports):
+            return cls(-90.0, 90.0, -180.0, 180.0, seed, cell_deg)
+        pad = FIELD_PADDING_DEG
+        return cls(
+            float(airports.lat.min()) - pad,
+            float(airports.lat.max()) + pad,
+            float(airports.lon.min()) - pad,
+            float(airports.lon.max()) + pad,
+            seed,
+            cell_deg,
+        )
+
+    # Frames
+    # ------------------------------------------------------------------------- #
+    def frame(self, tick: int) -> WeatherFrame:
+        """Return the weather at `tick`, rendering it on first use."""
+        with self._lock:
+            frame = self._frames.get(tick)
+            if frame is not None:
+                self._frames.move_to_end(tick)
+                return frame
+        frame = self._render(tick)
+        with self._lock:
+            self._frames[tick] = frame
+            while len(self._frames) > FRAME_CACHE_SIZE:
+                self._frames.popitem(last=False)
+        return frame
+
+    def _systems(self, birth: int) -> np.ndarray:
+        """
+        Systems born at tick `birth`, one row each:
+        lat, lon, lat/lon drift per tick, radius, peak intensity, lifetime (degrees, ticks).
+        """
+        rng = np.random.default_rng([self.seed, birth % 2**32])
+        n = rng.poisson(self._spawn_rate)
+        systems = np.empty((n, 7))
+        systems[:, 0] = self.min_lat + rng.uniform(0.0, self.height * self.cell_deg, n)
+        systems[:, 1] = self.min_lon + rng.uniform(0.0, self.width * self.cell_deg, n)
+        systems[:, 2] = rng.normal(0.0, 0.1, n)  # fronts mostly move west to east
+        systems[:, 3] = rng.normal(0.35, 0.15, n)
+        systems[:, 4] = rng.uniform(*SYSTEM_RADIUS_DEG, n)
+        systems[:, 5] = rng.uniform(0.4, 1.3, n)
+        systems[:, 6] = rng.integers(SYSTEM_LIFE[0], SYSTEM_LIFE[1] + 1, n)
+        return systems
+
+    def _birth_block(self, first: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Systems born in the `BIRTH_BLOCK` ticks from `first` and their birth ticks (cached)."""
+        block = self._births.get(first)
+        if block is not None:
+            return block
+        births = range(first, first + BIRTH_BLOCK)
+        born = [self._systems(b) for b in births]
+        block = np.concatenate(born), np.repeat(np.array(births), [len(b) for b in born])
+        with self._lock:
+            self._births[first] = block
+            while len(self._births) > BIRTH_CACHE_BLOCKS:
+                self._births.popitem(last=False)
+        return block
+
+    def _active_systems(self, tick: int) -> np.ndarray:
+        """Centre row, column, radius (cells) and intensity of the systems alive at `tick`."""
+        first = tick - SYSTEM_LIFE[1] + 1
+        blocks = [
+            self._birth_block(b)
+            for b in range(first - first % BIRTH_BLOCK, tick + 1, BIRTH_BLOCK)
+        ]
+        systems = np.concatenate([systems for systems, _ in blocks])
+        births = np.concatenate([births for _, births in blocks])
+        keep = (births >= first) & (births <= tick)
+        systems, age = systems[keep], tick - births[keep]
+        lat, lon, dlat, dlon, radius, peak, life = systems.T
+        alive = age < life
+        # Systems swell and fade over their lifetime.
+        strength = peak * np.sin(np.pi * (age + 0.5) / life)
+        row = (lat + dlat * age - self.min_lat) / self.cell_deg - 0.5
+        col = (lon + dlon * age - self.min_lon) / self.cell_deg - 0.5
+        return np.stack([row, col, radius / self.cell_deg, strength])[:, alive]
+
+    def _windows(self, tick: int) -> Tuple[np.ndarray, ...]:
+        """
+        Systems alive at `tick` that reach the grid: centre row, column, radius,
+        intensity and the rounded centre cell of the window each one covers.
+        """
+        h, w = self.height, self.width
+        row, col, radius, strength = self._active_systems(tick)
+        k = self._window_cells()
+        r0 = np.rint(row).astype(np.int64)
+        c0 = np.rint(col).astype(np.int64)
+        near = (r0 >= -k) & (r0 < h + k) & (c0 >= -k) & (c0 < w + k)
+        return row[near], col[near], radius[near], strength[near], r0[near], c0[near]
+
+    def _window_cells(self) -> int:
+        """Half width `k` of the (2k+1)^2 window of cells a system covers."""
+        return math.ceil(3.0 * SYSTEM_RADIUS_DEG[1] / self.cell_deg)
+
+    def _render(self, tick: int) -> WeatherFrame:
+        """Rasterize the systems alive at `tick` and classify the cells."""
+        h, w = self.height, self.width
+        # Every system covers a (2k+1)^2 window of cells around its centre; they
+        # are accumulated on a grid padded by 2k, dropping systems too far away.
+        row, col, radius, strength, r0, c0 = self._windows(tick)
+        k = self._window_cells()
+        offsets = np.arange(-k, k + 1)
+        rows = r0[:, None] + offsets  # (n, 2k+1)
+        cols = c0[:, None] + offsets
+        gy = strength[:, None] * np.exp(-0.5 * ((rows - row[:, None]) / radius[:, None]) ** 2)
+        gx = np.exp(-0.5 * ((cols - col[:, None]) / radius[:, None]) ** 2)
+        pw = w + 4 * k
+        cells = (rows + 2 * k)[:, :, None] * pw + (cols + 2 * k)[:, None, :]
+        padded = np.bincount(
+            cells.ravel(),
+            weights=(gy[:, :, None] * gx[:, None, :]).ravel(),
+            minlength=(h + 4 * k) * pw,
+        ).reshape(h + 4 * k, pw)
+        intensity = padded[2 * k : 2 * k + h, 2 * k : 2 * k + w]
+        codes = self._classify(tick, intensity, self._lat[:, None])
+        return WeatherFrame(tick, codes, _CELL_MODIFIER[codes], *self._wind(tick))
+
+    def _intensity_at(self, tick: int, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """
+        Intensity of the cells `rows`, `cols` at `tick`, without a frame.
+
+        Sums the systems in the same order as `_render`, so the values match
+        the rendered frame's exactly.
+        """
+        row, col, radius, strength, r0, c0 = self._windows(tick)
+        k = self._window_cells()
+        # (system, cell) pairs in system order, like the frame's accumulation.
+        hit = (np.abs(rows[None, :] - r0[:, None]) <= k) & (
+            np.abs(cols[None, :] - c0[:, None]) <= k
+        )
+        si, ci = np.nonzero(hit)
+        gy = strength[si] * np.exp(-0.5 * ((rows[ci] - row[si]) / radius[si]) ** 2)
+        gx = np.exp(-0.5 * ((cols[ci] - col[si]) / radius[si]) ** 2)
+        return np.bincount(ci, weights=gy * gx, minlength=len(rows))
+
+    def _classify(self, tick: int, intensity: np.ndarray, cell_lat: np.ndarray) -> np.ndarray:
+        """Weather codes of cells with `intensity` at `tick` (`cell_lat`: their centres)."""
+        # The snow line moves with a slow seasonal cycle.
+        snow_lat = 62.0 + 6.0 * math.sin(2 * math.pi * tick / 240 + self._wind_phase[0])
+        precip = np.where(
+            np.abs(cell_lat) >= snow_lat,
+            np.uint8(WeatherType.SNOW.value),
+            np.uint8(WeatherType.RAIN.value),
+        )
+        codes = np.full(intensity.shape, WeatherType.CLEAR.value, dtype=np.uint8)
+        codes = np.where(intensity >= PRECIP_LEVEL, precip, codes)
+        codes[intensity >= STORM_LEVEL] = WeatherType.STORM.value
+        return codes
+
+    def _wind(self, tick: int) -> Tuple[float, float]:
+        """Prevailing wind at `tick`: direction (radians) and strength."""
+        p = self._wind_phase
+        wind_dir = (
+            self._wind_base
+            + 0.8 * math.sin(2 * math.pi * tick / 97 + p[1])
+            + 0.4 * math.sin(2 * math.pi * tick / 29 + p[2])
+        )
+        wind_speed = 0.5 + 0.5 * math.sin(2 * math.pi * tick / 53 + p[2])
+        return wind_dir, wind_speed
+
+    # Sampling
+    # ------------------------------------------------------------------------- #
+    def cells(self, lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+        """Row and column of coordinates (arrays), clipped to the grid."""
+        row = np.floor((np.asarray(lat) - self.min_lat) / self.cell_deg).astype(np.int64)
+        col = np.floor((np.asarray(lon) - self.min_lon) / self.cell_deg).astype(np.int64)
+        return np.clip(row, 0, self.height - 1), np.clip(col, 0, self.width - 1)
+
+    def path_samples(
+        self, lat1: float, lon1: float, lat2: float, lon2: float
+    ) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Points along the great circle between two coordinates, about two per cell.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, float]: Sample latitudes, longitudes
+                and the initial bearing (radians, clockwise from north).
+        """
+        p1, l1, p2, l2 = map(math.radians, (lat1, lon1, lat2, lon2))
+        a = np.array([math.cos(p1) * math.cos(l1), math.cos(p1) * math.sin(l1), math.sin(p1)])
+        b = np.array([math.cos(p2) * math.cos(l2), math.cos(p2) * math.sin(l2), math.sin(p2)])
+        omega = math.acos(max(-1.0, min(1.0, float(a @ b))))
+        n = min(64, max(2, math.ceil(2 * math.degrees(omega) / self.cell_deg) + 1))
+        t = np.linspace(0.0, 1.0, n)[:, None]
+        if omega < 1e-9:
+            pts = np.repeat(a[None, :], n, axis=0)
+        else:
+            pts = (np.sin((1 - t) * omega) * a + np.sin(t * omega) * b) / math.sin(omega)
+        lat = np.degrees(np.arcsin(np.clip(pts[:, 2], -1.0, 1.0)))
+        lon = np.degrees(np.arctan2(pts[:, 1], pts[:, 0]))
+        bearing = math.atan2(
+            math.sin(l2 - l1) * math.cos(p2),
+            math.cos(p1) * math.sin(p2) - math.sin(p1) * math.cos(p2) * math.cos(l2 - l1),
+        )
+        return lat, lon, bearing
+
+    def sample_leg(
+        self, tick: int, lat1: float, lon1: float, lat2: float, lon2: float
+    ) -> LegWeather:
+        """
+        Weather of a leg flown at `tick`.
+
+        The fuel modifier averages the cells along the path and adds the
+        wind component; the reported type is the worst weather covering at
+        least a quarter of the path, else tailwind (if it helps) or clear.
+        """
+        lat, lon, bearing = self.path_samples(lat1, lon1, lat2, lon2)
+        rows, cols = self.cells(lat, lon)
+        with self._lock:
+            frame = self._frames.get(tick)
+        if frame is not None:
+            codes = frame.codes[rows, cols]
+            wind = frame.wind_modifier(bearing)
+        else:
+            intensity = self._intensity_at(tick, rows, cols)
+            codes = self._classify(tick, intensity, self._lat[rows])
+            wind = _wind_modifier(bearing, *self._wind(tick))
+        modifier = float(_CELL_MODIFIER[codes].mean()) + wind
+
+        counts = np.bincount(codes, minlength=len(_CODES))
+        weather_type = WeatherType.CLEAR
+        for w in (WeatherType.STORM, WeatherType.SNOW, WeatherType.RAIN):
+            if counts[w.value] * 4 >= len(codes):
+                weather_type = w
+                break
+        else:
+            if wind <= WIND_MODIFIER / 2:
+                weather_type = WeatherType.TAILWIND
+        return LegWeather(weather_type, modifier)
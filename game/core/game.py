@@ -8,125 +8,435 @@ quests, airports, and events.
 """
 
 from __future__ import annotations
-from typing import List, Tuple, Optional
-from geopy.distance import geodesic
-from game.db.airport_repo import AirportRepository
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Tuple, Optional
+import numpy as np
+from game import config
+from game.db.repository import get_airport_repository
 from game.core.entities.airport import Airport
+from game.core.entities.airport_table import AirportTable
 from game.core.entities.quest import Quest, QuestStatus
-from .events.game_event import get_random_events
+from .events.game_event import get_leg_events, get_random_events
+from .events.weather_field import START_TICKS, WeatherField
 from game.core.state.game_state import GameState, PlayerState
+from game.core.state.turn_context import TurnContext, TurnOption
 from game.utils.colors import ok, warn, err, info, dim, bold
+from game.utils.distance import distance_km, one_to_many_km
 from game.core.planning.player_rule_route import compute_player_rule_route, RouteResult
+from game.core.planning.optimal_route import compute_optimal_route
+from game.core.planning.route_cache import RouteKey, get_route_cache, route_key
+from game.core.planning.route_table import TABLE_PLANNERS, RouteTable
+from game.core.planning.quest_index import QuestIndex, parse_difficulty
+from game.core.planning.airport_index import AirportIndex, forward_neighbors
+from game.core.planning.weather_costs import WeatherCosts
+from game.core.random_streams import RandomStreams
+from game.core.world import World
+
+if TYPE_CHECKING:
+    from game.replay.journal import JournalWriter
 
 GAME_NOT_STARTED_ERR: str = "Game not started. call start() first."
 
 
+@dataclass
+class _QuestPlan:
+    """Everything needed to activate a quest, prepared ahead of time."""
+
+    start_icao: str
+    target: Airport
+    target_dist_km: np.ndarray
+    route: RouteResult
+
+
+_prefetch_pool: Optional[ThreadPoolExecutor] = None
+_prefetch_pool_lock = threading.Lock()
+
+
+def _prefetch_executor() -> ThreadPoolExecutor:
+    """Worker threads planning upcoming quests (shared by all games in the process)."""
+    global _prefetch_pool
+    with _prefetch_pool_lock:
+        if _prefetch_pool is None:
+            _prefetch_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="quest-prefetch"
+            )
+        return _prefetch_pool
+
+
 class Game:
     """Represents the flight game."""
 
     START_ICAO = "EFHK"
-    COUNTRY = "FI"
+    # ISO country code of the loaded airport set, None loads the whole world.
+    COUNTRY: Optional[str] = "FI"
     START_FUEL: float = 100.0
     FUEL_PER_KM: float = 0.08
     FUEL_TAKEOFF_LANDING: float = 2.0
-
-    def __init__(self) -> None:
-        """Initialize the game instance."""
+    # Planner behind the "Ideal" route report: "rule" (greedy), "optimal" (A*) or
+    # "weather" (A* over the fuel expected under the weather at planning time).
+    ROUTE_PLANNER: str = config.ROUTE_PLANNER
+    # Weather of a hop: "field" (the world's weather along the leg) or "random" (uniform).
+    WEATHER_MODEL: str = config.WEATHER_MODEL
+    # Cell size (degrees) of the weather grid the "field" model and planner use.
+    WEATHER_CELL_DEG: float = config.WEATHER_CELL_DEG
+    # Difficulty of issued quests, e.g. "medium,300-600km,3-5hops" (needs a route
+    # table of a "rule" or "optimal" planner, checked by `start()`, see `game.routes`);
+    # empty picks any other airport.
+    QUEST_DIFFICULTY: str = config.QUEST_DIFFICULTY
+    # Nearest forward airports the planners may move to (matches `options()`).
+    K_NEIGHBORS: int = 5
+    # Plan the next quest in the background once the target is this many
+    # (ideal-route average) hops away; 0 plans it when the quest completes.
+    PREFETCH_HOPS: int = 2
+
+    def __init__(
+        self, world: Optional[World] = None, seed: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the game instance.
+
+        Args:
+            world (Optional[World]): Shared airport world; loaded on `start()` if omitted.
+            seed (Optional[int]): Seed of the quest, weather and flavor random streams
+                (a fresh one is drawn if omitted; `self.seed` reproduces the game).
+        """
         self.running: bool = False
-        self._airports: List[Airport] = []
+        self._world: Optional[World] = world
+        self.streams = RandomStreams(seed)
+        # Append-only record of the commands played (see `game.replay`), if enabled.
+        self.journal: Optional[JournalWriter] = None
+        self._airports: AirportTable = AirportTable([], [], [], [], [])
+        self._index: AirportIndex = AirportIndex([], [])
+        # km from every loaded airport to the active quest target (indexed by
+        # table row), rebuilt only when a new quest is issued.
+        self._target_dist_km: Optional[np.ndarray] = None
         self._last_options: List[Tuple[Airport, float]] = []
+        # Status and options of the current turn, dropped by `pick()`.
+        self._turn_context: Optional[TurnContext] = None
         # messages produced by events (weather, etc.)
         self._event_messages: List[str] = []
         self.state: Optional[GameState] = None
         self._fuel_factor: float = 1.0
         self._fuel_fixed: float = 0.0
+        # Tick of the world's weather field at the first hop (drawn per game).
+        self._weather_tick0: int = 0
 
         self._ideal_route: Optional[RouteResult] = None
+        # Edge prices of the "weather" planner, re-priced as the weather changes;
+        # shared by the calling and prefetch threads, so used under the lock.
+        self._weather_costs: Optional[WeatherCosts] = None
+        self._weather_lock = threading.Lock()
+        # Next quest being planned in the background (see `PREFETCH_HOPS`), with
+        # the weather tick its route is priced at.
+        self._prefetch: Optional[Future] = None
+        self._prefetch_target: Optional[Airport] = None
+        self._prefetch_tick: int = 0
         self._quest_actual_base_fuel: float = 0.0
         self._quest_actual_fuel: float = 0.0
         self._quest_start_km_total: float = 0.0
         self._quest_start_hops: int = 0
 
+        # Run statistics (read by simulations)
+        self.total_fuel_used: float = 0.0
+        self.quest_scores: List[int] = []
+
     # Quest Helpers
     def _issue_new_quest(self) -> None:
         """Select and assign new active quest for the player."""
-        import random
-
         if not self.state:
             raise RuntimeError(GAME_NOT_STARTED_ERR)
 
         player_location = self.state.player.location
-        candidates = [a for a in self._airports if a.icao != player_location.icao]
-        if not candidates:
-            self.state.active_quest = None
-            self.state.system_msg = ""
-            return
+        plan = self._take_prefetched_quest(player_location)
+        if plan is None:
+            target = self._choose_quest_target(player_location)
+            if target is None:
+                self.state.active_quest = None
+                self.state.system_msg = ""
+                return
+            plan = self._prepare_quest(player_location, target, self.weather_tick())
 
-        target = random.choice(candidates)
+        target = plan.target
         self.state.active_quest = Quest(target_icao=target.icao)
+        self._target_dist_km = plan.target_dist_km
         self.state.system_msg = f"New quest: Fly to {target.name} ({target.icao})."
 
-        self._ideal_route = compute_player_rule_route(
-            start_airport=player_location,
+        self._ideal_route = plan.route
+        self._quest_actual_base_fuel = 0.0
+        self._quest_actual_fuel = 0.0
+        self._quest_start_km_total = self.state.player.km_total
+        self._quest_start_hops = self.state.player.hops
+        self._maybe_prefetch_next_quest()
+
+    def _choose_quest_target(self, start: Airport) -> Optional[Airport]:
+        """
+        Pick a random quest target other than `start` (None if there is none).
+
+        With a `QUEST_DIFFICULTY` (which `start()` made sure has a route
+        table), the target is drawn from the start's difficulty bucket, or
+        from all its reachable targets when that bucket is empty, so it is
+        always reachable; None when the start reaches no airport. Otherwise
+        the target is drawn from all other airports.
+        """
+        start_row = self._airports.row_of(start.icao)
+        index = self._quest_index() if self.QUEST_DIFFICULTY else None
+        if index is not None:
+            if start_row is None:
+                return None
+            difficulty = parse_difficulty(self.QUEST_DIFFICULTY)
+            row = index.sample(start_row, difficulty, self.streams.quests)
+            return self._airports[row] if row is not None else None
+        count = len(self._airports) - (start_row is not None)
+        if count <= 0:
+            return None
+        row = self.streams.quests.randrange(count)
+        if start_row is not None and row >= start_row:
+            row += 1
+        return self._airports[row]
+
+    def _prepare_quest(self, start: Airport, target: Airport, weather_tick: int) -> _QuestPlan:
+        """
+        Compute target distances and the ideal route; safe to run on a worker thread.
+
+        The result depends only on the arguments (the route is priced under
+        the weather of `weather_tick`, read when the quest was chosen), not
+        on how far the game has moved on while it runs.
+        """
+        target_dist_km = self._target_distances(target)
+        route = self._plan_route(start, target, target_dist_km, weather_tick)
+        return _QuestPlan(start.icao, target, target_dist_km, route)
+
+    def _maybe_prefetch_next_quest(self) -> None:
+        """Start planning the next quest once the player is a few hops from the target."""
+        if self.PREFETCH_HOPS <= 0 or self._prefetch is not None:
+            return
+        route = self._ideal_route
+        remaining = self.remaining_distance_to_target()
+        if not route or not route.success or route.hops == 0 or remaining is None:
+            return
+        if remaining > self.PREFETCH_HOPS * route.distance_km / route.hops:
+            return
+
+        # The next quest starts where the current one ends.
+        start = self._get_target_airport()
+        target = self._choose_quest_target(start) if start else None
+        if target is None:
+            return
+        self._start_prefetch(start, target, self.weather_tick())
+
+    def _start_prefetch(self, start: Airport, target: Airport, weather_tick: int) -> None:
+        """
+        Plan the quest `start` -> `target` on a worker thread.
+
+        The target is drawn here, on the calling thread, and the plan depends
+        only on the arguments, so a game plays the same however the worker
+        is scheduled (a cancelled plan that still runs is never used).
+        """
+        self._prefetch_target = target
+        self._prefetch_tick = weather_tick
+        self._prefetch = _prefetch_executor().submit(
+            self._prepare_quest, start, target, weather_tick
+        )
+
+    def _take_prefetched_quest(self, start: Airport) -> Optional[_QuestPlan]:
+        """Return the background-planned quest if it starts at `start`, waiting if needed."""
+        future, self._prefetch = self._prefetch, None
+        target, self._prefetch_target = self._prefetch_target, None
+        if future is None:
+            return None
+        try:
+            plan = future.result()
+        except Exception:
+            # Planned again here from the same inputs, so the game plays the same
+            # quest whether or not the worker got to finish it.
+            plan = self._prepare_quest(start, target, self._prefetch_tick)
+        return plan if plan.start_icao == start.icao else None
+
+    def _cancel_prefetch(self) -> None:
+        """Drop the background-planned quest (restart, exit, game over)."""
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+            self._prefetch_target = None
+
+    def _plan_route(
+        self, start: Airport, target: Airport, target_dist_km: np.ndarray, weather_tick: int
+    ) -> RouteResult:
+        """
+        Plan the ideal route for a quest with the configured `ROUTE_PLANNER`.
+
+        Served from the world's precomputed route table when one matches the
+        game's settings (see `game.routes`), otherwise planned and memoized.
+        """
+        table = self._route_table()
+        if table is not None:
+            s, t = self._airports.row_of(start.icao), self._airports.row_of(target.icao)
+            if s is not None and t is not None:
+                return table.route(s, t)
+        return get_route_cache().get_or_compute(
+            self._route_key(start.icao, target.icao, weather_tick),
+            lambda: self._compute_route(start, target, target_dist_km, weather_tick),
+        )
+
+    def _route_table(self) -> Optional[RouteTable]:
+        """Precomputed routes of the configured planner, if a table was built for them."""
+        if self._world is None or self.ROUTE_PLANNER not in TABLE_PLANNERS:
+            return None
+        return self._world.route_table(
+            self.ROUTE_PLANNER, self.FUEL_PER_KM, self.FUEL_TAKEOFF_LANDING, self.K_NEIGHBORS
+        )
+
+    def _quest_index(self) -> Optional[QuestIndex]:
+        """Difficulty buckets over the configured planner's route table, if one was built."""
+        if self._world is None or self.ROUTE_PLANNER not in TABLE_PLANNERS:
+            return None
+        return self._world.quest_index(
+            self.ROUTE_PLANNER, self.FUEL_PER_KM, self.FUEL_TAKEOFF_LANDING, self.K_NEIGHBORS
+        )
+
+    def _route_key(self, start_icao: str, target_icao: str, weather_tick: int) -> RouteKey:
+        """Route cache key of a quest under this game's settings (and weather, if priced)."""
+        weather = (
+            f"{self.WEATHER_CELL_DEG}@{weather_tick}"
+            if self.ROUTE_PLANNER == "weather"
+            else ""
+        )
+        return route_key(
+            self.ROUTE_PLANNER,
+            start_icao,
+            target_icao,
+            self.FUEL_PER_KM,
+            self.FUEL_TAKEOFF_LANDING,
+            self.K_NEIGHBORS,
+            config.DISTANCE_TIER,
+            self._airports.fingerprint(),
+            weather,
+        )
+
+    def _compute_route(
+        self, start: Airport, target: Airport, target_dist_km: np.ndarray, weather_tick: int
+    ) -> RouteResult:
+        """Run the configured planner for one quest."""
+        common = dict(
+            start_airport=start,
             target_airport=target,
             all_airports=self._airports,
             fuel_per_km=self.FUEL_PER_KM,
             fuel_fixed=self.FUEL_TAKEOFF_LANDING,
-            k_neighbors=5,
+            k_neighbors=self.K_NEIGHBORS,
+            index=self._index,
+            target_dist_km=target_dist_km,
         )
-        self._quest_actual_base_fuel = 0.0
-        self._quest_actual_fuel = 0.0
-        self._quest_start_km_total = self.state.player.km_total
-        self._quest_start_hops = self.state.player.hops
+        if self.ROUTE_PLANNER == "optimal":
+            return compute_optimal_route(**common, graph=self._world.graph)
+        if self.ROUTE_PLANNER == "rule":
+            return compute_player_rule_route(**common, graph=self._world.prebuilt_graph)
+        if self.ROUTE_PLANNER == "weather":
+            with self._weather_lock:
+                return compute_optimal_route(**common, costs=self._priced_weather(weather_tick))
+        raise ValueError(f"Unknown route planner: {self.ROUTE_PLANNER}")
+
+    def _priced_weather(self, weather_tick: int) -> WeatherCosts:
+        """
+        Edge prices under the weather of `weather_tick` (re-pricing changed edges only).
+
+        Call with `_weather_lock` held until the prices are no longer used.
+        """
+        if self._weather_costs is None:
+            self._weather_costs = WeatherCosts(self._world.weather_edges_on(self.WEATHER_CELL_DEG))
+        self._weather_costs.update(self.weather_field().frame(weather_tick))
+        return self._weather_costs
+
+    def _check_quest_difficulty(self) -> None:
+        """
+        Make sure a configured `QUEST_DIFFICULTY` can be served.
+
+        Raises:
+            ValueError: If the difficulty is malformed, or no route table of the
+                configured planner and settings was built to draw quests from.
+        """
+        if not self.QUEST_DIFFICULTY:
+            return
+        parse_difficulty(self.QUEST_DIFFICULTY)
+        if self._quest_index() is None:
+            raise ValueError(
+                f"Quest difficulty {self.QUEST_DIFFICULTY!r} needs a route table for the "
+                f"{self.ROUTE_PLANNER!r} planner and these settings (see game.routes)"
+            )
 
     def _get_target_airport(self) -> Optional[Airport]:
         """Return the target Airport object of the active quest."""
         if not self.state or not self.state.active_quest:
             return None
-        target_icao = self.state.active_quest.target_icao
-        for a in self._airports:
-            if a.icao == target_icao:
-                return a
-        return None
+        return self._airports.get(self.state.active_quest.target_icao)
+
+    def _cache_target_distances(self, target: Airport) -> None:
+        """Compute the distance from every loaded airport to `target` once per quest."""
+        self._target_dist_km = self._target_distances(target)
+
+    def _target_distances(self, target: Airport) -> np.ndarray:
+        """Distance (km) from every loaded airport to `target`, indexed by table row."""
+        row = self._airports.row_of(target.icao)
+        if row is not None and self._world is not None:
+            return self._world.target_distances(row)
+        return one_to_many_km(target.lat, target.lon, self._airports.lat, self._airports.lon)
 
     def _viable_target_option(self, airport: Airport, target: Airport) -> bool:
         """Check if flying to `airport` moves closer to the `target`."""
-        distance_to_target = geodesic(
-            (airport.lat, airport.lon), (target.lat, target.lon)
-        ).km
+        distance_to_target = self.distance_to_target(airport)
         remaining_total_distance_to_target = self.remaining_distance_to_target()
-        if distance_to_target < remaining_total_distance_to_target:
-            return True
-        return False
+        if distance_to_target is None or remaining_total_distance_to_target is None:
+            return False
+        return distance_to_target < remaining_total_distance_to_target
 
     # Game lifecycle methods
     # ------------------------------------------------------------------------- #
     def start(self) -> None:
         """Start the game, initalize game state and assign first quest."""
-        start_airport = AirportRepository.get_by_icao(self.START_ICAO)
+        # Served from the on-disk snapshot when present, so startup skips the DB.
+        if self._world is None:
+            self._world = World.load(self.COUNTRY)
+        self._airports = self._world.airports
+        self._index = self._world.index
+        self._check_quest_difficulty()
+
+        start_airport = self._airports.get(
+            self.START_ICAO
+        ) or get_airport_repository().get_by_icao(self.START_ICAO)
         if not start_airport:
             raise RuntimeError("Start airport EFHK not found in DB")
 
-        self._airports = AirportRepository.list_airports(country=self.COUNTRY)
+        self._cancel_prefetch()
+        self._target_dist_km = None
         player = PlayerState(location=start_airport, fuel=self.START_FUEL)
         self.state = GameState(player=player)
         self.running = True
         self._last_options = []
+        self._turn_context = None
         self._event_messages.clear()
         self._fuel_factor = 1.0
         self._fuel_fixed = 0.0
+        self._weather_tick0 = self.streams.weather.randrange(START_TICKS)
 
         self._ideal_route = None
         self._quest_actual_base_fuel = 0.0
         self._quest_actual_fuel = 0.0
         self._quest_start_km_total = 0.0
         self._quest_start_hops = 0
+        self.total_fuel_used = 0.0
+        self.quest_scores = []
 
         # Issue the first quest
         self._issue_new_quest()
+        if self.journal is not None:
+            self.journal.start(self)
 
     def exit_game(self) -> None:
         """Stop the game."""
+        self._cancel_prefetch()
         self.running = False
 
     def is_running(self) -> bool:
@@ -166,6 +476,7 @@ class Game:
         p.fuel = max(0.0, p.fuel - burn)
 
         self._quest_actual_fuel += burn
+        self.total_fuel_used += burn
 
         status_color = err if p.fuel <= 0 else (warn if p.fuel <= 8.0 else ok)
         msg = f"⛽  Fuel used: {err(f'{burn:.1f} L')} | Remaining: {status_color(f'{p.fuel:.1f} L')}"
@@ -175,10 +486,62 @@ class Game:
         self._fuel_fixed = 0.0
         return burn
 
-    def options(self, limit: int = 5) -> List[Tuple[Airport, float]]:
+    def turn_context(self) -> TurnContext:
+        """
+        Return the status and move options of the current turn.
+
+        Built once per turn and shared by the CLI and commands; `pick()`
+        invalidates it.
+        """
+        if not self.state:
+            raise RuntimeError(GAME_NOT_STARTED_ERR)
+        if self._turn_context is not None:
+            return self._turn_context
+
+        target = self._get_target_airport()
+        remaining = self.remaining_distance_to_target()
+        opts = self.options() if target is not None else []
+
+        scored = []
+        best_number, best_delta = None, None
+        for number, (airport, leg_km) in enumerate(opts, start=1):
+            to_target = self.distance_to_target(airport)
+            delta = None
+            if remaining is not None and to_target is not None:
+                delta = remaining - int(round(to_target))
+                if best_delta is None or delta > best_delta:
+                    best_number, best_delta = number, delta
+            scored.append((number, airport, leg_km, to_target, delta))
+
+        options = tuple(
+            TurnOption(
+                number=number,
+                airport=airport,
+                leg_km=leg_km,
+                to_target_km=to_target,
+                delta_km=delta,
+                is_best=number == best_number,
+                is_target=target is not None and airport.icao == target.icao,
+            )
+            for number, airport, leg_km, to_target, delta in scored
+        )
+        self._turn_context = TurnContext(
+            status=MappingProxyType(self.status()),
+            target=target,
+            remaining_km=remaining,
+            options=options,
+        )
+        return self._turn_context
+
+    def options(self, limit: Optional[int] = None) -> List[Tuple[Airport, float]]:
         """Return a list of viable airports to fly to with distances in kms."""
         if not self.state:
             raise RuntimeError("Game not started. Call start() first.")
+        if limit is None:
+            limit = self.K_NEIGHBORS
+            if self._turn_context is not None:
+                self._last_options = [(o.airport, o.leg_km) for o in self._turn_context.options]
+                return self._last_options
 
         player_loc = self.state.player.location
 
@@ -186,18 +549,24 @@ class Game:
         if target_airport is None:
             raise ValueError("Failed to fetch quest target airport.")
 
-        pairs: List[Tuple[Airport, float]] = []
-        for a in self._airports:
-            if a.icao == player_loc.icao:
-                continue
-            if not self._viable_target_option(a, target_airport):
-                continue
-
-            dist_km = geodesic((player_loc.lat, player_loc.lon), (a.lat, a.lon)).km
-            pairs.append((a, dist_km))
-
-        pairs.sort(key=lambda t: t[1])
-        self._last_options = pairs[:limit]
+        if self._target_dist_km is None:
+            self._cache_target_distances(target_airport)
+        remaining = self.remaining_distance_to_target()
+
+        # Nearest airports inside the "closer to target" cone, from the neighbour
+        # graph when the world has built one, else straight from the index.
+        nearest = forward_neighbors(
+            self._index,
+            self._airports,
+            origin=player_loc,
+            target=target_airport,
+            dist_to_target=self._target_dist_km,
+            max_target_km=remaining,
+            limit=limit,
+            exclude_row=self._airports.row_of(player_loc.icao),
+            graph=self._world.prebuilt_graph,
+        )
+        self._last_options = [(self._airports[row], km) for row, km in nearest]
         return self._last_options
 
     def pick(self, index: int) -> Optional[Airport]:
@@ -210,13 +579,22 @@ class Game:
 
         chosen, dist = self._last_options[index - 1]
         p = self.state.player
+        origin = p.location
+        self._turn_context = None
 
         p.km_total += dist
         p.hops += 1
         p.location = chosen
 
         self._event_messages.clear()
-        events = get_random_events()
+        if self.WEATHER_MODEL == "field":
+            events = get_leg_events(
+                self.weather_field(), self.weather_tick(), origin, chosen, self.streams.flavor
+            )
+        elif self.WEATHER_MODEL == "random":
+            events = get_random_events(self.streams.weather, self.streams.flavor)
+        else:
+            raise ValueError(f"Unknown weather model: {self.WEATHER_MODEL}")
         for event in events:
             event.trigger(self)
 
@@ -227,6 +605,7 @@ class Game:
 
         if p.fuel <= 0:
             self.state.system_msg = "Game over — out of fuel"
+            self._cancel_prefetch()
             self.running = False
             return chosen
 
@@ -244,10 +623,13 @@ class Game:
             p.fuel = self.START_FUEL
 
             # --- begin colored report block ---
+            # Fuel the ideal route was expected to burn in weather ("weather" planner only).
+            ideal_expected = None
             if self._ideal_route and self._ideal_route.success:
                 ideal_fuel = self._ideal_route.base_fuel
                 ideal_dist = self._ideal_route.distance_km
                 ideal_hops = self._ideal_route.hops
+                ideal_expected = self._ideal_route.expected_fuel
             else:
                 # fallback
                 actual_dist = p.km_total - self._quest_start_km_total
@@ -263,12 +645,17 @@ class Game:
             actual_dist = p.km_total - self._quest_start_km_total
             actual_hops = p.hops - self._quest_start_hops
 
-            if actual_base > 0:
+            if ideal_expected is not None and actual_real > 0:
+                # Weather-aware ideal: judge the fuel actually burned, weather included.
+                eff = ideal_expected / actual_real
+                score = int(round(100 * (eff**1.1)))
+            elif actual_base > 0:
                 eff = ideal_fuel / actual_base
                 score = int(round(100 * (eff**1.1)))
             else:
                 score = 100
             score = max(0, min(100, score))
+            self.quest_scores.append(score)
             grade = (
                 "A"
                 if score >= 90
@@ -298,13 +685,16 @@ class Game:
                     return warn
                 return err
 
+            ideal_line = f"Ideal:  {ideal_dist:.0f} km | {ideal_hops} hops | {ideal_fuel:.1f} L"
+            if ideal_expected is not None:
+                ideal_line += f" ({ideal_expected:.1f} L expected in weather)"
             score_fx = _score_fx(score)
             penalty_fx = _penalty_fx(weather_penalty)
 
             report = (
                 f"{bold(ok(f'Quest completed: {finished.target_icao}! +1 point.'))}\n"
                 f"{bold(info('--- ROUTE REPORT ---'))}\n"
-                f"{dim(f'Ideal:  {ideal_dist:.0f} km | {ideal_hops} hops | {ideal_fuel:.1f} L')}\n"
+                f"{dim(ideal_line)}\n"
                 f"{info(f'Yours:  {actual_dist:.0f} km | {actual_hops} hops | {actual_base:.1f} L (route)')}\n"
                 f"{penalty_fx(f'Weather impact: +{weather_penalty:.1f} L')}\n"
                 f"{bold(score_fx(f'Efficiency: {score}/100 ({grade})'))}"
@@ -321,10 +711,30 @@ class Game:
             # no quest-related event this hop
             if not self.state.system_msg.startswith("New quest"):
                 self.state.system_msg = ""
+            self._maybe_prefetch_next_quest()
 
         return chosen
 
-    def get_airports(self) -> List[Airport]:
+    @property
+    def seed(self) -> int:
+        """Seed of the game's random streams."""
+        return self.streams.seed
+
+    def weather_tick(self) -> int:
+        """Tick of the world's weather field for the current hop."""
+        hops = self.state.player.hops if self.state else 0
+        return self._weather_tick0 + hops
+
+    def weather_field(self) -> WeatherField:
+        """The world's weather field on this game's grid (`WEATHER_CELL_DEG`)."""
+        return self._world.weather_field(self.WEATHER_CELL_DEG)
+
+    @property
+    def world(self) -> Optional[World]:
+        """Shared airport world (None until `start()` loads it)."""
+        return self._world
+
+    def get_airports(self) -> AirportTable:
         """Return all loaded airports."""
         return self._airports
 
@@ -332,19 +742,25 @@ class Game:
         """Return the target airport of active quest."""
         return self._get_target_airport()
 
+    def distance_to_target(self, airport: Airport) -> Optional[float]:
+        """Distance (km) from `airport` to the active quest target, served from the quest cache."""
+        target = self._get_target_airport()
+        if not target:
+            return None
+
+        row = self._airports.row_of(airport.icao)
+        if row is not None and self._target_dist_km is not None:
+            return float(self._target_dist_km[row])
+        return distance_km(airport.lat, airport.lon, target.lat, target.lon)
+
     def remaining_distance_to_target(self) -> Optional[int]:
         """Remaining distance to the target airport (rounded km)."""
         if not self.state or not self.state.player or not self.state.active_quest:
             return None
 
-        player_location = self.state.player.location
-        target = self._get_target_airport()
-        if not target:
+        dist_km = self.distance_to_target(self.state.player.location)
+        if dist_km is None:
             return None
-
-        dist_km = geodesic(
-            (player_location.lat, player_location.lon), (target.lat, target.lon)
-        ).km
         return int(round(dist_km))
 
     def add_event_message(self, msg: str) -> None:
@@ -4,9 +4,10 @@ core/input/inputhandler.py
 Handles parsing and executing user input commands.
 
 Provides `handle_input` to convert raw user input into a CommandResult.
+Executed commands are appended to the game's journal when it has one.
 """
 
-from game.core.commands.command import CommandResult, CommandStatus, get_command
+from game.core.commands.command import CommandResult, CommandStatus, parse_command
 from game.utils.colors import err
 
 
@@ -21,9 +22,11 @@ def handle_input(game, raw: str) -> CommandResult:
     Returns:
         CommandResult: Result containing messages produced by the command and execution status.
     """
-    cmd = get_command(raw)
+    cmd, args = parse_command(raw)
     if not cmd:
-        return CommandResult([err("Invalid command, try again")], CommandStatus.ERROR)
-
-    result = cmd.execute(game, args=raw)
+        result = CommandResult([err("Invalid command, try again")], CommandStatus.ERROR)
+    else:
+        result = cmd.execute(game, args=args)
+    if game.journal is not None:
+        game.journal.command(game, raw, result)
     return result
@@ -0,0 +1,357 @@
+"""
+core/planning/airport_index.py
+==============================
+Spatial index over the loaded airport set.
+
+Airports are projected to unit-sphere XYZ coordinates and stored in a static
+KD-tree, so nearest-neighbour, radius and "closer-to-target" queries only
+visit the part of the tree around the query point instead of scanning every
+airport.
+
+Includes:
+    - `AirportIndex`: KD-tree with k-nearest, radius and cone queries.
+    - `forward_neighbors`: nearest airports (with leg distances) that move closer to a target.
+"""
+
+from __future__ import annotations
+from heapq import heappush, heappop, heapreplace
+from math import sin
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from game.core.entities.airport import Airport
+from game.core.entities.airport_table import AirportTable, as_table
+from game.utils.distance import EARTH_RADIUS_KM, one_to_many_km
+
+if TYPE_CHECKING:
+    from .neighbor_graph import NeighborGraph
+
+# Max relative error of the spherical index distances against the WGS-84 geodesic.
+SPHERE_REL_ERR: float = 0.006
+
+Cap = Tuple[float, float, float]
+
+
+def to_xyz(lat, lon) -> np.ndarray:
+    """Project latitude/longitude (degrees, scalars or arrays) to unit-sphere XYZ."""
+    lat_r = np.radians(np.asarray(lat, dtype=np.float64))
+    lon_r = np.radians(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat_r)
+    return np.stack(
+        (cos_lat * np.cos(lon_r), cos_lat * np.sin(lon_r), np.sin(lat_r)), axis=-1
+    )
+
+
+def km_to_chord(km: float) -> float:
+    """Convert a great-circle distance in km to the unit-sphere chord length."""
+    theta = min(km / EARTH_RADIUS_KM, np.pi)
+    return 2.0 * sin(theta / 2.0)
+
+
+def chord_to_km(chord):
+    """Convert unit-sphere chord lengths (scalar or array) to great-circle km."""
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2.0, 0.0, 1.0))
+
+
+class AirportIndex:
+    """Static KD-tree over airport positions on the unit sphere."""
+
+    LEAF_SIZE: int = 16
+
+    def __init__(self, lat: Sequence[float], lon: Sequence[float]) -> None:
+        """
+        Build the index.
+
+        Args:
+            lat (Sequence[float]): Latitudes in degrees, one per airport row.
+            lon (Sequence[float]): Longitudes in degrees, same order as `lat`.
+        """
+        xyz = to_xyz(lat, lon).reshape(-1, 3)
+        self.size = len(xyz)
+        self._perm = np.arange(self.size, dtype=np.int64)
+        self._lo: List[Tuple[float, float, float]] = []
+        self._hi: List[Tuple[float, float, float]] = []
+        self._span: List[Tuple[int, int]] = []
+        self._children: List[Tuple[int, int]] = []
+        if self.size:
+            self._build(xyz, 0, self.size)
+        self._pts = xyz[self._perm]
+
+    @classmethod
+    def from_airports(cls, airports: Iterable[Airport]) -> "AirportIndex":
+        """Build an index from an AirportTable (or airports); rows follow table order."""
+        table = as_table(airports)
+        return cls(table.lat, table.lon)
+
+    def __len__(self) -> int:
+        return self.size
+
+    # Construction
+    # ------------------------------------------------------------------------- #
+    def _build(self, xyz: np.ndarray, start: int, end: int) -> int:
+        """Recursively split rows `start:end` of the permutation, return node id."""
+        node = len(self._span)
+        pts = xyz[self._perm[start:end]]
+        lo, hi = pts.min(axis=0), pts.max(axis=0)
+        self._lo.append(tuple(lo.tolist()))
+        self._hi.append(tuple(hi.tolist()))
+        self._span.append((start, end))
+        self._children.append((-1, -1))
+
+        if end - start > self.LEAF_SIZE:
+            axis = int(np.argmax(hi - lo))
+            mid = (end - start) // 2
+            order = np.argpartition(pts[:, axis], mid)
+            self._perm[start:end] = self._perm[start:end][order]
+            left = self._build(xyz, start, start + mid)
+            right = self._build(xyz, start + mid, end)
+            self._children[node] = (left, right)
+        return node
+
+    def _box_d2(self, node: int, q: Cap) -> float:
+        """Squared distance from point `q` to the bounding box of `node`."""
+        lo, hi = self._lo[node], self._hi[node]
+        d2 = 0.0
+        for i in range(3):
+            if q[i] < lo[i]:
+                d2 += (lo[i] - q[i]) ** 2
+            elif q[i] > hi[i]:
+                d2 += (q[i] - hi[i]) ** 2
+        return d2
+
+    def _leaf_filter(
+        self,
+        start: int,
+        end: int,
+        mask: Optional[np.ndarray],
+        cap: Optional[Tuple[Cap, float]],
+    ) -> np.ndarray:
+        """Return local offsets of leaf points passing `mask` and `cap`."""
+        keep = np.ones(end - start, dtype=bool)
+        if mask is not None:
+            keep &= mask[self._perm[start:end]]
+        if cap is not None:
+            center, r2 = cap
+            diff = self._pts[start:end] - center
+            keep &= np.einsum("ij,ij->i", diff, diff) < r2
+        return np.flatnonzero(keep)
+
+    # Queries
+    # ------------------------------------------------------------------------- #
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int,
+        mask: Optional[np.ndarray] = None,
+        cap: Optional[Tuple[float, float, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the `k` airports nearest to a point.
+
+        Args:
+            lat (float): Query latitude in degrees.
+            lon (float): Query longitude in degrees.
+            k (int): Number of neighbours to return.
+            mask (Optional[np.ndarray]): Boolean array over rows; only True rows are returned.
+            cap (Optional[tuple]): `(lat, lon, radius_km)`; only airports strictly
+                inside this spherical cap are returned.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Row indices and spherical distances (km),
+            sorted nearest first.
+        """
+        if k <= 0 or not self.size:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        q = tuple(to_xyz(lat, lon).tolist())
+        cap_q = self._cap(cap)
+        best: List[Tuple[float, int]] = []  # max-heap of (-d2, row)
+        heap = [(0.0, 0)]
+        while heap:
+            d2, node = heappop(heap)
+            if len(best) == k and d2 > -best[0][0]:
+                break
+            if cap_q is not None and self._box_d2(node, cap_q[0]) >= cap_q[1]:
+                continue
+
+            left, right = self._children[node]
+            if left >= 0:
+                heappush(heap, (self._box_d2(left, q), left))
+                heappush(heap, (self._box_d2(right, q), right))
+                continue
+
+            start, end = self._span[node]
+            local = self._leaf_filter(start, end, mask, cap_q)
+            if not len(local):
+                continue
+            diff = self._pts[start + local] - q
+            dists = np.einsum("ij,ij->i", diff, diff)
+            rows = self._perm[start + local]
+            for pd2, row in zip(dists.tolist(), rows.tolist()):
+                if len(best) < k:
+                    heappush(best, (-pd2, row))
+                elif pd2 < -best[0][0]:
+                    heapreplace(best, (-pd2, row))
+
+        best.sort(key=lambda t: -t[0])
+        rows = np.fromiter((r for _, r in best), dtype=np.int64, count=len(best))
+        chords = np.sqrt(np.fromiter((-d for d, _ in best), dtype=np.float64, count=len(best)))
+        return rows, chord_to_km(chords)
+
+    def within(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        mask: Optional[np.ndarray] = None,
+        cap: Optional[Tuple[float, float, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return every airport within `radius_km` (spherical) of a point.
+
+        Args:
+            lat (float): Query latitude in degrees.
+            lon (float): Query longitude in degrees.
+            radius_km (float): Search radius in km (inclusive).
+            mask (Optional[np.ndarray]): Boolean array over rows; only True rows are returned.
+            cap (Optional[tuple]): `(lat, lon, radius_km)` extra cap constraint (exclusive).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Row indices and spherical distances (km),
+            sorted nearest first.
+        """
+        if not self.size:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        q = tuple(to_xyz(lat, lon).tolist())
+        r2 = km_to_chord(radius_km) ** 2
+        cap_q = self._cap(cap)
+        found_rows, found_d2 = [], []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._box_d2(node, q) > r2:
+                continue
+            if cap_q is not None and self._box_d2(node, cap_q[0]) >= cap_q[1]:
+                continue
+            left, right = self._children[node]
+            if left >= 0:
+                stack.extend((left, right))
+                continue
+
+            start, end = self._span[node]
+            local = self._leaf_filter(start, end, mask, cap_q)
+            if not len(local):
+                continue
+            diff = self._pts[start + local] - q
+            dists = np.einsum("ij,ij->i", diff, diff)
+            hit = dists <= r2
+            found_rows.append(self._perm[start + local[hit]])
+            found_d2.append(dists[hit])
+
+        if not found_rows:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        rows = np.concatenate(found_rows)
+        d2 = np.concatenate(found_d2)
+        order = np.argsort(d2, kind="stable")
+        return rows[order], chord_to_km(np.sqrt(d2[order]))
+
+    def closer_to(
+        self,
+        lat: float,
+        lon: float,
+        target_lat: float,
+        target_lon: float,
+        k: int,
+        target_km: Optional[float] = None,
+        mask: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cone query: the `k` airports nearest to a point that lie closer to a target.
+
+        Args:
+            lat (float): Query latitude in degrees.
+            lon (float): Query longitude in degrees.
+            target_lat (float): Target latitude in degrees.
+            target_lon (float): Target longitude in degrees.
+            k (int): Number of neighbours to return.
+            target_km (Optional[float]): Only airports within this spherical distance of
+                the target qualify. Defaults to the query point's own distance to it.
+            mask (Optional[np.ndarray]): Boolean array over rows; only True rows are returned.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Row indices and spherical distances (km) from
+            the query point, sorted nearest first.
+        """
+        if target_km is None:
+            diff = to_xyz(lat, lon) - to_xyz(target_lat, target_lon)
+            target_km = float(chord_to_km(np.sqrt(diff @ diff)))
+        return self.nearest(lat, lon, k, mask=mask, cap=(target_lat, target_lon, target_km))
+
+    def _cap(self, cap: Optional[Tuple[float, float, float]]) -> Optional[Tuple[Cap, float]]:
+        """Convert a `(lat, lon, km)` cap to `(xyz, chord²)` form."""
+        if cap is None:
+            return None
+        lat, lon, km = cap
+        return tuple(to_xyz(lat, lon).tolist()), km_to_chord(km) ** 2
+
+
+def forward_neighbors(
+    index: AirportIndex,
+    airports: AirportTable,
+    origin: Airport,
+    target: Airport,
+    dist_to_target: np.ndarray,
+    max_target_km: float,
+    limit: int,
+    exclude_row: Optional[int] = None,
+    graph: Optional[NeighborGraph] = None,
+) -> List[Tuple[int, float]]:
+    """
+    Return the `limit` nearest airports that are closer to the target, with leg distances.
+
+    An airport qualifies when its cached distance to `target` is below
+    `max_target_km`. The origin's neighbour list in `graph` (when given and
+    long enough, with its cached leg distances) or else the index narrows the
+    search down to a handful of candidates; only those get leg distances from
+    `one_to_many_km`.
+
+    Args:
+        index (AirportIndex): Index built over `airports`.
+        airports (AirportTable): Airports in index row order.
+        origin (Airport): Airport the legs start from.
+        target (Airport): Quest target.
+        dist_to_target (np.ndarray): Distance (km) from every row to `target`.
+        max_target_km (float): Exclusive upper bound for a row's distance to the target.
+        limit (int): Number of neighbours to return.
+        exclude_row (Optional[int]): Row to leave out (usually the origin itself).
+        graph (Optional[NeighborGraph]): Neighbour graph over `airports`; its lists are
+            used when `exclude_row` is the origin's row.
+
+    Returns:
+        List[Tuple[int, float]]: `(row, leg_km)` pairs sorted by leg distance.
+    """
+    found = None
+    if graph is not None and exclude_row is not None:
+        found = graph.forward_candidates(exclude_row, dist_to_target, max_target_km, limit)
+    if found is not None:
+        rows, legs = found
+    else:
+        mask = dist_to_target < max_target_km
+        if exclude_row is not None:
+            mask[exclude_row] = False
+        # Spherical cap slightly wider than the exact bound so no candidate is pruned.
+        cap = (target.lat, target.lon, max_target_km * (1 + SPHERE_REL_ERR))
+
+        rows, km = index.nearest(origin.lat, origin.lon, limit, mask=mask, cap=cap)
+        if len(rows) == limit:
+            # Anything within the sphere/ellipsoid error of the k-th candidate may
+            # still be among the exact k nearest.
+            margin = (1 + SPHERE_REL_ERR) / (1 - SPHERE_REL_ERR)
+            rows, _ = index.within(
+                origin.lat, origin.lon, km[-1] * margin, mask=mask, cap=cap
+            )
+        legs = one_to_many_km(origin.lat, origin.lon, airports.lat[rows], airports.lon[rows])
+    pairs = list(zip(rows.tolist(), legs.tolist()))
+    pairs.sort(key=lambda t: t[1])
+    return pairs[:limit]
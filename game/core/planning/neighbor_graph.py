@@ -0,0 +1,210 @@
+"""
+core/planning/neighbor_graph.py
+===============================
+Precomputed k-nearest-neighbour graph over the loaded airports.
+
+Every airport keeps its `k` nearest airports with WGS-84 leg distances, so
+route planners can expand a node with a few array operations instead of
+querying the spatial index or computing geodesics on the fly.
+
+Includes:
+    - `NeighborGraph`: fixed-width adjacency arrays plus the "forward move" rule
+      used by the game (nearest airports that move closer to the target) and
+      the candidates of `forward_neighbors`.
+"""
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import numpy as np
+from game import config
+from game.core.entities.airport_table import AirportTable, as_table
+from game.utils.distance import ellipsoidal_km, one_to_many_km
+from .airport_index import AirportIndex, SPHERE_REL_ERR
+
+# Targets (distance arrays) whose index fallbacks `forward_edges` remembers.
+FALLBACK_TARGETS = 8
+
+
+class NeighborGraph:
+    """K-nearest-neighbour graph with leg distances in kilometers."""
+
+    def __init__(
+        self, airports: AirportTable, index: AirportIndex, k: int = 16
+    ) -> None:
+        """
+        Build the graph.
+
+        Args:
+            airports (AirportTable): Airports in index row order.
+            index (AirportIndex): Spatial index built over `airports`.
+            k (int): Neighbours stored per airport.
+        """
+        airports = as_table(airports)
+        n = len(airports)
+        self.index = index
+        self.lat = airports.lat
+        self.lon = airports.lon
+        self.k = max(0, min(k, n - 1))
+
+        self.neighbors = np.zeros((n, self.k), dtype=np.int64)
+        self.leg_km = np.zeros((n, self.k), dtype=np.float64)
+        # Spherical radius every neighbour list is complete up to.
+        self.radius_km = np.zeros(n, dtype=np.float64)
+        for u in range(n):
+            rows, sph = index.nearest(self.lat[u], self.lon[u], self.k + 1)
+            rows, sph = rows[rows != u][: self.k], sph[rows != u][: self.k]
+            legs = ellipsoidal_km(self.lat[u], self.lon[u], self.lat[rows], self.lon[rows])
+            order = np.argsort(legs, kind="stable")
+            self.neighbors[u] = rows[order]
+            self.leg_km[u] = legs[order]
+            self.radius_km[u] = sph[-1] if len(sph) else 0.0
+        # Leg distances with the other tiers by tier name, filled a row at a time
+        # (NaN rows are not computed yet).
+        self._tier_legs: Dict[str, np.ndarray] = {}
+        # Index fallbacks of `forward_edges` by id of a read-only distance array
+        # (kept alive here, so the id stays unique), most recent last.
+        self._fallbacks: "OrderedDict[int, Tuple[np.ndarray, dict]]" = OrderedDict()
+        self._fallback_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def forward_moves(
+        self, u: int, dist_to_target: np.ndarray, limit: int = 5
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the `limit` nearest airports from `u` that are closer to the target.
+
+        Mirrors the game's option rule. Served from the stored neighbour list
+        when it provably contains the answer, otherwise from an index cone query.
+
+        Args:
+            u (int): Row of the airport to expand.
+            dist_to_target (np.ndarray): Distance (km) from every row to the target.
+            limit (int): Number of moves to return.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Rows and leg distances (km), nearest first.
+        """
+        rows, legs, _ = self.forward_edges(u, dist_to_target, limit)
+        return rows, legs
+
+    def tier_legs(self, u: int, tier: Optional[str] = None) -> np.ndarray:
+        """
+        Leg distances (km) from `u` to its stored neighbours with a distance tier
+        (default: config.DISTANCE_TIER), computed once per row and tier.
+
+        Equal to `one_to_many_km` over any subset of the neighbours.
+        """
+        tier = tier or config.DISTANCE_TIER
+        legs = self._tier_legs.get(tier)
+        if legs is None:
+            legs = self._tier_legs.setdefault(tier, np.full((len(self), self.k), np.nan))
+        row = legs[u]
+        if self.k and np.isnan(row[0]):
+            nb = self.neighbors[u]
+            row[:] = one_to_many_km(self.lat[u], self.lon[u], self.lat[nb], self.lon[nb], tier)
+        return row
+
+    def forward_candidates(
+        self, u: int, dist_to_target: np.ndarray, max_target_km: float, limit: int
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Rows from `u`'s neighbour list that hold the `limit` nearest airports closer
+        than `max_target_km` to the target, by any distance tier.
+
+        Keeps the forward neighbours within the sphere/ellipsoid error of the
+        `limit`-th one, like the index query of `forward_neighbors`, or all of
+        them when every airport closer to the target is near enough to be in
+        the list; None when the stored list cannot prove it holds them all.
+
+        Returns:
+            Optional[Tuple[np.ndarray, np.ndarray]]: Rows and their leg distances
+                with the configured tier (see `tier_legs`), in list order.
+        """
+        nb = self.neighbors[u]
+        fwd = np.flatnonzero(dist_to_target[nb] < max_target_km)
+        if self.k != len(self) - 1:
+            legs = self.leg_km[u][fwd]
+            margin = (1 + SPHERE_REL_ERR) / (1 - SPHERE_REL_ERR)
+            # No airport closer to the target is farther from `u` than this.
+            bound = (float(dist_to_target[u]) + max_target_km) * margin**2
+            if len(fwd) >= limit:
+                bound = min(bound, legs[limit - 1] * margin)
+            if bound > self.radius_km[u] * (1 - SPHERE_REL_ERR):
+                return None
+            fwd = fwd[legs <= bound]
+        return nb[fwd], self.tier_legs(u)[fwd]
+
+    def forward_edges(
+        self, u: int, dist_to_target: np.ndarray, limit: int = 5
+    ) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """
+        `forward_moves` plus where the moves sit in `u`'s neighbour list.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]: Rows, leg
+                distances (km) and neighbour-list positions of the moves; the
+                positions are None when the moves are (or are proven to equal)
+                the spatial index's answer.
+        """
+        here = dist_to_target[u]
+        nb = self.neighbors[u]
+        fwd = np.flatnonzero(dist_to_target[nb] < here)[:limit]
+        rows, legs = nb[fwd], self.leg_km[u][fwd]
+
+        complete = self.k == len(self) - 1
+        reach = self.radius_km[u] * (1 - SPHERE_REL_ERR)
+        if complete or (len(rows) == limit and legs[-1] <= reach):
+            return rows, legs, fwd
+        margin = (1 + SPHERE_REL_ERR) / (1 - SPHERE_REL_ERR)
+        if 2 * float(here) * margin**2 <= reach:
+            # Every airport closer to the target lies within twice `here` of `u`, so
+            # the list holds the index's answer; the moves are priced like it, too.
+            return rows, legs, None
+
+        # Neighbour list is too short around `u`: fall back to the spatial index,
+        # once per airport for distances that cannot change (replanning to a target).
+        memo = self._fallback_memo(dist_to_target)
+        found = memo.get((u, limit)) if memo is not None else None
+        if found is None:
+            found = self._index_moves(u, dist_to_target, limit)
+            if memo is not None:
+                memo[(u, limit)] = found
+        return found[0], found[1], None
+
+    def _fallback_memo(
+        self, dist_to_target: np.ndarray
+    ) -> Optional[Dict[Tuple[int, int], tuple]]:
+        """Remembered index fallbacks for a read-only distance array (None if writable)."""
+        if dist_to_target.flags.writeable:
+            return None
+        key = id(dist_to_target)
+        with self._fallback_lock:
+            entry = self._fallbacks.get(key)
+            if entry is None:
+                entry = self._fallbacks[key] = (dist_to_target, {})
+                while len(self._fallbacks) > FALLBACK_TARGETS:
+                    self._fallbacks.popitem(last=False)
+            else:
+                self._fallbacks.move_to_end(key)
+        return entry[1]
+
+    def _index_moves(
+        self, u: int, dist_to_target: np.ndarray, limit: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """The `limit` nearest airports closer to the target from the spatial index."""
+        here = dist_to_target[u]
+        mask = dist_to_target < here
+        mask[u] = False
+        cand, sph = self.index.nearest(self.lat[u], self.lon[u], limit, mask=mask)
+        if len(cand) == limit:
+            margin = (1 + SPHERE_REL_ERR) / (1 - SPHERE_REL_ERR)
+            cand, _ = self.index.within(
+                self.lat[u], self.lon[u], sph[-1] * margin, mask=mask
+            )
+        legs = ellipsoidal_km(self.lat[u], self.lon[u], self.lat[cand], self.lon[cand])
+        order = np.argsort(legs, kind="stable")[:limit]
+        return cand[order], legs[order]
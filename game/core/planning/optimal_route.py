@@ -0,0 +1,134 @@
+"""Compute minimum-fuel flight routes with A* search.
+
+Unlike the greedy rule route, this planner returns the cheapest path a
+player can actually fly under the game's cost model
+(`fuel_fixed + fuel_per_km * leg_km` per leg) and move rule (each hop goes
+to one of the `k_neighbors` nearest airports that are closer to the target).
+With `WeatherCosts`, legs are priced with the fuel expected under the
+current weather instead.
+
+Includes:
+    - `compute_optimal_route`: A* over a precomputed `NeighborGraph`.
+"""
+
+from heapq import heappush, heappop
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+from game.core.entities.airport import Airport
+from game.core.entities.airport_table import as_table
+from game.utils.distance import ellipsoidal_km
+from .airport_index import AirportIndex
+from .neighbor_graph import NeighborGraph
+from .player_rule_route import RouteResult
+from .weather_costs import WeatherCosts
+
+# Shrinks the heuristic by more than the distance approximation error so it
+# never overestimates the remaining cost.
+_HEURISTIC_SLACK: float = 1e-4
+
+
+def compute_optimal_route(
+    start_airport: Airport,
+    target_airport: Airport,
+    all_airports: Iterable[Airport],
+    fuel_per_km: float,
+    fuel_fixed: float,
+    k_neighbors: int = 5,
+    index: Optional[AirportIndex] = None,
+    target_dist_km: Optional[np.ndarray] = None,
+    graph: Optional[NeighborGraph] = None,
+    costs: Optional[WeatherCosts] = None,
+) -> RouteResult:
+    """
+    Compute the minimum-fuel route between two airports.
+
+    The heuristic is the fuel for one more leg plus the great-circle distance
+    to the target, which is a lower bound on any remaining path, so the
+    returned route is optimal. Under weather the heuristic is scaled by the
+    smallest possible leg factor, which keeps it a lower bound.
+
+    Args:
+        start_airport: Starting airport.
+        target_airport: Destination airport.
+        all_airports: AirportTable (or iterable) of available airports.
+        fuel_per_km: Fuel cost per kilometer.
+        fuel_fixed: Fixed cost per leg.
+        k_neighbors: Number of nearest forward airports reachable from each airport.
+        index: Spatial index built over `all_airports` (built on demand if omitted).
+        target_dist_km: Distance from every airport to the target (computed if omitted).
+        graph: Neighbour graph built over `all_airports` (built on demand if omitted).
+        costs: Weather prices over `graph`, updated to the planning frame; the
+            route then minimizes expected fuel (`expected_fuel` of the result).
+
+    Returns:
+        RouteResult: Result with path, distance, hops, fuel usage, and success flag.
+    """
+    airports = as_table(all_airports)
+    if not len(airports):
+        return RouteResult([], 0, 0.0, 0.0, False, "no airports")
+
+    s = airports.row_of(start_airport.icao)
+    t = airports.row_of(target_airport.icao)
+    if s is None or t is None:
+        return RouteResult([], 0, 0.0, 0.0, False, "start/target not in list")
+    if s == t:
+        return RouteResult([airports[s]], 0, 0.0, 0.0, True, "start==target")
+
+    if graph is None and costs is not None:
+        graph = costs.edges.graph
+    if graph is None or len(graph) != len(airports):
+        if index is None or len(index) != len(airports):
+            index = AirportIndex.from_airports(airports)
+        graph = NeighborGraph(airports, index, k=max(16, 3 * k_neighbors))
+    if target_dist_km is None or len(target_dist_km) != len(airports):
+        target_dist_km = ellipsoidal_km(
+            graph.lat, graph.lon, target_airport.lat, target_airport.lon
+        )
+
+    if costs is not None and costs.edges.graph is not graph:
+        raise ValueError("Weather costs were built over a different graph")
+    limit = max(1, k_neighbors)
+    h_scale = (1 - _HEURISTIC_SLACK) * (costs.min_factor() if costs is not None else 1.0)
+    h_fixed = fuel_fixed * h_scale
+    h_per_km = fuel_per_km * h_scale
+
+    def heuristic(u: int) -> float:
+        return h_fixed + h_per_km * float(target_dist_km[u]) if u != t else 0.0
+
+    best_cost: Dict[int, float] = {s: 0.0}
+    came_from: Dict[int, Tuple[int, float]] = {}
+    closed = set()
+    open_heap = [(heuristic(s), 0.0, s)]
+    while open_heap:
+        _, cost, u = heappop(open_heap)
+        if u == t:
+            break
+        if u in closed:
+            continue
+        closed.add(u)
+
+        moves, legs, positions = graph.forward_edges(u, target_dist_km, limit)
+        prices = fuel_fixed + fuel_per_km * legs
+        if costs is not None:
+            prices = prices * costs.factors(u, moves, positions)
+        for v, leg_km, price in zip(moves.tolist(), legs.tolist(), prices.tolist()):
+            new_cost = cost + price
+            if new_cost < best_cost.get(v, float("inf")):
+                best_cost[v] = new_cost
+                came_from[v] = (u, leg_km)
+                heappush(open_heap, (new_cost + heuristic(v), new_cost, v))
+
+    if t not in came_from:
+        return RouteResult([airports[s]], 0, 0.0, 0.0, False, "no forward options")
+
+    path_rows, total_km = [t], 0.0
+    while path_rows[-1] != s:
+        prev, leg_km = came_from[path_rows[-1]]
+        total_km += leg_km
+        path_rows.append(prev)
+    path = [airports[r] for r in reversed(path_rows)]
+    hops = len(path) - 1
+    if costs is None:
+        return RouteResult(path, hops, total_km, best_cost[t], True, "ok")
+    base_fuel = fuel_fixed * hops + fuel_per_km * total_km
+    return RouteResult(path, hops, total_km, base_fuel, True, "ok", expected_fuel=best_cost[t])
@@ -1,18 +1,23 @@
 """Compute player flight routes based on distance and fuel rules.
 
 This module provides a simple pathfinding algorithm used to estimate
-a player's possible flight route between airports.
+a player's possible flight route between airports. Nearby candidates
+come from the neighbour graph (when built) or the shared `AirportIndex`
+instead of scanning every airport.
 
 Includes:
     - `RouteResult`: dataclass describing route metrics.
-    - `_km`: distance helper using `geopy`.
     - `compute_player_rule_route`: main function implementing the rule-based routing.
 """
 
 from dataclasses import dataclass
-from typing import Iterable, List
-from geopy.distance import geodesic
+from typing import Iterable, List, Optional
+import numpy as np
 from game.core.entities.airport import Airport
+from game.core.entities.airport_table import as_table
+from game.utils.distance import one_to_many_km
+from .airport_index import AirportIndex, forward_neighbors
+from .neighbor_graph import NeighborGraph
 
 
 @dataclass
@@ -25,11 +30,8 @@ class RouteResult:
     base_fuel: float
     success: bool
     message: str = ""
-
-
-def _km(a: Airport, b: Airport) -> float:
-    """Return the great-circle distance between two airports in kilometers."""
-    return geodesic((a.lat, a.lon), (b.lat, b.lon)).km
+    # Fuel expected under the weather the route was planned for (weather-aware planning only).
+    expected_fuel: Optional[float] = None
 
 
 def compute_player_rule_route(
@@ -39,6 +41,9 @@ def compute_player_rule_route(
     fuel_per_km: float,
     fuel_fixed: float,
     k_neighbors: int = 5,
+    index: Optional[AirportIndex] = None,
+    target_dist_km: Optional[np.ndarray] = None,
+    graph: Optional[NeighborGraph] = None,
 ) -> RouteResult:
     """
     Compute a simple greedy route between two airports.
@@ -46,38 +51,37 @@ def compute_player_rule_route(
     Args:
         start_airport: Starting airport.
         target_airport: Destination airport.
-        all_airports: Iterable of available airports.
+        all_airports: AirportTable (or iterable) of available airports.
         fuel_per_km: Fuel cost per kilometer.
         fuel_fixed: Fixed cost per leg.
         k_neighbors: Number of nearest candidates to consider.
+        index: Spatial index built over `all_airports` (built on demand if omitted).
+        target_dist_km: Distance from every airport to the target (computed if omitted).
+        graph: Neighbour graph over `all_airports`, narrows the candidates when given.
 
     Returns:
         RouteResult: Result with path, distance, hops, fuel usage, and success flag.
     """
-    airports = list(all_airports)
-    if not airports:
+    airports = as_table(all_airports)
+    if not len(airports):
         return RouteResult([], 0, 0.0, 0.0, False, "no airports")
 
-    # try to find start/target by object identity, otherwise by ICAO code
-    def idx_of(x: Airport) -> int:
-        try:
-            return airports.index(x)
-        except ValueError:
-            for i, a in enumerate(airports):
-                if a.icao == x.icao:
-                    return i
-            return -1
-
-    s = idx_of(start_airport)
-    t = idx_of(target_airport)
-    if s < 0 or t < 0:
+    s = airports.row_of(start_airport.icao)
+    t = airports.row_of(target_airport.icao)
+    if s is None or t is None:
         return RouteResult([], 0, 0.0, 0.0, False, "start/target not in list")
     if s == t:
         a = airports[s]
         return RouteResult([a], 0, 0.0, 0.0, True, "start==target")
 
+    if index is None or len(index) != len(airports):
+        index = AirportIndex.from_airports(airports)
+
     cur = airports[s]
     target = airports[t]
+    if target_dist_km is None or len(target_dist_km) != len(airports):
+        target_dist_km = one_to_many_km(target.lat, target.lon, airports.lat, airports.lon)
+    cur_row = s
     path = [cur]
     total_km = 0.0
     total_fuel = 0.0
@@ -85,18 +89,21 @@ def compute_player_rule_route(
     # simple loop: at each step take K nearest candidates that move closer to the target,
     # and pick the one with the maximum distance reduction (tie-breaker: lower hop cost).
     while cur.icao != target.icao:
-        cur_to_target = _km(cur, target)
-
-        # candidates that actually reduce the distance to the target
-        cand = []
-        for a in airports:
-            if a.icao == cur.icao:
-                continue
-            nxt_to_target = _km(a, target)
-            if nxt_to_target >= cur_to_target:
-                continue
-            leg_km = _km(cur, a)
-            cand.append((leg_km, a, nxt_to_target))
+        cur_to_target = float(target_dist_km[cur_row])
+
+        # the k nearest candidates that actually reduce the distance to the target
+        nearest = forward_neighbors(
+            index,
+            airports,
+            origin=cur,
+            target=target,
+            dist_to_target=target_dist_km,
+            max_target_km=cur_to_target,
+            limit=max(1, k_neighbors),
+            exclude_row=cur_row,
+            graph=graph,
+        )
+        cand = [(leg_km, row, float(target_dist_km[row])) for row, leg_km in nearest]
 
         if not cand:
             return RouteResult(
@@ -108,23 +115,20 @@ def compute_player_rule_route(
                 "no forward options",
             )
 
-        # take the k nearest by current leg distance
-        cand.sort(key=lambda x: x[0])
-        cand = cand[: max(1, k_neighbors)]
-
         # selection: maximize distance reduction (delta); if equal, minimize hop cost
-        best_leg, best_airport = None, None
+        best_leg, best_row = None, None
         best_delta, best_cost = -1.0, float("inf")
-        for leg_km, a, nxt_to_target in cand:
+        for leg_km, row, nxt_to_target in cand:
             delta = cur_to_target - nxt_to_target
             hop_cost = fuel_fixed + fuel_per_km * leg_km
             if (delta > best_delta) or (delta == best_delta and hop_cost < best_cost):
                 best_delta, best_cost = delta, hop_cost
-                best_leg, best_airport = leg_km, a
+                best_leg, best_row = leg_km, row
 
         total_km += best_leg  # type: ignore
         total_fuel += fuel_fixed + fuel_per_km * best_leg  # type: ignore
-        cur = best_airport  # type: ignore
+        cur_row = best_row  # type: ignore
+        cur = airports[cur_row]
         path.append(cur)
 
     hops = max(0, len(path) - 1)
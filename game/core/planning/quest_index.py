@@ -0,0 +1,168 @@
+"""
+core/planning/quest_index.py
+============================
+Quest targets grouped by difficulty, from a precomputed route table.
+
+A difficulty is a band of route-cost percentiles among the targets a start
+can reach ("medium" is the middle third of its ideal fuel costs),
+optionally narrowed to an ideal distance and hop range. For every start
+the index keeps the targets of a difficulty in one flat array with
+per-start offsets, so drawing a quest is a single random index. Only
+targets the planner connects are listed, so issued quests never need a
+fallback route. When no target of a start matches the requested difficulty,
+`QuestIndex.sample` quietly widens it to any reachable target.
+
+Difficulties are written as comma-separated terms, e.g.
+"medium,300-600km,3-5hops":
+
+    easy / medium / hard    cheapest, middle or most expensive third of the
+                            start's reachable targets (default: all of them)
+    <a>-<b>km               ideal route length in km (inclusive)
+    <a>-<b>hops             ideal route hops (inclusive)
+
+Includes:
+    - `QuestDifficulty`: percentile band plus distance and hop ranges.
+    - `parse_difficulty`: parse a difficulty string (cached).
+    - `QuestIndex`: per-start target buckets over a `RouteTable`.
+"""
+
+from __future__ import annotations
+import math
+import random
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+import numpy as np
+from .route_table import RouteTable
+
+# Percentile bands of the named difficulties.
+BANDS: Dict[str, Tuple[float, float]] = {
+    "easy": (0.0, 1 / 3),
+    "medium": (1 / 3, 2 / 3),
+    "hard": (2 / 3, 1.0),
+}
+# Starts processed per block when a bucket is built (bounds temporary arrays).
+_BLOCK_STARTS = 1024
+
+
+@dataclass(frozen=True)
+class QuestDifficulty:
+    """Which targets of a start make a quest (see the module docstring)."""
+
+    band: Tuple[float, float] = (0.0, 1.0)
+    km: Tuple[float, float] = (0.0, math.inf)
+    hops: Tuple[int, int] = (1, 2**31 - 1)
+
+
+@lru_cache(maxsize=64)
+def parse_difficulty(text: str) -> QuestDifficulty:
+    """
+    Parse a difficulty such as "hard" or "medium,300-600km,3-5hops".
+
+    Raises:
+        ValueError: On an unknown term or a malformed range.
+    """
+    band, km, hops = (0.0, 1.0), (0.0, math.inf), (1, 2**31 - 1)
+    for term in (t.strip().lower() for t in text.split(",")):
+        if not term or term == "any":
+            continue
+        if term in BANDS:
+            band = BANDS[term]
+            continue
+        unit = "km" if term.endswith("km") else "hops" if term.endswith("hops") else None
+        lo, sep, hi = term[: -len(unit)].partition("-") if unit else ("", "", "")
+        try:
+            if unit == "km" and sep:
+                km = (float(lo), float(hi))
+                continue
+            if unit == "hops" and sep:
+                hops = (int(lo), int(hi))
+                continue
+        except ValueError:
+            pass
+        raise ValueError(f"Unknown quest difficulty term: {term!r}")
+    return QuestDifficulty(band, km, hops)
+
+
+class QuestIndex:
+    """Quest targets of every start, bucketed by difficulty, over one route table."""
+
+    def __init__(self, table: RouteTable) -> None:
+        """
+        Index the routes of `table` (buckets are built on first use).
+
+        Args:
+            table (RouteTable): Precomputed routes between every pair of airports.
+        """
+        self.table = table
+        # Difficulty -> (targets of all starts, per-start offsets into them).
+        self._buckets: Dict[QuestDifficulty, Tuple[np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, difficulty: QuestDifficulty) -> Tuple[np.ndarray, np.ndarray]:
+        """Targets matching `difficulty` for every start, as flat rows plus offsets."""
+        found = self._buckets.get(difficulty)
+        if found is None:
+            with self._lock:
+                found = self._buckets.get(difficulty)
+                if found is None:
+                    found = self._buckets[difficulty] = self._build(difficulty)
+        return found
+
+    def _build(self, difficulty: QuestDifficulty) -> Tuple[np.ndarray, np.ndarray]:
+        """Select the matching targets of every start, a block of starts at a time."""
+        table = self.table
+        n = len(table)
+        lo, hi = difficulty.band
+        parts, counts = [], np.zeros(n, dtype=np.int64)
+        for first in range(0, n, _BLOCK_STARTS):
+            starts = np.arange(first, min(n, first + _BLOCK_STARTS))
+            # Table arrays are (target, start); work on (start, target) blocks.
+            ok = np.array(table.reached[:, starts].T)
+            ok[np.arange(len(starts)), starts] = False
+            cost = np.where(ok, table.cost[:, starts].T, np.inf)
+            # Percentile of every target's cost among the start's reachable targets.
+            order = np.argsort(cost, axis=1, kind="stable")
+            rank = np.empty_like(order)
+            np.put_along_axis(rank, order, np.arange(n)[None, :].repeat(len(starts), 0), 1)
+            pct = rank / np.maximum(ok.sum(axis=1), 1)[:, None]
+            km = table.km[:, starts].T
+            hops = table.hops[:, starts].T
+            sel = (
+                ok
+                & (pct >= lo)
+                & ((pct < hi) | (hi >= 1.0))
+                & (km >= difficulty.km[0])
+                & (km <= difficulty.km[1])
+                & (hops >= difficulty.hops[0])
+                & (hops <= difficulty.hops[1])
+            )
+            rows, targets = np.nonzero(sel)
+            counts[starts] = np.bincount(rows, minlength=len(starts))
+            parts.append(targets.astype(np.int32))
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return np.concatenate(parts) if parts else np.empty(0, np.int32), offsets
+
+    def count(self, start_row: int, difficulty: QuestDifficulty) -> int:
+        """Number of targets of `start_row` matching `difficulty`."""
+        _, offsets = self.bucket(difficulty)
+        return int(offsets[start_row + 1] - offsets[start_row])
+
+    def sample(
+        self, start_row: int, difficulty: QuestDifficulty, rng: random.Random
+    ) -> Optional[int]:
+        """
+        Draw a target row for a quest from `start_row`.
+
+        Falls back to any reachable target (without telling the caller) when
+        no target matches `difficulty`; None when the start reaches no
+        airport at all, as every listed target is reachable.
+        """
+        for wanted in (difficulty, QuestDifficulty()):
+            targets, offsets = self.bucket(wanted)
+            lo, hi = int(offsets[start_row]), int(offsets[start_row + 1])
+            if hi > lo:
+                return int(targets[lo + rng.randrange(hi - lo)])
+        return None
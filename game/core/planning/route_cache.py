@@ -0,0 +1,199 @@
+"""
+core/planning/route_cache.py
+============================
+Memo for planned quest routes.
+
+A planned route depends only on the planner, the start and target
+airports, the fuel constants, the neighbour count, the distance tier, the
+airport set and (for weather-aware planning) the weather frame, so results
+are memoized under exactly that key. The
+airport set is identified by `AirportTable.fingerprint()`. Recent routes
+live in a bounded in-process LRU; an optional SQLite file keeps them
+across processes and restarts.
+
+Includes:
+    - `RouteCacheStats`: hit/miss/eviction counters.
+    - `RouteCache`: thread-safe LRU with an optional persistent tier.
+    - `get_route_cache`: process-wide cache configured from `game.config`.
+"""
+
+from __future__ import annotations
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+from game import config
+from .player_rule_route import RouteResult
+
+RouteKey = Tuple[str, str, str, float, float, int, str, str, str]
+
+
+@dataclass
+class RouteCacheStats:
+    """Counters describing route cache usage."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    capacity: int = 0
+
+
+def route_key(
+    planner: str,
+    start_icao: str,
+    target_icao: str,
+    fuel_per_km: float,
+    fuel_fixed: float,
+    k_neighbors: int,
+    distance_tier: str,
+    fingerprint: str,
+    weather: str = "",
+) -> RouteKey:
+    """
+    Build the cache key for one planning request.
+
+    `weather` identifies the weather frame a weather-aware route was priced
+    under; it is empty for planners that ignore the weather.
+    """
+    return (
+        planner,
+        start_icao,
+        target_icao,
+        fuel_per_km,
+        fuel_fixed,
+        k_neighbors,
+        distance_tier,
+        fingerprint,
+        weather,
+    )
+
+
+class RouteCache:
+    """Bounded LRU of planned routes, optionally backed by an SQLite file."""
+
+    def __init__(self, capacity: int = 4096, path: Optional[str] = None) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            capacity (int): Routes kept in memory (0 disables the memory tier).
+            path (Optional[str]): SQLite file for the persistent tier (None = memory only).
+        """
+        self.capacity = max(0, capacity)
+        self._routes: "OrderedDict[RouteKey, RouteResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = RouteCacheStats(capacity=self.capacity)
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            # Several processes (simulation workers) may share the file;
+            # SQLite serializes their writes.
+            self._db = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS route (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+                )
+
+    def get_or_compute(self, key: RouteKey, compute: Callable[[], RouteResult]) -> RouteResult:
+        """
+        Return the cached route for `key`, computing and storing it on a miss.
+
+        The returned RouteResult is shared between callers and must not be modified.
+
+        Args:
+            key (RouteKey): Key from `route_key`.
+            compute (Callable[[], RouteResult]): Planner call producing the route.
+        """
+        route = self.get(key)
+        if route is None:
+            route = compute()
+            self.put(key, route)
+        return route
+
+    def get(self, key: RouteKey) -> Optional[RouteResult]:
+        """Look a route up in memory, then on disk; counts a hit or a miss."""
+        with self._lock:
+            route = self._routes.get(key)
+            if route is not None:
+                self._routes.move_to_end(key)
+                self._stats.hits += 1
+                return route
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM route WHERE key = ?", (_disk_key(key),)
+                ).fetchone()
+                if row is not None:
+                    route = pickle.loads(row[0])
+                    self._remember(key, route)
+                    self._stats.disk_hits += 1
+                    return route
+            self._stats.misses += 1
+            return None
+
+    def put(self, key: RouteKey, route: RouteResult) -> None:
+        """Store a route in memory and, when enabled, on disk."""
+        with self._lock:
+            self._remember(key, route)
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO route (key, value) VALUES (?, ?)",
+                        (_disk_key(key), pickle.dumps(route, protocol=pickle.HIGHEST_PROTOCOL)),
+                    )
+
+    def _remember(self, key: RouteKey, route: RouteResult) -> None:
+        """Insert into the LRU, evicting the least recently used routes (lock held)."""
+        if not self.capacity:
+            return
+        self._routes[key] = route
+        self._routes.move_to_end(key)
+        while len(self._routes) > self.capacity:
+            self._routes.popitem(last=False)
+            self._stats.evictions += 1
+
+    def stats(self) -> RouteCacheStats:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return RouteCacheStats(
+                hits=self._stats.hits,
+                disk_hits=self._stats.disk_hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._routes),
+                capacity=self.capacity,
+            )
+
+    def clear(self) -> None:
+        """Drop the in-memory routes (the persistent tier is kept)."""
+        with self._lock:
+            self._routes.clear()
+
+    def close(self) -> None:
+        """Close the persistent tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def _disk_key(key: RouteKey) -> str:
+    """Text form of a key for the SQLite table (floats via repr round-trip exactly)."""
+    return "|".join(repr(part) for part in key)
+
+
+_cache: Optional[RouteCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_route_cache() -> RouteCache:
+    """Return the process-wide route cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = RouteCache(config.ROUTE_CACHE_SIZE, config.ROUTE_CACHE_PATH or None)
+        return _cache
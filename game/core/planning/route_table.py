@@ -0,0 +1,341 @@
+"""
+core/planning/route_table.py
+============================
+Precomputed ideal routes between every pair of airports.
+
+The game's move rule only allows hops that get closer to the quest target,
+so the moves towards one target form a DAG ordered by distance to it.
+Walking the airports from the target outwards therefore yields the route
+every start would get from a planner in a single pass: the greedy choice
+for the "rule" planner, the cheapest continuation for the "optimal" one.
+`routes_to_target` runs that pass for one target; `game.routes` runs it
+for every target across a process pool and stores the result.
+
+A route table is a directory of memory-mappable NumPy arrays, all of shape
+(targets, starts) and indexed by airport table row::
+
+    meta.json       version, planner, fuel constants, neighbour count,
+                    distance tier, airport fingerprint and row count
+    cost.npy        float64 fuel of the route (base fuel, no weather)
+    km.npy          float64 length of the route
+    hops.npy        int32 hops of the route
+    next.npy        int32 next airport of the route (-1 at its end)
+    reached.npy     bool, True when the route reaches the target
+
+For pairs the planner cannot connect the arrays describe the partial route
+it returns instead. Tables live under `config.ROUTE_TABLE_DIR` in a
+directory named after the planner and the airport-set fingerprint.
+
+Includes:
+    - `routes_to_target`: routes of every start to one target.
+    - `RouteTable`: O(1) lookups and path reconstruction over stored arrays.
+    - `table_settings`: everything a stored table depends on.
+    - `route_table_path`: directory of the table for a planner and settings.
+    - `load_route_table`: open a stored table, or None if missing or stale.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from game.core.entities.airport import Airport
+from game.core.entities.airport_table import AirportTable
+from game.utils.distance import batch_km, one_to_many_km
+from .airport_index import SPHERE_REL_ERR, AirportIndex, forward_neighbors
+from .neighbor_graph import NeighborGraph
+from .player_rule_route import RouteResult
+
+ROUTE_TABLE_VERSION: int = 1
+# Planners whose routes depend only on the airports and the settings.
+TABLE_PLANNERS: Tuple[str, ...] = ("rule", "optimal")
+# Stored arrays and their dtypes.
+ARRAYS: Dict[str, str] = {
+    "cost": "float64",
+    "km": "float64",
+    "hops": "int32",
+    "next": "int32",
+    "reached": "bool",
+}
+
+
+def _moves_to_target(
+    planner: str,
+    airports: AirportTable,
+    index: AirportIndex,
+    graph: NeighborGraph,
+    target: Airport,
+    dist: np.ndarray,
+    limit: int,
+) -> List[List[Tuple[int, float]]]:
+    """
+    Moves `planner` considers from every airport towards one target, nearest first.
+
+    Rows whose stored neighbour list provably holds their moves are served
+    from the graph for all rows at once: the first `limit` forward neighbours
+    for "optimal" (as `NeighborGraph.forward_edges`), the `limit` nearest by
+    the configured distance tier among the forward neighbours within the
+    error margin for "rule" (as `forward_neighbors`). The other rows run the
+    planner's own query.
+    """
+    n = len(airports)
+    moves: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+    if graph.k == 0:
+        return moves
+    nb, legs = graph.neighbors, graph.leg_km
+    rows = np.arange(n)
+    fwd = dist[nb] < dist[:, None]
+    rank = np.cumsum(fwd, axis=1)
+    enough = rank[:, -1] >= limit
+    # Leg of the limit-th forward neighbour (inf when a row has fewer).
+    kth_leg = np.where(enough, legs[rows, np.argmax(rank >= limit, axis=1)], np.inf)
+    complete = graph.k == n - 1
+    if planner == "rule":
+        margin = (1 + SPHERE_REL_ERR) / (1 - SPHERE_REL_ERR)
+        bound = kth_leg * margin
+        picked = fwd & (legs <= bound[:, None])
+    else:
+        bound = kth_leg
+        picked = fwd & (rank <= limit)
+    fast = complete | (enough & (bound <= graph.radius_km * (1 - SPHERE_REL_ERR)))
+
+    us, js = np.nonzero(picked & fast[:, None])
+    vs = nb[us, js]
+    if planner == "rule":
+        leg_km = batch_km(graph.lat[us], graph.lon[us], graph.lat[vs], graph.lon[vs])
+        order = np.lexsort((leg_km, us))
+        us, vs, leg_km = us[order], vs[order], leg_km[order]
+        keep = np.arange(len(us)) - np.searchsorted(us, us) < limit
+        us, vs, leg_km = us[keep], vs[keep], leg_km[keep]
+    else:
+        leg_km = legs[us, js]
+    for u, v, leg in zip(us.tolist(), vs.tolist(), leg_km.tolist()):
+        moves[u].append((v, leg))
+
+    for u in np.flatnonzero(~fast).tolist():
+        if planner == "rule":
+            moves[u] = forward_neighbors(
+                index,
+                airports,
+                origin=airports[u],
+                target=target,
+                dist_to_target=dist,
+                max_target_km=float(dist[u]),
+                limit=limit,
+                exclude_row=u,
+            )
+        else:
+            rows_u, legs_u, _ = graph.forward_edges(u, dist, limit)
+            moves[u] = list(zip(rows_u.tolist(), legs_u.tolist()))
+    return moves
+
+
+def routes_to_target(
+    planner: str,
+    airports: AirportTable,
+    target_row: int,
+    fuel_per_km: float,
+    fuel_fixed: float,
+    k_neighbors: int,
+    index: AirportIndex,
+    graph: NeighborGraph,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the route of `planner` from every airport to one target.
+
+    Candidates are the moves the planners' own queries return, so every
+    route matches `compute_player_rule_route` ("rule") or
+    `compute_optimal_route` ("optimal") for the same settings.
+
+    Args:
+        planner (str): "rule" or "optimal".
+        airports (AirportTable): Airports in index row order.
+        target_row (int): Row of the target.
+        fuel_per_km (float): Fuel cost per kilometer.
+        fuel_fixed (float): Fixed cost per leg.
+        k_neighbors (int): Nearest forward airports reachable from each airport.
+        index (AirportIndex): Spatial index built over `airports`.
+        graph (NeighborGraph): Neighbour graph built over `airports`.
+
+    Returns:
+        Dict[str, np.ndarray]: One array per entry of `ARRAYS`, indexed by start row.
+    """
+    if planner not in TABLE_PLANNERS:
+        raise ValueError(f"Route planner {planner!r} cannot be precomputed")
+    n = len(airports)
+    target = airports[target_row]
+    dist = one_to_many_km(target.lat, target.lon, airports.lat, airports.lon)
+    moves = _moves_to_target(planner, airports, index, graph, target, dist, max(1, k_neighbors))
+
+    cost = [0.0] * n
+    km = [0.0] * n
+    hops = [0] * n
+    nxt = [-1] * n
+    reached = [False] * n
+    reached[target_row] = True
+    # Moves lead to airports strictly closer to the target: visit those first.
+    for u in np.argsort(dist, kind="stable").tolist():
+        if u == target_row:
+            continue
+        best_row, best_leg, best_price = None, 0.0, 0.0
+        if planner == "rule":
+            # Same selection as the greedy planner: largest gain, then the cheaper hop.
+            here = float(dist[u])
+            best_delta, best_cost = -1.0, float("inf")
+            for row, leg_km in moves[u]:
+                delta = here - float(dist[row])
+                hop_cost = fuel_fixed + fuel_per_km * leg_km
+                if (delta > best_delta) or (delta == best_delta and hop_cost < best_cost):
+                    best_delta, best_cost = delta, hop_cost
+                    best_row, best_leg, best_price = row, leg_km, hop_cost
+        else:
+            best_total = float("inf")
+            for v, leg_km in moves[u]:
+                price = fuel_fixed + fuel_per_km * leg_km
+                if reached[v] and price + cost[v] < best_total:
+                    best_total = price + cost[v]
+                    best_row, best_leg, best_price = v, leg_km, price
+        if best_row is None:
+            continue
+        nxt[u] = best_row
+        cost[u] = best_price + cost[best_row]
+        km[u] = best_leg + km[best_row]
+        hops[u] = 1 + hops[best_row]
+        reached[u] = reached[best_row]
+
+    values = {"cost": cost, "km": km, "hops": hops, "next": nxt, "reached": reached}
+    return {name: np.asarray(values[name], dtype=dtype) for name, dtype in ARRAYS.items()}
+
+
+def table_settings(
+    planner: str,
+    fuel_per_km: float,
+    fuel_fixed: float,
+    k_neighbors: int,
+    distance_tier: str,
+    fingerprint: str,
+) -> dict:
+    """Everything a stored table depends on (written to and checked against meta.json)."""
+    return {
+        "version": ROUTE_TABLE_VERSION,
+        "planner": planner,
+        "fuel_per_km": fuel_per_km,
+        "fuel_fixed": fuel_fixed,
+        "k_neighbors": k_neighbors,
+        "distance_tier": distance_tier,
+        "fingerprint": fingerprint,
+    }
+
+
+def route_table_path(
+    directory: str,
+    planner: str,
+    fuel_per_km: float,
+    fuel_fixed: float,
+    k_neighbors: int,
+    distance_tier: str,
+    fingerprint: str,
+) -> str:
+    """Return the directory of the table for a planner, its settings and an airport set."""
+    settings = table_settings(
+        planner, fuel_per_km, fuel_fixed, k_neighbors, distance_tier, fingerprint
+    )
+    raw = json.dumps(settings, sort_keys=True)
+    name = f"{planner}-{fingerprint[:16]}-{hashlib.sha1(raw.encode()).hexdigest()[:12]}"
+    return os.path.join(directory, name)
+
+
+class RouteTable:
+    """Stored routes between every pair of airports, served without planning."""
+
+    def __init__(
+        self, airports: AirportTable, arrays: Dict[str, np.ndarray], meta: dict
+    ) -> None:
+        """
+        Wrap loaded arrays (see `load_route_table`).
+
+        Args:
+            airports (AirportTable): Airports the table was built over.
+            arrays (Dict[str, np.ndarray]): Arrays named as in `ARRAYS`, (targets, starts).
+            meta (dict): Contents of meta.json.
+        """
+        self.airports = airports
+        self.meta = meta
+        self.planner: str = meta["planner"]
+        self.cost = arrays["cost"]
+        self.km = arrays["km"]
+        self.hops = arrays["hops"]
+        self.next = arrays["next"]
+        self.reached = arrays["reached"]
+
+    def __len__(self) -> int:
+        return len(self.airports)
+
+    def fuel(self, start_row: int, target_row: int) -> Optional[float]:
+        """Ideal base fuel from `start_row` to `target_row`, None if the planner fails."""
+        if not self.reached[target_row, start_row]:
+            return None
+        return float(self.cost[target_row, start_row])
+
+    def route(self, start_row: int, target_row: int) -> RouteResult:
+        """
+        Rebuild the planner's route between two rows from the next-hop pointers.
+
+        Returns:
+            RouteResult: Same result the planner returns for the pair.
+        """
+        airports = self.airports
+        if start_row == target_row:
+            return RouteResult([airports[start_row]], 0, 0.0, 0.0, True, "start==target")
+        column = self.next[target_row]
+        rows = [start_row]
+        while rows[-1] != target_row and column[rows[-1]] >= 0:
+            rows.append(int(column[rows[-1]]))
+        success = bool(self.reached[target_row, start_row])
+        return RouteResult(
+            [airports[r] for r in rows],
+            int(self.hops[target_row, start_row]),
+            float(self.km[target_row, start_row]),
+            float(self.cost[target_row, start_row]),
+            success,
+            "ok" if success else "no forward options",
+        )
+
+
+def load_route_table(
+    airports: AirportTable,
+    planner: str,
+    fuel_per_km: float,
+    fuel_fixed: float,
+    k_neighbors: int,
+    distance_tier: str,
+    directory: str,
+) -> Optional[RouteTable]:
+    """
+    Open the stored table for a planner and settings, or None if missing or stale.
+
+    The arrays are memory-mapped, so opening is cheap and pages are read
+    on first use.
+    """
+    fingerprint = airports.fingerprint()
+    path = route_table_path(
+        directory, planner, fuel_per_km, fuel_fixed, k_neighbors, distance_tier, fingerprint
+    )
+    expected = table_settings(
+        planner, fuel_per_km, fuel_fixed, k_neighbors, distance_tier, fingerprint
+    )
+    try:
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if any(meta.get(k) != v for k, v in expected.items()) or meta.get("rows") != len(airports):
+            return None
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in ARRAYS
+        }
+    except (OSError, ValueError):
+        return None
+    n = len(airports)
+    if any(a.shape != (n, n) or a.dtype != np.dtype(ARRAYS[k]) for k, a in arrays.items()):
+        return None
+    return RouteTable(airports, arrays, meta)
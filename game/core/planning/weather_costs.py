@@ -0,0 +1,157 @@
+"""
+core/planning/weather_costs.py
+==============================
+Expected-fuel edge prices of the neighbour graph under the current weather.
+
+A leg flown through weather burns `(fuel_fixed + fuel_per_km * km) * factor`,
+where the factor is one plus the mean fuel modifier of the weather cells
+along the leg plus the head/tailwind component (see
+`game.core.events.weather_field`). `WeatherEdges` samples every graph edge
+once and records the cells it crosses and its bearing; it is static and
+shared like the graph. `WeatherCosts` keeps the cell part of every edge
+factor for one weather frame and, when the frame changes, re-prices only
+the edges crossing a changed cell. The wind is global, so its part is
+applied when an edge is priced.
+
+Includes:
+    - `WeatherEdges`: cells and bearings of every neighbour-graph edge.
+    - `WeatherCosts`: incrementally updated edge factors for one planner.
+"""
+
+from __future__ import annotations
+import math
+from typing import Optional
+import numpy as np
+from game.core.events.weather_field import (
+    WIND_MODIFIER,
+    WeatherField,
+    WeatherFrame,
+    great_circle_points,
+)
+from .neighbor_graph import NeighborGraph
+
+# Edges are sampled in chunks to bound the temporary arrays.
+_CHUNK_EDGES = 65536
+
+
+class WeatherEdges:
+    """Weather cells crossed by every neighbour-graph edge, plus edge bearings."""
+
+    def __init__(self, graph: NeighborGraph, field: WeatherField) -> None:
+        """
+        Sample every edge of `graph` on the grid of `field`.
+
+        Args:
+            graph (NeighborGraph): Graph whose edges are priced.
+            field (WeatherField): Weather grid the edges are sampled on.
+        """
+        self.graph = graph
+        self.field = field
+        n, k = graph.neighbors.shape
+        src = np.repeat(np.arange(n), k)
+        dst = graph.neighbors.ravel()
+        # About two samples per cell along the longest stored leg.
+        longest_deg = float(graph.leg_km.max(initial=0.0)) / 111.0
+        self.samples = min(32, max(2, math.ceil(2 * longest_deg / field.cell_deg) + 1))
+
+        self.cells = np.empty((n * k, self.samples), dtype=np.int32)
+        bearing = np.empty(n * k)
+        for lo in range(0, n * k, _CHUNK_EDGES):
+            hi = min(n * k, lo + _CHUNK_EDGES)
+            s, d = src[lo:hi], dst[lo:hi]
+            lat, lon, bearing[lo:hi] = great_circle_points(
+                graph.lat[s], graph.lon[s], graph.lat[d], graph.lon[d], self.samples
+            )
+            rows, cols = field.cells(lat, lon)
+            self.cells[lo:hi] = rows * field.width + cols
+        self.cos_bearing = np.cos(bearing).reshape(n, k)
+        self.sin_bearing = np.sin(bearing).reshape(n, k)
+
+        # Inverted index: edges crossing each cell (CSR over the flattened grid).
+        flat = self.cells.ravel()
+        order = np.argsort(flat, kind="stable")
+        self._cell_edges = (order // self.samples).astype(np.int64)
+        self._cell_start = np.searchsorted(flat[order], np.arange(field.height * field.width + 1))
+
+    def edges_crossing(self, cells: np.ndarray) -> np.ndarray:
+        """Flat edge ids (`u * k + j`) crossing any of the given flat cell ids."""
+        if not len(cells):
+            return np.empty(0, dtype=np.int64)
+        starts, ends = self._cell_start[cells], self._cell_start[cells + 1]
+        counts = ends - starts
+        # Concatenate the CSR slices without a Python loop.
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        picked = self._cell_edges[offsets + np.arange(counts.sum())]
+        return np.unique(picked)
+
+
+class WeatherCosts:
+    """Edge fuel factors under one weather frame, re-priced incrementally."""
+
+    def __init__(self, edges: WeatherEdges) -> None:
+        """
+        Create unpriced costs (call `update` with a frame before planning).
+
+        Args:
+            edges (WeatherEdges): Shared edge samples.
+        """
+        self.edges = edges
+        self.frame: Optional[WeatherFrame] = None
+        n, k = edges.graph.neighbors.shape
+        # Mean cell modifier along every edge.
+        self.cell_mod = np.zeros((n, k), dtype=np.float64)
+        self._cell_mod_flat = self.cell_mod.reshape(-1)
+        # Edges re-priced by the last `update` (statistics).
+        self.repriced = 0
+
+    def update(self, frame: WeatherFrame) -> int:
+        """
+        Move to `frame`, re-pricing the edges that cross a changed cell.
+
+        Returns:
+            int: Number of edges re-priced.
+        """
+        modifier = frame.modifier.ravel()
+        if self.frame is None:
+            edges = np.arange(len(self._cell_mod_flat))
+        elif self.frame is frame:
+            edges = np.empty(0, dtype=np.int64)
+        else:
+            changed = np.flatnonzero(modifier != self.frame.modifier.ravel())
+            edges = self.edges.edges_crossing(changed)
+        if len(edges):
+            self._cell_mod_flat[edges] = modifier[self.edges.cells[edges]].mean(axis=1)
+        self.frame = frame
+        self.repriced = len(edges)
+        return self.repriced
+
+    def factors(self, u: int, rows: np.ndarray, positions: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Fuel factors of the legs from `u` to `rows`.
+
+        Legs at `positions` of `u`'s stored neighbour list use the maintained
+        prices; without positions (the planner's index fallback) the legs are
+        sampled on the frame directly. The wind is added to both.
+        """
+        frame = self.frame
+        if positions is not None:
+            cos_b = self.edges.cos_bearing[u, positions]
+            sin_b = self.edges.sin_bearing[u, positions]
+            cell_mod = self.cell_mod[u, positions]
+        else:
+            graph, field = self.edges.graph, self.edges.field
+            lat, lon, bearing = great_circle_points(
+                graph.lat[u], graph.lon[u], graph.lat[rows], graph.lon[rows], self.edges.samples
+            )
+            cr, cc = field.cells(lat, lon)
+            cell_mod = frame.modifier[cr, cc].mean(axis=1)
+            cos_b, sin_b = np.cos(bearing), np.sin(bearing)
+        wind = (WIND_MODIFIER * frame.wind_speed) * (
+            cos_b * math.cos(frame.wind_dir) + sin_b * math.sin(frame.wind_dir)
+        )
+        return 1.0 + cell_mod + wind
+
+    def min_factor(self) -> float:
+        """Lower bound of every leg factor under the current frame (for A* heuristics)."""
+        frame = self.frame
+        return 1.0 + float(frame.modifier.min()) - abs(WIND_MODIFIER) * frame.wind_speed
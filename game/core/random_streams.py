@@ -0,0 +1,57 @@
+"""
+core/random_streams.py
+======================
+Seeded random sources of one game.
+
+Every game owns independent streams for quest targets, weather and flavor
+text, all derived from a single seed. Drawing more flavor text (or adding
+a new event type) therefore never shifts the quests or the weather, and
+the seed alone reproduces a run.
+
+Includes:
+    - `RandomStreams`: the named `random.Random` streams of a game.
+    - `new_seed`: fresh seed for games started without one.
+"""
+
+from __future__ import annotations
+import hashlib
+import random
+from typing import Any, Dict, Optional
+
+STREAMS = ("quests", "weather", "flavor")
+
+
+def new_seed() -> int:
+    """Return a fresh non-negative 63-bit seed from the OS entropy source."""
+    return random.SystemRandom().getrandbits(63)
+
+
+def _stream_seed(seed: int, name: str) -> int:
+    """Derive the seed of stream `name`, independent of the other streams."""
+    digest = hashlib.sha256(f"{seed}/{name}".encode("ascii")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+class RandomStreams:
+    """Named random streams (`quests`, `weather`, `flavor`) derived from one seed."""
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Seed every stream.
+
+        Args:
+            seed (Optional[int]): Game seed; a fresh one is drawn when omitted.
+        """
+        self.seed: int = new_seed() if seed is None else int(seed)
+        self.quests = random.Random(_stream_seed(self.seed, "quests"))
+        self.weather = random.Random(_stream_seed(self.seed, "weather"))
+        self.flavor = random.Random(_stream_seed(self.seed, "flavor"))
+
+    def getstate(self) -> Dict[str, Any]:
+        """Return the internal state of every stream (see `random.Random.getstate`)."""
+        return {name: getattr(self, name).getstate() for name in STREAMS}
+
+    def setstate(self, state: Dict[str, Any]) -> None:
+        """Restore stream states returned by `getstate`."""
+        for name in STREAMS:
+            getattr(self, name).setstate(state[name])
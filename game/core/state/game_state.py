@@ -7,7 +7,7 @@ Includes `PlayerState` for current location, fuel, hops, and distance,
 and `GameState` for overall game progress, quests, points, and system messages.
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import List, Optional
 from game.core.entities.airport import Airport
 from game.core.entities.quest import Quest
@@ -34,5 +34,28 @@ class GameState:
     system_msg: str = ""
 
     def to_dict(self) -> dict:
-        """Return the game state as dictionary."""
-        return asdict(self)
+        """Return the game state as dictionary (same shape as `dataclasses.asdict`)."""
+        p = self.player
+        loc = p.location
+        return {
+            "player": {
+                "location": {
+                    "icao": loc.icao,
+                    "name": loc.name,
+                    "country": loc.country,
+                    "lat": loc.lat,
+                    "lon": loc.lon,
+                },
+                "fuel": p.fuel,
+                "hops": p.hops,
+                "km_total": p.km_total,
+            },
+            "active_quest": _quest_dict(self.active_quest) if self.active_quest else None,
+            "completed_quests": [_quest_dict(q) for q in self.completed_quests],
+            "points": self.points,
+            "system_msg": self.system_msg,
+        }
+
+
+def _quest_dict(quest: Quest) -> dict:
+    return {"target_icao": quest.target_icao, "status": quest.status}
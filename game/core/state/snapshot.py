@@ -0,0 +1,329 @@
+"""
+core/state/snapshot.py
+======================
+Compact, versioned binary snapshots of a running game.
+
+A snapshot holds everything needed to continue a game exactly where it
+was left: the `GameState` (player, quests, points, pending message), the
+quest-tracking fields of `Game` (ideal route, fuel used on the quest,
+weather factors, the quest planned in the background) and the random
+streams. Airports are stored as rows of the world's `AirportTable`, so a
+snapshot can only be restored against the same airport set; it carries
+the table fingerprint to check that.
+
+Layout (little endian):
+
+    head        magic "FGS", version:u8, fingerprint:8 bytes, seed:i64, flags:u8
+    core        location row:u32, fuel:f64, km total:f64, hops:u32, points:i32,
+                quest target row:i32 (-1 none), quest base fuel:f64,
+                quest fuel:f64, quest start km:f64, quest start hops:u32,
+                fuel factor:f64, fuel fixed:f64, total fuel used:f64,
+                weather start tick:u32
+    counts      completed quests:u32, quest scores:u32, system message bytes:u32
+    arrays      completed target rows:u32[], quest scores:i32[], message (UTF-8)
+    route       if flagged: hops:u32, km:f64, base fuel:f64,
+                expected fuel:f64 (NaN when not weather-priced), path length:u32,
+                message bytes:u32, path rows:u32[], message (UTF-8)
+    prefetch    if flagged: target row:u32, weather tick:u32
+    streams     per stream: Mersenne Twister state:u32[625], gauss flag:u8, gauss:f64
+
+Derived data (distances to the target, the current turn's options) is not
+stored; the game rebuilds it on the next turn.
+
+Includes:
+    - `dump_game`: snapshot a started game to bytes.
+    - `load_game`: restore a snapshot into a game sharing the same world.
+"""
+
+from __future__ import annotations
+import math
+import struct
+from array import array
+from typing import TYPE_CHECKING, List
+from game.core.entities.airport_table import AirportTable
+from game.core.entities.quest import Quest, QuestStatus
+from game.core.planning.player_rule_route import RouteResult
+from game.core.planning.route_cache import get_route_cache
+from game.core.random_streams import STREAMS
+from game.core.state.game_state import GameState, PlayerState
+from game.core.world import World
+
+if TYPE_CHECKING:
+    from game.core.game import Game
+
+MAGIC = b"FGS"
+VERSION = 4
+
+_RUNNING = 1
+_ROUTE = 2
+_ROUTE_SUCCESS = 4
+_PREFETCH = 8
+
+_HEAD = struct.Struct("<3sB8sqB")
+_CORE = struct.Struct("<IddIiidddIdddI")
+_COUNTS = struct.Struct("<III")
+_ROUTE_HEAD = struct.Struct("<IdddII")
+_PREFETCH_ROW = struct.Struct("<II")
+_GAUSS = struct.Struct("<Bd")
+# Mersenne Twister words plus the position in them (see `random.getstate`).
+_MT_WORDS = 625
+
+
+def _row(airports: AirportTable, icao: str) -> int:
+    """Table row of `icao`; snapshots can only refer to loaded airports."""
+    row = airports.row_of(icao)
+    if row is None:
+        raise ValueError(f"Airport {icao} is not in the world's airport table")
+    return row
+
+
+def _read_array(code: str, view: memoryview, pos: int, count: int) -> array:
+    """Read `count` items of array type `code` at byte offset `pos`."""
+    out = array(code)
+    out.frombytes(view[pos : pos + out.itemsize * count])
+    if len(out) != count:
+        raise ValueError("Truncated game snapshot")
+    return out
+
+
+def _restore_route(
+    game: Game, airports: AirportTable, path: array, stored: RouteResult
+) -> RouteResult:
+    """
+    Return the ideal route of a restored quest.
+
+    Routes are shared through the route cache, so the cached result is
+    reused when it matches; otherwise `stored` gets its path from the rows.
+    """
+    if len(path) >= 2:
+        # Weather-priced routes are keyed by the tick they were planned at; the
+        # quest's start tick finds the ones that were not prefetched.
+        tick = game._weather_tick0 + game._quest_start_hops
+        key = game._route_key(airports.icao[path[0]], airports.icao[path[-1]], tick)
+        cached = get_route_cache().get(key)
+        if (
+            cached is not None
+            and cached.hops == stored.hops
+            and cached.base_fuel == stored.base_fuel
+            and cached.success == stored.success
+            and cached.expected_fuel == stored.expected_fuel
+        ):
+            return cached
+    stored.path = [airports[r] for r in path]
+    return stored
+
+
+def dump_game(game: Game) -> bytes:
+    """
+    Snapshot a started game.
+
+    Args:
+        game (Game): Game to save (not modified).
+
+    Returns:
+        bytes: Snapshot to pass to `load_game`.
+
+    Raises:
+        RuntimeError: If the game has not been started.
+        ValueError: If the game refers to an airport outside its world.
+    """
+    s = game.state
+    world = game.world
+    if s is None or world is None:
+        raise RuntimeError("Game not started. call start() first.")
+    airports = world.airports
+    p = s.player
+    route = game._ideal_route
+    prefetch = game._prefetch_target if game._prefetch is not None else None
+
+    flags = _RUNNING if game.running else 0
+    if route is not None:
+        flags |= _ROUTE | (_ROUTE_SUCCESS if route.success else 0)
+    if prefetch is not None:
+        flags |= _PREFETCH
+
+    completed = array("I", [_row(airports, q.target_icao) for q in s.completed_quests])
+    scores = array("i", game.quest_scores)
+    msg = s.system_msg.encode("utf-8")
+    parts: List[bytes] = [
+        _HEAD.pack(
+            MAGIC, VERSION, bytes.fromhex(airports.fingerprint()[:16]), game.seed, flags
+        ),
+        _CORE.pack(
+            _row(airports, p.location.icao),
+            p.fuel,
+            p.km_total,
+            p.hops,
+            s.points,
+            _row(airports, s.active_quest.target_icao) if s.active_quest else -1,
+            game._quest_actual_base_fuel,
+            game._quest_actual_fuel,
+            game._quest_start_km_total,
+            game._quest_start_hops,
+            game._fuel_factor,
+            game._fuel_fixed,
+            game.total_fuel_used,
+            game._weather_tick0,
+        ),
+        _COUNTS.pack(len(completed), len(scores), len(msg)),
+        completed.tobytes(),
+        scores.tobytes(),
+        msg,
+    ]
+    if route is not None:
+        path = array("I", [_row(airports, a.icao) for a in route.path])
+        reason = route.message.encode("utf-8")
+        parts += [
+            _ROUTE_HEAD.pack(
+                route.hops,
+                route.distance_km,
+                route.base_fuel,
+                math.nan if route.expected_fuel is None else route.expected_fuel,
+                len(path),
+                len(reason),
+            ),
+            path.tobytes(),
+            reason,
+        ]
+    if prefetch is not None:
+        parts.append(_PREFETCH_ROW.pack(_row(airports, prefetch.icao), game._prefetch_tick))
+    for name in STREAMS:
+        _, words, gauss = getattr(game.streams, name).getstate()
+        parts += [
+            array("I", words).tobytes(),
+            _GAUSS.pack(gauss is not None, gauss or 0.0),
+        ]
+    return b"".join(parts)
+
+
+def load_game(game: Game, data: bytes) -> None:
+    """
+    Restore a snapshot into `game`, replacing its state and random streams.
+
+    The game must share (or load) the airport world the snapshot was taken
+    in; the world is loaded for `game.COUNTRY` if the game has none yet.
+
+    Args:
+        game (Game): Game to restore into (e.g. freshly constructed).
+        data (bytes): Output of `dump_game`.
+
+    Raises:
+        ValueError: If `data` is not a snapshot, has another version, or was
+            taken over a different airport set, or the game's quest difficulty
+            cannot be served.
+    """
+    view = memoryview(data)
+    if len(data) < _HEAD.size:
+        raise ValueError("Truncated game snapshot")
+    magic, version, fingerprint, seed, flags = _HEAD.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not a game snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported game snapshot version {version}, expected {VERSION}")
+    if game._world is None:
+        game._world = World.load(game.COUNTRY)
+    airports = game._world.airports
+    game._check_quest_difficulty()
+    if fingerprint != bytes.fromhex(airports.fingerprint()[:16]):
+        raise ValueError("Game snapshot was taken over a different airport set")
+
+    try:
+        pos = _HEAD.size
+        (
+            loc_row,
+            fuel,
+            km_total,
+            hops,
+            points,
+            quest_row,
+            quest_base_fuel,
+            quest_fuel,
+            quest_start_km,
+            quest_start_hops,
+            fuel_factor,
+            fuel_fixed,
+            total_fuel_used,
+            weather_tick0,
+        ) = _CORE.unpack_from(view, pos)
+        pos += _CORE.size
+        n_completed, n_scores, n_msg = _COUNTS.unpack_from(view, pos)
+        pos += _COUNTS.size
+        completed = _read_array("I", view, pos, n_completed)
+        pos += 4 * n_completed
+        scores = _read_array("i", view, pos, n_scores)
+        pos += 4 * n_scores
+        system_msg = str(view[pos : pos + n_msg], "utf-8")
+        pos += n_msg
+
+        route = None
+        path = array("I")
+        if flags & _ROUTE:
+            r_hops, r_km, r_fuel, r_expected, n_path, n_reason = _ROUTE_HEAD.unpack_from(
+                view, pos
+            )
+            pos += _ROUTE_HEAD.size
+            path = _read_array("I", view, pos, n_path)
+            pos += 4 * n_path
+            reason = str(view[pos : pos + n_reason], "utf-8")
+            pos += n_reason
+            route = RouteResult(
+                [],
+                r_hops,
+                r_km,
+                r_fuel,
+                bool(flags & _ROUTE_SUCCESS),
+                reason,
+                None if math.isnan(r_expected) else r_expected,
+            )
+            if path and max(path) >= len(airports):
+                raise IndexError("Airport row out of range")
+        prefetch_row = prefetch_tick = None
+        if flags & _PREFETCH:
+            prefetch_row, prefetch_tick = _PREFETCH_ROW.unpack_from(view, pos)
+            pos += _PREFETCH_ROW.size
+
+        states = []
+        for _ in STREAMS:
+            words = tuple(_read_array("I", view, pos, _MT_WORDS))
+            pos += 4 * _MT_WORDS
+            has_gauss, gauss = _GAUSS.unpack_from(view, pos)
+            pos += _GAUSS.size
+            states.append((3, words, gauss if has_gauss else None))
+        icao = airports.icao
+        state = GameState(
+            player=PlayerState(airports[loc_row], fuel, hops, km_total),
+            active_quest=Quest(icao[quest_row]) if quest_row >= 0 else None,
+            completed_quests=[Quest(icao[r], QuestStatus.COMPLETED) for r in completed],
+            points=points,
+            system_msg=system_msg,
+        )
+    except (struct.error, ValueError, IndexError, UnicodeDecodeError) as e:
+        raise ValueError("Corrupt game snapshot") from e
+
+    game._cancel_prefetch()
+    game._airports = airports
+    game._index = game._world.index
+    game.state = state
+    game.running = bool(flags & _RUNNING)
+    game._target_dist_km = None
+    game._last_options = []
+    game._turn_context = None
+    game._event_messages.clear()
+    game._fuel_factor = fuel_factor
+    game._fuel_fixed = fuel_fixed
+    game._weather_tick0 = weather_tick0
+    game._quest_actual_base_fuel = quest_base_fuel
+    game._quest_actual_fuel = quest_fuel
+    game._quest_start_km_total = quest_start_km
+    game._quest_start_hops = quest_start_hops
+    game._ideal_route = _restore_route(game, airports, path, route) if route else None
+    game.total_fuel_used = total_fuel_used
+    game.quest_scores = scores.tolist()
+    game.streams.seed = seed
+    for name, st in zip(STREAMS, states):
+        getattr(game.streams, name).setstate(st)
+
+    # The quest that was being planned in the background starts at the current target.
+    start = game._get_target_airport()
+    if prefetch_row is not None and start is not None:
+        game._start_prefetch(start, airports[prefetch_row], prefetch_tick)
@@ -0,0 +1,49 @@
+"""
+core/state/turn_context.py
+==========================
+Immutable snapshot of everything shown for one turn.
+
+`Game.turn_context()` builds a `TurnContext` once per turn (status, move
+options with their distances and deltas, best hop) and hands the same
+object to the CLI and commands until `Game.pick()` moves the player.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Tuple
+from game.core.entities.airport import Airport
+
+
+@dataclass(frozen=True)
+class TurnOption:
+    """One airport the player can fly to this turn."""
+
+    number: int  # 1-based, as typed by the player
+    airport: Airport
+    leg_km: float
+    to_target_km: Optional[float]
+    # Rounded km the hop cuts from the remaining distance (None without a quest).
+    delta_km: Optional[int]
+    is_best: bool = False
+    is_target: bool = False
+
+
+@dataclass(frozen=True)
+class TurnContext:
+    """Status and move options of the current turn."""
+
+    status: Mapping[str, Any]
+    target: Optional[Airport]
+    remaining_km: Optional[int]
+    options: Tuple[TurnOption, ...]
+
+    @property
+    def best(self) -> Optional[TurnOption]:
+        """Option with the largest delta (first one on ties), if any."""
+        return next((o for o in self.options if o.is_best), None)
+
+    def option(self, number: int) -> Optional[TurnOption]:
+        """Return option `number` (1-based) or None if out of range."""
+        if 1 <= number <= len(self.options):
+            return self.options[number - 1]
+        return None
+
@@ -0,0 +1,173 @@
+"""
+core/world.py
+=============
+Read-only airport world shared between games.
+
+Bundles the loaded `AirportTable` with its spatial index and (lazily) the
+neighbour graph used by the optimal planner, the weather field, the graph
+edges sampled on its grid and the precomputed route tables found on disk
+(with their quest difficulty indexes), plus the distances to recent quest
+targets, so many `Game` instances in one process (simulations, server
+sessions) reuse a single copy.
+"""
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import numpy as np
+from game import config
+from game.core.entities.airport_table import AirportTable
+from game.core.events.weather_field import WeatherField
+from game.core.planning.airport_index import AirportIndex
+from game.core.planning.neighbor_graph import NeighborGraph
+from game.core.planning.quest_index import QuestIndex
+from game.core.planning.route_table import RouteTable, load_route_table
+from game.core.planning.weather_costs import WeatherEdges
+from game.db.airport_snapshot import load_airports
+from game.utils.distance import one_to_many_km
+
+# Memory for cached distances to quest targets (8 bytes per airport and target).
+TARGET_DISTANCE_CACHE_BYTES = 64 << 20
+
+
+class World:
+    """Airport dataset plus derived spatial structures, treated as read-only."""
+
+    def __init__(self, airports: AirportTable, index: Optional[AirportIndex] = None) -> None:
+        """
+        Wrap a loaded airport table.
+
+        Args:
+            airports (AirportTable): Airports of the world.
+            index (Optional[AirportIndex]): Prebuilt index over `airports` (built if omitted).
+        """
+        self.airports = airports
+        self.index = index if index is not None else AirportIndex.from_airports(airports)
+        self._graph: Optional[NeighborGraph] = None
+        # Weather fields and their sampled graph edges by cell size (degrees).
+        self._weather: Dict[float, WeatherField] = {}
+        self._weather_edges: Dict[float, WeatherEdges] = {}
+        # Route tables by planner settings; None caches a missing table.
+        self._route_tables: Dict[Tuple[str, float, float, int], Optional[RouteTable]] = {}
+        self._quest_indexes: Dict[int, QuestIndex] = {}
+        # Distances to recent quest targets by (target row, distance tier), oldest first.
+        self._target_distances: "OrderedDict[Tuple[int, str], np.ndarray]" = OrderedDict()
+        self._graph_lock = threading.Lock()
+
+    @classmethod
+    def load(cls, country: Optional[str]) -> "World":
+        """Load the airports of `country` (None = whole world) via the snapshot cache."""
+        return cls(load_airports(country))
+
+    @property
+    def graph(self) -> NeighborGraph:
+        """Neighbour graph over the airports, built on first use."""
+        if self._graph is None:
+            with self._graph_lock:
+                if self._graph is None:
+                    self._graph = NeighborGraph(self.airports, self.index)
+        return self._graph
+
+    @property
+    def prebuilt_graph(self) -> Optional[NeighborGraph]:
+        """Neighbour graph if something already built it (None otherwise, never builds it)."""
+        return self._graph
+
+    @property
+    def weather(self) -> WeatherField:
+        """Weather field with the configured cell size (see `weather_field`)."""
+        return self.weather_field(config.WEATHER_CELL_DEG)
+
+    @property
+    def weather_edges(self) -> WeatherEdges:
+        """Graph edges sampled on the configured weather grid (see `weather_edges_on`)."""
+        return self.weather_edges_on(config.WEATHER_CELL_DEG)
+
+    def weather_field(self, cell_deg: float) -> WeatherField:
+        """Weather field over the airports (seeded by the airport set), built on first use."""
+        field = self._weather.get(cell_deg)
+        if field is None:
+            with self._graph_lock:
+                field = self._weather.get(cell_deg)
+                if field is None:
+                    field = self._weather[cell_deg] = WeatherField.from_airports(
+                        self.airports,
+                        seed=int(self.airports.fingerprint()[:16], 16),
+                        cell_deg=cell_deg,
+                    )
+        return field
+
+    def weather_edges_on(self, cell_deg: float) -> WeatherEdges:
+        """Weather cells crossed by every edge of `graph`, sampled on first use."""
+        edges = self._weather_edges.get(cell_deg)
+        if edges is None:
+            graph, field = self.graph, self.weather_field(cell_deg)
+            with self._graph_lock:
+                edges = self._weather_edges.get(cell_deg)
+                if edges is None:
+                    edges = self._weather_edges[cell_deg] = WeatherEdges(graph, field)
+        return edges
+
+    def route_table(
+        self, planner: str, fuel_per_km: float, fuel_fixed: float, k_neighbors: int
+    ) -> Optional[RouteTable]:
+        """Stored route table for a planner and settings (None if none was built)."""
+        key = (planner, fuel_per_km, fuel_fixed, k_neighbors)
+        if key not in self._route_tables:
+            with self._graph_lock:
+                if key not in self._route_tables:
+                    self._route_tables[key] = (
+                        load_route_table(
+                            self.airports,
+                            planner,
+                            fuel_per_km,
+                            fuel_fixed,
+                            k_neighbors,
+                            config.DISTANCE_TIER,
+                            config.ROUTE_TABLE_DIR,
+                        )
+                        if config.ROUTE_TABLE_DIR
+                        else None
+                    )
+        return self._route_tables[key]
+
+    def quest_index(
+        self, planner: str, fuel_per_km: float, fuel_fixed: float, k_neighbors: int
+    ) -> Optional[QuestIndex]:
+        """Quest targets by difficulty over the matching route table (None without one)."""
+        table = self.route_table(planner, fuel_per_km, fuel_fixed, k_neighbors)
+        if table is None:
+            return None
+        with self._graph_lock:
+            found = self._quest_indexes.get(id(table))
+            if found is None:
+                found = self._quest_indexes[id(table)] = QuestIndex(table)
+        return found
+
+    def target_distances(self, row: int) -> np.ndarray:
+        """
+        Distance (km) from every airport to the airport at `row`, with the configured
+        distance tier (cached for recent targets; the array is read-only).
+        """
+        key = (row, config.DISTANCE_TIER)
+        with self._graph_lock:
+            found = self._target_distances.get(key)
+            if found is not None:
+                self._target_distances.move_to_end(key)
+                return found
+        a = self.airports
+        found = one_to_many_km(a.lat[row], a.lon[row], a.lat, a.lon)
+        found.flags.writeable = False
+        with self._graph_lock:
+            self._target_distances[key] = found
+            while len(self._target_distances) * found.nbytes > TARGET_DISTANCE_CACHE_BYTES:
+                self._target_distances.popitem(last=False)
+        return found
+
+    def __getstate__(self) -> dict:
+        """Pickle only the table; the index is rebuilt on unpickle (e.g. in worker processes)."""
+        return {"airports": self.airports}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["airports"])
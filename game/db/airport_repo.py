@@ -3,12 +3,19 @@ db/airport_repo.py
 ==================
 Handles database access for Airport data.
 
-Includes methods to fetch airport by ICAO code and list airports by country code.
+Includes methods to fetch airport by ICAO code and list airports by country code
+(or for the whole world). Queries run as server-side prepared statements on
+pooled connections. Large result sets can be streamed in fixed-size batches
+straight into an `AirportTable`.
+
+This is the MariaDB backend of `BaseAirportRepository`.
 """
 
-from typing import Optional, List, Dict, Any, Sequence, cast
+from typing import Optional, Iterator, List, Dict, Any, Sequence, Tuple, cast
 from .config import get_connection
+from .repository import BaseAirportRepository, DEFAULT_BATCH_SIZE, DEFAULT_TYPES
 from game.core.entities.airport import Airport
+from game.core.entities.airport_table import AirportRow, AirportTable
 
 
 def _row_to_airport(row: Dict[str, Any]) -> Airport:
@@ -22,7 +29,40 @@ def _row_to_airport(row: Dict[str, Any]) -> Airport:
     )
 
 
-class AirportRepository:
+def _airport_filter_sql(
+    columns: str,
+    country: Optional[str],
+    allow_types: Sequence[str],
+    order_by: str = "",
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+) -> Tuple[str, Tuple[Any, ...]]:
+    """Build the SELECT used to list airports by country, type and optional bounding box."""
+    placeholders = ",".join(["%s"] * len(allow_types))
+    country_filter = "iso_country = %s AND" if country else ""
+    params: Tuple[Any, ...] = (country, *allow_types) if country else tuple(allow_types)
+    bbox_filter = ""
+    if bbox is not None:
+        min_lat, min_lon, max_lat, max_lon = bbox
+        lon_op = "AND" if min_lon <= max_lon else "OR"  # OR: crosses the antimeridian
+        bbox_filter = (
+            "AND latitude_deg BETWEEN %s AND %s "
+            f"AND (longitude_deg >= %s {lon_op} longitude_deg <= %s)"
+        )
+        params += (min_lat, max_lat, min_lon, max_lon)
+    sql = f"""
+        SELECT {columns}
+        FROM airport
+        WHERE {country_filter}
+          type IN ({placeholders})
+          AND latitude_deg IS NOT NULL AND longitude_deg IS NOT NULL
+          AND latitude_deg <> 0 AND longitude_deg <> 0
+          {bbox_filter}
+        {f"ORDER BY {order_by}" if order_by else ""}
+    """
+    return sql, params
+
+
+class AirportRepository(BaseAirportRepository):
     """Repository for querying airports from the database."""
 
     @staticmethod
@@ -43,44 +83,174 @@ class AirportRepository:
             LIMIT 1
         """
         with get_connection() as conn:
-            cur = conn.cursor(dictionary=True)
+            cur = conn.prepared(sql, dictionary=True)
             cur.execute(sql, (icao.upper(),))
-            row = cast(Optional[Dict[str, Any]], cur.fetchone())
-        return _row_to_airport(row) if row else None
+            rows = cast(List[Dict[str, Any]], cur.fetchall())
+        return _row_to_airport(rows[0]) if rows else None
+
+    @staticmethod
+    def count_airports(
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+    ) -> int:
+        """
+        Count airports matching the `list_airports` filter (used to validate snapshots).
+
+        Args:
+            country (Optional[str]): ISO country code (default: "FI"), None for all countries.
+            allow_types (Sequence[str]): List of airport types to include in filtering.
+
+        Returns:
+            int: Number of matching airports.
+        """
+        sql, params = _airport_filter_sql("COUNT(*)", country, allow_types)
+        with get_connection() as conn:
+            cur = conn.prepared(sql)
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+        return int(rows[0][0]) if rows else 0
 
     @staticmethod
     def list_airports(
-        country: str = "FI",
-        allow_types: Sequence[str] = (
-            "small_airport",
-            "medium_airport",
-            "large_airport",
-        ),
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
     ) -> List[Airport]:
         """
         List airports filtered by country and type (small, medium, large).
 
         Args:
-            country (str): ISO country code (default: "FI").
+            country (Optional[str]): ISO country code (default: "FI"), None for all countries.
             allow_types (Sequence[str]): List of airport types to include in filtering.
 
         Returns:
             List[Airport]: Filtered list of Airport objects.
         """
-        placeholders = ",".join(["%s"] * len(allow_types))
-        sql = f"""
-            SELECT ident, name, iso_country, latitude_deg AS lat, longitude_deg AS lon
-            FROM airport
-            WHERE iso_country = %s
-              AND type IN ({placeholders})
-              AND latitude_deg IS NOT NULL AND longitude_deg IS NOT NULL
-              AND latitude_deg <> 0 AND longitude_deg <> 0
-            ORDER BY name
-        """
-        params = (country, *allow_types)
+        sql, params = _airport_filter_sql(
+            "ident, name, iso_country, latitude_deg AS lat, longitude_deg AS lon",
+            country,
+            allow_types,
+            order_by="name",
+        )
         with get_connection() as conn:
-            cur = conn.cursor(dictionary=True)
+            cur = conn.prepared(sql, dictionary=True)
             cur.execute(sql, params)
             rows = cast(List[Dict[str, Any]], cur.fetchall())
 
         return [_row_to_airport(r) for r in rows]
+
+    @staticmethod
+    def iter_row_batches(
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[List[AirportRow]]:
+        """
+        Stream airport rows in batches from an unbuffered cursor.
+
+        Rows are read from the server as they are consumed, so only one batch
+        is held in memory at a time. Abandoning the generator early discards
+        the connection instead of returning it to the pool with unread rows.
+
+        Args:
+            country (Optional[str]): ISO country code (default: "FI"), None for all countries.
+            allow_types (Sequence[str]): List of airport types to include in filtering.
+            batch_size (int): Rows fetched per round trip.
+
+        Yields:
+            List[AirportRow]: `(icao, name, country, lat, lon)` tuples.
+        """
+        sql, params = _airport_filter_sql(
+            "ident, name, iso_country, latitude_deg, longitude_deg",
+            country,
+            allow_types,
+            order_by="name",
+        )
+        with get_connection() as conn:
+            cur = conn.cursor(buffered=False)
+            cur.execute(sql, params)
+            while True:
+                rows = cast(List[AirportRow], cur.fetchmany(batch_size))
+                if not rows:
+                    break
+                yield rows
+            cur.close()
+
+    @staticmethod
+    def iter_airports(
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[Airport]:
+        """
+        Yield airports one by one for single-pass callers (see `iter_row_batches`).
+
+        Args:
+            country (Optional[str]): ISO country code (default: "FI"), None for all countries.
+            allow_types (Sequence[str]): List of airport types to include in filtering.
+            batch_size (int): Rows fetched per round trip.
+
+        Yields:
+            Airport: Airports ordered by name.
+        """
+        for batch in AirportRepository.iter_row_batches(country, allow_types, batch_size):
+            for icao, name, iso_country, lat, lon in batch:
+                yield Airport(str(icao), str(name), str(iso_country), float(lat), float(lon))
+
+    @staticmethod
+    def load_table(
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> AirportTable:
+        """
+        Load airports straight into an AirportTable without materializing rows twice.
+
+        Args:
+            country (Optional[str]): ISO country code (default: "FI"), None for all countries.
+            allow_types (Sequence[str]): List of airport types to include in filtering.
+            batch_size (int): Rows fetched per round trip.
+
+        Returns:
+            AirportTable: Filtered airports ordered by name.
+        """
+        return AirportTable.from_row_batches(
+            AirportRepository.iter_row_batches(country, allow_types, batch_size)
+        )
+
+    @staticmethod
+    def within_bbox(
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        country: Optional[str] = None,
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+    ) -> AirportTable:
+        """
+        Return airports inside a latitude/longitude box, filtered by the server.
+
+        A box with `min_lon > max_lon` crosses the antimeridian.
+
+        Args:
+            min_lat (float): Southern edge in degrees.
+            min_lon (float): Western edge in degrees.
+            max_lat (float): Northern edge in degrees.
+            max_lon (float): Eastern edge in degrees.
+            country (Optional[str]): ISO country code, None for all countries.
+            allow_types (Sequence[str]): List of airport types to include in filtering.
+
+        Returns:
+            AirportTable: Matching airports ordered by name.
+        """
+        sql, params = _airport_filter_sql(
+            "ident, name, iso_country, latitude_deg, longitude_deg",
+            country,
+            allow_types,
+            order_by="name",
+            bbox=(min_lat, min_lon, max_lat, max_lon),
+        )
+        with get_connection() as conn:
+            cur = conn.prepared(sql)
+            cur.execute(sql, params)
+            rows = cast(List[AirportRow], cur.fetchall())
+        return AirportTable.from_row_batches([rows])
@@ -0,0 +1,213 @@
+"""
+db/airport_snapshot.py
+======================
+On-disk columnar snapshot of the airport table.
+
+A snapshot stores one airport query result (country + type filter) as
+memory-mappable NumPy arrays: latitude/longitude columns and ids into an
+interned UTF-8 string table holding ICAO codes, names and countries.
+Loading a snapshot replaces the airport query with one COUNT(*) of the same
+filter: a snapshot whose row count no longer matches the database is
+rebuilt (`config.SNAPSHOT_VALIDATE=0` skips the check). Snapshots are kept
+per repository backend (`config.DB_BACKEND`).
+
+Layout of a snapshot directory::
+
+    meta.json       version, filter, row count and checksum
+    lat.npy         float64 latitudes
+    lon.npy         float64 longitudes
+    ids.npy         int32 (rows, 3) string ids: icao, name, country
+    strings.bin     UTF-8 string table
+    offsets.npy     int64 start offsets into strings.bin (+ end sentinel)
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from game import config
+from game.core.entities.airport_table import AirportTable
+from .repository import DEFAULT_TYPES, get_airport_repository
+
+SNAPSHOT_VERSION: int = 1
+
+
+def snapshot_key(country: Optional[str], allow_types: Sequence[str]) -> str:
+    """Return the directory name for a country/type filter."""
+    raw = f"{country or '*'}|{','.join(sorted(allow_types))}"
+    return f"{country or 'world'}-{hashlib.sha1(raw.encode()).hexdigest()[:12]}"
+
+
+def _checksum(lat: np.ndarray, lon: np.ndarray, ids: np.ndarray, blob: bytes) -> str:
+    """Hash the snapshot payload."""
+    h = hashlib.sha1()
+    for arr in (lat, lon, ids):
+        h.update(np.ascontiguousarray(arr).tobytes())
+    h.update(blob)
+    return h.hexdigest()
+
+
+def save_snapshot(
+    airports: AirportTable,
+    country: Optional[str],
+    allow_types: Sequence[str] = DEFAULT_TYPES,
+    directory: Optional[str] = None,
+) -> str:
+    """
+    Write `airports` as a snapshot for the given filter.
+
+    Args:
+        airports (AirportTable): Airports in query order.
+        country (Optional[str]): ISO country filter used for the query (None = world).
+        allow_types (Sequence[str]): Airport types used for the query.
+        directory (Optional[str]): Snapshot root (default: config.SNAPSHOT_DIR).
+
+    Returns:
+        str: Path of the written snapshot directory.
+    """
+    root = directory or config.SNAPSHOT_DIR
+    target = os.path.join(root, snapshot_key(country, allow_types))
+
+    # Intern strings: repeated names/countries are stored once.
+    string_ids: Dict[str, int] = {}
+    chunks: List[bytes] = []
+    offsets = [0]
+
+    def intern(s: str) -> int:
+        sid = string_ids.get(s)
+        if sid is None:
+            sid = string_ids[s] = len(chunks)
+            chunks.append(s.encode("utf-8"))
+            offsets.append(offsets[-1] + len(chunks[-1]))
+        return sid
+
+    lat, lon = airports.lat, airports.lon
+    ids = np.array(
+        [
+            (intern(i), intern(n), intern(c))
+            for i, n, c in zip(airports.icao, airports.name, airports.country)
+        ],
+        dtype=np.int32,
+    ).reshape(-1, 3)
+    blob = b"".join(chunks)
+
+    os.makedirs(root, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=root)
+    try:
+        np.save(os.path.join(tmp, "lat.npy"), lat)
+        np.save(os.path.join(tmp, "lon.npy"), lon)
+        np.save(os.path.join(tmp, "ids.npy"), ids)
+        np.save(os.path.join(tmp, "offsets.npy"), np.array(offsets, dtype=np.int64))
+        with open(os.path.join(tmp, "strings.bin"), "wb") as f:
+            f.write(blob)
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "country": country,
+            "types": sorted(allow_types),
+            "rows": len(lat),
+            "checksum": _checksum(lat, lon, ids, blob),
+        }
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        # Replace the old snapshot (if any) in one step.
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(tmp, target)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return target
+
+
+def load_snapshot(
+    country: Optional[str],
+    allow_types: Sequence[str] = DEFAULT_TYPES,
+    directory: Optional[str] = None,
+    expected_rows: Optional[int] = None,
+) -> Optional[AirportTable]:
+    """
+    Load the snapshot for a filter, or None if it is missing or stale.
+
+    Args:
+        country (Optional[str]): ISO country filter (None = world).
+        allow_types (Sequence[str]): Airport types filter.
+        directory (Optional[str]): Snapshot root (default: config.SNAPSHOT_DIR).
+        expected_rows (Optional[int]): Current row count in the database; a
+            snapshot with a different count is treated as stale.
+
+    Returns:
+        Optional[AirportTable]: Airports in the original query order.
+    """
+    path = os.path.join(directory or config.SNAPSHOT_DIR, snapshot_key(country, allow_types))
+    try:
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != SNAPSHOT_VERSION:
+            return None
+        if expected_rows is not None and meta.get("rows") != expected_rows:
+            return None
+
+        lat = np.load(os.path.join(path, "lat.npy"), mmap_mode="r")
+        lon = np.load(os.path.join(path, "lon.npy"), mmap_mode="r")
+        ids = np.load(os.path.join(path, "ids.npy"), mmap_mode="r")
+        offsets = np.load(os.path.join(path, "offsets.npy"), mmap_mode="r")
+        with open(os.path.join(path, "strings.bin"), "rb") as f:
+            blob = f.read()
+    except (OSError, ValueError):
+        return None
+
+    if len(lat) != meta["rows"] or _checksum(lat, lon, ids, blob) != meta["checksum"]:
+        return None
+
+    bounds = offsets.tolist()
+    strings = [
+        blob[bounds[i] : bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)
+    ]
+    icao_ids, name_ids, country_ids = np.asarray(ids).T.tolist() if len(ids) else ([], [], [])
+    return AirportTable(
+        [strings[i] for i in icao_ids],
+        [strings[i] for i in name_ids],
+        [strings[i] for i in country_ids],
+        lat,
+        lon,
+    )
+
+
+def load_airports(
+    country: Optional[str],
+    allow_types: Sequence[str] = DEFAULT_TYPES,
+    validate: Optional[bool] = None,
+) -> AirportTable:
+    """
+    Return airports for a filter from the snapshot, loading them from the database on a miss.
+
+    Args:
+        country (Optional[str]): ISO country filter (None = world).
+        allow_types (Sequence[str]): Airport types filter.
+        validate (Optional[bool]): Compare the snapshot row count with the database
+            before trusting it (default: config.SNAPSHOT_VALIDATE).
+
+    Returns:
+        AirportTable: Airports in query order.
+    """
+    repo = get_airport_repository()
+    # The memory backend already holds the airports in process.
+    if not config.SNAPSHOT_DIR or config.DB_BACKEND == "memory":
+        return repo.load_table(country=country, allow_types=allow_types)
+
+    if validate is None:
+        validate = config.SNAPSHOT_VALIDATE
+    expected = (
+        repo.count_airports(country=country, allow_types=allow_types)
+        if validate
+        else None
+    )
+    directory = os.path.join(config.SNAPSHOT_DIR, config.DB_BACKEND)
+    airports = load_snapshot(country, allow_types, directory, expected_rows=expected)
+    if airports is None:
+        airports = repo.load_table(country=country, allow_types=allow_types)
+        save_snapshot(airports, country, allow_types, directory)
+    return airports
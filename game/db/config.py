@@ -3,12 +3,19 @@ db/config.py
 ============
 Database configuration and connection management.
 
-Populates DB_CONFIG from environment variables and provides automatically closed
-database connection via context manager.
+Populates DB_CONFIG from environment variables and provides pooled database
+connections via context manager. Connections are reused across repository
+calls, health-checked after sitting idle, and keep their server-side
+prepared statements between checkouts.
 """
 
+import threading
+import time
 import mysql.connector
+from collections import deque
 from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
 from game import config
 
 DB_CONFIG = {
@@ -23,16 +30,218 @@ DB_CONFIG = {
 }
 
 
+@dataclass
+class PoolMetrics:
+    """Counters describing connection pool usage."""
+
+    checkouts: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    created: int = 0
+    discarded: int = 0
+    in_use: int = 0
+    idle: int = 0
+
+
+class PooledConnection:
+    """A pooled database connection with a cache of prepared statements."""
+
+    def __init__(self, raw: Any) -> None:
+        """Wrap a DB-API connection object."""
+        self.raw = raw
+        self.last_used = time.monotonic()
+        self._statements: Dict[Tuple[str, bool], Any] = {}
+
+    def cursor(self, *args, **kwargs):
+        """Return a plain cursor from the underlying connection."""
+        return self.raw.cursor(*args, **kwargs)
+
+    def prepared(self, sql: str, dictionary: bool = False):
+        """
+        Return a cursor bound to a server-side prepared statement for `sql`.
+
+        The statement is prepared on first execute and reused by later
+        checkouts of this connection.
+
+        Args:
+            sql (str): Statement text using `%s` placeholders.
+            dictionary (bool): Return rows as dictionaries.
+        """
+        key = (sql, dictionary)
+        cur = self._statements.get(key)
+        if cur is None:
+            cur = self.raw.cursor(prepared=True, dictionary=dictionary)
+            self._statements[key] = cur
+        return cur
+
+    def is_healthy(self) -> bool:
+        """Check the server is still reachable on this connection."""
+        try:
+            self.raw.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        """Close cached statements and the underlying connection."""
+        for cur in self._statements.values():
+            try:
+                cur.close()
+            except Exception:
+                pass
+        self._statements.clear()
+        try:
+            self.raw.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """Thread-safe, bounded pool of database connections."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        size: int = 4,
+        timeout: float = 10.0,
+        health_check_after: float = 30.0,
+    ) -> None:
+        """
+        Create an empty pool; connections are opened on demand.
+
+        Args:
+            connect (Callable[[], Any]): Factory opening a new DB-API connection.
+            size (int): Maximum number of open connections.
+            timeout (float): Seconds to wait for a free connection before failing.
+            health_check_after (float): Ping connections idle for longer than this.
+        """
+        self._connect = connect
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.health_check_after = health_check_after
+        self._idle: Deque[PooledConnection] = deque()
+        self._open = 0
+        self._cond = threading.Condition()
+        self._metrics = PoolMetrics()
+
+    def acquire(self) -> PooledConnection:
+        """
+        Check out a connection, waiting up to `timeout` when the pool is exhausted.
+
+        Raises:
+            TimeoutError: No connection became free in time.
+        """
+        conn: Optional[PooledConnection] = None
+        with self._cond:
+            self._metrics.checkouts += 1
+            deadline = time.monotonic() + self.timeout
+            waited_since = None
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    break
+                now = time.monotonic()
+                if waited_since is None:
+                    waited_since = now
+                    self._metrics.waits += 1
+                if now >= deadline:
+                    self._metrics.wait_seconds += now - waited_since
+                    raise TimeoutError("No database connection available in pool")
+                self._cond.wait(deadline - now)
+            if waited_since is not None:
+                self._metrics.wait_seconds += time.monotonic() - waited_since
+            self._metrics.in_use += 1
+
+        stale = (
+            conn is not None
+            and time.monotonic() - conn.last_used > self.health_check_after
+        )
+        if conn is not None and stale and not conn.is_healthy():
+            conn.close()
+            with self._cond:
+                self._metrics.discarded += 1
+            conn = None
+        if conn is None:
+            try:
+                conn = PooledConnection(self._connect())
+            except BaseException:
+                with self._cond:
+                    self._open -= 1
+                    self._metrics.in_use -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._metrics.created += 1
+        return conn
+
+    def release(self, conn: PooledConnection, discard: bool = False) -> None:
+        """Return a connection to the pool, or close it when `discard` is set."""
+        conn.last_used = time.monotonic()
+        if discard:
+            conn.close()
+        with self._cond:
+            self._metrics.in_use -= 1
+            if discard:
+                self._open -= 1
+                self._metrics.discarded += 1
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Context manager checking a connection out and back in."""
+        conn = self.acquire()
+        try:
+            yield conn
+        except BaseException as exc:
+            # A failed query may leave the connection unusable, and so does a
+            # streaming reader abandoned with rows still unread.
+            self.release(conn, discard=isinstance(exc, GeneratorExit) or not conn.is_healthy())
+            raise
+        else:
+            self.release(conn)
+
+    def metrics(self) -> PoolMetrics:
+        """Return a snapshot of the pool counters."""
+        with self._cond:
+            return replace(self._metrics, idle=len(self._idle))
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._cond:
+            while self._idle:
+                self._idle.pop().close()
+                self._open -= 1
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(
+                connect=lambda: mysql.connector.connect(**DB_CONFIG),
+                size=config.DB_POOL_SIZE,
+                timeout=config.DB_POOL_TIMEOUT,
+            )
+        return _pool
+
+
 @contextmanager
 def get_connection():
     """
-    Context manager for MySQL/MariaDB database connection.
+    Context manager for a pooled MySQL/MariaDB database connection.
 
     Yields:
-        mysql.connector.connection.MySQLConnection: Database connection.
+        PooledConnection: Database connection, returned to the pool on exit.
     """
-    connection = mysql.connector.connect(**DB_CONFIG)
-    try:
+    with get_pool().connection() as connection:
         yield connection
-    finally:
-        connection.close()
@@ -0,0 +1,146 @@
+"""
+db/memory_repo.py
+=================
+In-memory airport repository backend.
+
+Keeps every airport in NumPy/string columns inside the process and filters
+with vectorized masks, so the game, benchmarks and edge deployments run
+without a database server. Data typically comes from the OurAirports
+`airports.csv` export.
+
+Includes:
+    - `AirportRecord`: `(icao, name, country, type, lat, lon)` source tuple.
+    - `read_airports_csv`: stream records from an OurAirports-style CSV file.
+    - `InMemoryAirportRepository`: `BaseAirportRepository` over in-memory columns.
+"""
+
+from __future__ import annotations
+import csv
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from game.core.entities.airport import Airport
+from game.core.entities.airport_table import AirportRow, AirportTable
+from .repository import BaseAirportRepository, DEFAULT_BATCH_SIZE, DEFAULT_TYPES
+
+# (icao, name, country, type, lat, lon); lat/lon may be None when unknown.
+AirportRecord = Tuple[str, str, str, str, Optional[float], Optional[float]]
+
+
+def read_airports_csv(path: str) -> Iterator[AirportRecord]:
+    """
+    Read airports from a CSV file with OurAirports column names.
+
+    Uses the `ident`, `name`, `iso_country`, `type`, `latitude_deg` and
+    `longitude_deg` columns; other columns are ignored.
+
+    Args:
+        path (str): Path of the CSV file.
+
+    Yields:
+        AirportRecord: One record per CSV row.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            lat, lon = row.get("latitude_deg"), row.get("longitude_deg")
+            yield (
+                row["ident"],
+                row["name"],
+                row.get("iso_country") or "",
+                row.get("type") or "",
+                float(lat) if lat else None,
+                float(lon) if lon else None,
+            )
+
+
+class InMemoryAirportRepository(BaseAirportRepository):
+    """Repository over airport columns held in memory."""
+
+    def __init__(self, records: Iterable[AirportRecord]) -> None:
+        """
+        Store airports; rows are kept ordered by name like the database listings.
+
+        Args:
+            records (Iterable[AirportRecord]): Source airports.
+        """
+        rows = sorted(records, key=lambda r: r[1].casefold())
+        self.icao: List[str] = [r[0] for r in rows]
+        self.name: List[str] = [r[1] for r in rows]
+        self.country = np.array([r[2] for r in rows], dtype=object)
+        self.type = np.array([r[3] for r in rows], dtype=object)
+        self.lat = np.array([np.nan if r[4] is None else r[4] for r in rows], dtype=np.float64)
+        self.lon = np.array([np.nan if r[5] is None else r[5] for r in rows], dtype=np.float64)
+        self._row_by_icao = {icao.upper(): row for row, icao in enumerate(self.icao)}
+        # Same exclusions as the SQL filter: unknown or zero coordinates.
+        self._located = (
+            ~np.isnan(self.lat) & ~np.isnan(self.lon) & (self.lat != 0) & (self.lon != 0)
+        )
+
+    @classmethod
+    def from_csv(cls, path: str) -> "InMemoryAirportRepository":
+        """Load an OurAirports-style CSV file (see `read_airports_csv`)."""
+        return cls(read_airports_csv(path))
+
+    def __len__(self) -> int:
+        return len(self.icao)
+
+    def _mask(self, country: Optional[str], allow_types: Sequence[str]) -> np.ndarray:
+        """Rows matching the country/type filter with usable coordinates."""
+        mask = self._located & np.isin(self.type, list(allow_types))
+        if country:
+            mask &= self.country == country
+        return mask
+
+    def _rows(self, rows: np.ndarray) -> List[AirportRow]:
+        lat, lon = self.lat[rows].tolist(), self.lon[rows].tolist()
+        return [
+            (self.icao[r], self.name[r], self.country[r], la, lo)
+            for r, la, lo in zip(rows.tolist(), lat, lon)
+        ]
+
+    def get_by_icao(self, icao: str) -> Optional[Airport]:
+        """Fetch an airport by ICAO code."""
+        row = self._row_by_icao.get(icao.upper())
+        if row is None:
+            return None
+        return Airport(
+            self.icao[row],
+            self.name[row],
+            self.country[row],
+            float(self.lat[row]),
+            float(self.lon[row]),
+        )
+
+    def count_airports(
+        self, country: Optional[str] = "FI", allow_types: Sequence[str] = DEFAULT_TYPES
+    ) -> int:
+        """Count airports matching the `list_airports` filter."""
+        return int(self._mask(country, allow_types).sum())
+
+    def iter_row_batches(
+        self,
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[List[AirportRow]]:
+        """Yield filtered airports in batches of `batch_size` rows."""
+        rows = np.flatnonzero(self._mask(country, allow_types))
+        for start in range(0, len(rows), batch_size):
+            yield self._rows(rows[start : start + batch_size])
+
+    def within_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        country: Optional[str] = None,
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+    ) -> AirportTable:
+        """Return airports inside a latitude/longitude box (see `BaseAirportRepository`)."""
+        mask = self._mask(country, allow_types)
+        mask &= (self.lat >= min_lat) & (self.lat <= max_lat)
+        if min_lon <= max_lon:
+            mask &= (self.lon >= min_lon) & (self.lon <= max_lon)
+        else:
+            mask &= (self.lon >= min_lon) | (self.lon <= max_lon)
+        return AirportTable.from_row_batches([self._rows(np.flatnonzero(mask))])
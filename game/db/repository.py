@@ -0,0 +1,169 @@
+"""
+db/repository.py
+================
+Backend-independent airport repository interface.
+
+Defines what the game needs from an airport store and selects the
+configured backend:
+
+    - "mariadb": `AirportRepository` on the MariaDB/MySQL server (default).
+    - "sqlite": `SQLiteAirportRepository`, an embedded file with an R*Tree index.
+    - "memory": `InMemoryAirportRepository`, columns held in process memory.
+
+Includes:
+    - `BaseAirportRepository`: abstract interface implemented by every backend.
+    - `get_airport_repository`: process-wide repository for `config.DB_BACKEND`.
+"""
+
+from __future__ import annotations
+import threading
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Sequence
+from game import config
+from game.core.entities.airport import Airport
+from game.core.entities.airport_table import AirportRow, AirportTable
+
+DEFAULT_TYPES = ("small_airport", "medium_airport", "large_airport")
+
+DEFAULT_BATCH_SIZE: int = 5000
+
+BACKENDS = ("mariadb", "sqlite", "memory")
+
+
+class BaseAirportRepository(ABC):
+    """Abstract store of airports; all listings are ordered by airport name."""
+
+    @abstractmethod
+    def get_by_icao(self, icao: str) -> Optional[Airport]:
+        """
+        Fetch an airport by ICAO code.
+
+        Args:
+            icao (str): The ICAO code of the airport.
+
+        Returns:
+            Optional[Airport]: Airport object if found, else None.
+        """
+        ...
+
+    @abstractmethod
+    def iter_row_batches(
+        self,
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[List[AirportRow]]:
+        """
+        Stream airports with known coordinates in batches.
+
+        Args:
+            country (Optional[str]): ISO country code (default: "FI"), None for all countries.
+            allow_types (Sequence[str]): List of airport types to include in filtering.
+            batch_size (int): Rows per batch.
+
+        Yields:
+            List[AirportRow]: `(icao, name, country, lat, lon)` tuples.
+        """
+        ...
+
+    @abstractmethod
+    def within_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        country: Optional[str] = None,
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+    ) -> AirportTable:
+        """
+        Return airports inside a latitude/longitude box, filtered in the store.
+
+        A box with `min_lon > max_lon` crosses the antimeridian.
+
+        Args:
+            min_lat (float): Southern edge in degrees.
+            min_lon (float): Western edge in degrees.
+            max_lat (float): Northern edge in degrees.
+            max_lon (float): Eastern edge in degrees.
+            country (Optional[str]): ISO country code, None for all countries.
+            allow_types (Sequence[str]): List of airport types to include in filtering.
+
+        Returns:
+            AirportTable: Matching airports ordered by name.
+        """
+        ...
+
+    def count_airports(
+        self, country: Optional[str] = "FI", allow_types: Sequence[str] = DEFAULT_TYPES
+    ) -> int:
+        """Count airports matching the `list_airports` filter (used to validate snapshots)."""
+        return sum(len(batch) for batch in self.iter_row_batches(country, allow_types))
+
+    def iter_airports(
+        self,
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[Airport]:
+        """Yield filtered airports one at a time."""
+        for batch in self.iter_row_batches(country, allow_types, batch_size):
+            for icao, name, iso_country, lat, lon in batch:
+                yield Airport(str(icao), str(name), str(iso_country), float(lat), float(lon))
+
+    def list_airports(
+        self, country: Optional[str] = "FI", allow_types: Sequence[str] = DEFAULT_TYPES
+    ) -> List[Airport]:
+        """List airports filtered by country and type (small, medium, large)."""
+        return list(self.iter_airports(country, allow_types))
+
+    def load_table(
+        self,
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> AirportTable:
+        """Load filtered airports straight into an AirportTable."""
+        return AirportTable.from_row_batches(
+            self.iter_row_batches(country, allow_types, batch_size)
+        )
+
+
+_repository: Optional[BaseAirportRepository] = None
+_repository_lock = threading.Lock()
+
+
+def get_airport_repository() -> BaseAirportRepository:
+    """
+    Return the process-wide repository for `config.DB_BACKEND`, creating it on first use.
+
+    Raises:
+        ValueError: Unknown backend, or a backend missing its data source.
+    """
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = _create_repository(config.DB_BACKEND)
+        return _repository
+
+
+def _create_repository(backend: str) -> BaseAirportRepository:
+    """Instantiate the repository for `backend`."""
+    if backend == "mariadb":
+        from .airport_repo import AirportRepository
+
+        return AirportRepository()
+    if backend == "sqlite":
+        from .sqlite_repo import SQLiteAirportRepository
+
+        repo = SQLiteAirportRepository(config.SQLITE_PATH)
+        if config.AIRPORTS_CSV and repo.is_empty():
+            repo.import_csv(config.AIRPORTS_CSV)
+        return repo
+    if backend == "memory":
+        from .memory_repo import InMemoryAirportRepository
+
+        if not config.AIRPORTS_CSV:
+            raise ValueError("DB_BACKEND=memory needs AIRPORTS_CSV")
+        return InMemoryAirportRepository.from_csv(config.AIRPORTS_CSV)
+    raise ValueError(f"Unknown DB_BACKEND: {backend} (expected one of {', '.join(BACKENDS)})")
@@ -0,0 +1,207 @@
+"""
+db/sqlite_repo.py
+=================
+Embedded SQLite airport repository backend.
+
+Stores airports in a single SQLite file with the same column names as the
+MariaDB `airport` table, plus an R*Tree index over latitude/longitude so
+bounding-box queries are answered by the store instead of in Python.
+
+Includes:
+    - `SQLiteAirportRepository`: `BaseAirportRepository` over an SQLite file.
+"""
+
+from __future__ import annotations
+import sqlite3
+import threading
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, cast
+from game.core.entities.airport import Airport
+from game.core.entities.airport_table import AirportRow, AirportTable
+from .memory_repo import AirportRecord, read_airports_csv
+from .repository import BaseAirportRepository, DEFAULT_BATCH_SIZE, DEFAULT_TYPES
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS airport (
+    id INTEGER PRIMARY KEY,
+    ident TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    iso_country TEXT NOT NULL,
+    latitude_deg REAL,
+    longitude_deg REAL
+);
+CREATE INDEX IF NOT EXISTS airport_country_type ON airport (iso_country, type);
+CREATE VIRTUAL TABLE IF NOT EXISTS airport_rtree USING rtree (
+    id, min_lat, max_lat, min_lon, max_lon
+);
+"""
+
+_LOCATED = """
+    latitude_deg IS NOT NULL AND longitude_deg IS NOT NULL
+    AND latitude_deg <> 0 AND longitude_deg <> 0
+"""
+
+
+def _filter_sql(
+    country: Optional[str], allow_types: Sequence[str]
+) -> Tuple[str, Tuple[Any, ...]]:
+    """Build the WHERE clause shared by the airport listings."""
+    placeholders = ",".join("?" * len(allow_types))
+    sql = f"type IN ({placeholders}) AND {_LOCATED}"
+    params: Tuple[Any, ...] = tuple(allow_types)
+    if country:
+        sql = "iso_country = ? AND " + sql
+        params = (country, *params)
+    return sql, params
+
+
+class SQLiteAirportRepository(BaseAirportRepository):
+    """Repository over an SQLite database file."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open (and if needed create) the database at `path`.
+
+        Args:
+            path (str): Database file, or ":memory:" for a private in-memory database.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def is_empty(self) -> bool:
+        """Check whether the database holds no airports yet."""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM airport LIMIT 1").fetchone() is None
+
+    def import_records(self, records: Iterable[AirportRecord]) -> int:
+        """
+        Insert or update airports (matched by ICAO code) and rebuild the R*Tree.
+
+        Args:
+            records (Iterable[AirportRecord]): Airports to store.
+
+        Returns:
+            int: Number of records written.
+        """
+        sql = """
+            INSERT INTO airport (ident, name, iso_country, type, latitude_deg, longitude_deg)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (ident) DO UPDATE SET
+                name = excluded.name,
+                iso_country = excluded.iso_country,
+                type = excluded.type,
+                latitude_deg = excluded.latitude_deg,
+                longitude_deg = excluded.longitude_deg
+        """
+        with self._lock, self._conn:
+            cur = self._conn.executemany(sql, records)
+            written = cur.rowcount
+            self._conn.execute("DELETE FROM airport_rtree")
+            self._conn.execute(
+                f"""
+                INSERT INTO airport_rtree
+                SELECT id, latitude_deg, latitude_deg, longitude_deg, longitude_deg
+                FROM airport WHERE {_LOCATED}
+                """
+            )
+        return written
+
+    def import_csv(self, path: str) -> int:
+        """Import an OurAirports-style CSV file (see `read_airports_csv`)."""
+        return self.import_records(read_airports_csv(path))
+
+    def get_by_icao(self, icao: str) -> Optional[Airport]:
+        """Fetch an airport by ICAO code."""
+        sql = """
+            SELECT ident, name, iso_country, latitude_deg, longitude_deg
+            FROM airport
+            WHERE ident = ?
+        """
+        with self._lock:
+            row = self._conn.execute(sql, (icao.upper(),)).fetchone()
+        if row is None:
+            return None
+        icao, name, country, lat, lon = row
+        return Airport(icao, name, country, float(lat), float(lon))
+
+    def count_airports(
+        self, country: Optional[str] = "FI", allow_types: Sequence[str] = DEFAULT_TYPES
+    ) -> int:
+        """Count airports matching the `list_airports` filter."""
+        where, params = _filter_sql(country, allow_types)
+        with self._lock:
+            return int(
+                self._conn.execute(f"SELECT COUNT(*) FROM airport WHERE {where}", params)
+                .fetchone()[0]
+            )
+
+    def iter_row_batches(
+        self,
+        country: Optional[str] = "FI",
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[List[AirportRow]]:
+        """Stream filtered airports in batches from a cursor."""
+        where, params = _filter_sql(country, allow_types)
+        sql = f"""
+            SELECT ident, name, iso_country, latitude_deg, longitude_deg
+            FROM airport
+            WHERE {where}
+            ORDER BY name COLLATE NOCASE
+        """
+        with self._lock:
+            cur = self._conn.execute(sql, params)
+        try:
+            while True:
+                with self._lock:
+                    rows = cast(List[AirportRow], cur.fetchmany(batch_size))
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cur.close()
+
+    def within_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        country: Optional[str] = None,
+        allow_types: Sequence[str] = DEFAULT_TYPES,
+    ) -> AirportTable:
+        """
+        Return airports inside a latitude/longitude box using the R*Tree index.
+
+        The R*Tree stores 32-bit boxes, so its candidates are re-checked against
+        the exact coordinates.
+        """
+        where, params = _filter_sql(country, allow_types)
+        if min_lon <= max_lon:
+            lon_ranges = [(min_lon, max_lon)]
+        else:  # crosses the antimeridian
+            lon_ranges = [(min_lon, 180.0), (-180.0, max_lon)]
+        rows: List[AirportRow] = []
+        for lo, hi in lon_ranges:
+            sql = f"""
+                SELECT a.ident, a.name, a.iso_country, a.latitude_deg, a.longitude_deg
+                FROM airport_rtree r JOIN airport a ON a.id = r.id
+                WHERE r.max_lat >= ? AND r.min_lat <= ?
+                  AND r.max_lon >= ? AND r.min_lon <= ?
+                  AND a.latitude_deg BETWEEN ? AND ?
+                  AND a.longitude_deg BETWEEN ? AND ?
+                  AND {where}
+            """
+            box = (min_lat, max_lat, lo, hi, min_lat, max_lat, lo, hi)
+            with self._lock:
+                rows.extend(self._conn.execute(sql, box + params).fetchall())
+        rows.sort(key=lambda r: r[1].casefold())
+        return AirportTable.from_row_batches([rows])
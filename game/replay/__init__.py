@@ -0,0 +1 @@
+"""Append-only game journals and their deterministic headless replay."""
@@ -0,0 +1,43 @@
+"""
+replay/__main__.py
+==================
+Command line entry point for replaying game journals.
+
+Example::
+
+    JOURNAL_DIR=.cache/journals python -m game.cli
+    python -m game.replay .cache/journals/*.fgj --workers 4
+
+Prints one line per journal and exits with status 1 if any replay diverged.
+"""
+
+import argparse
+import sys
+from game.core.game import Game
+from game.core.world import World
+from .engine import replay_files
+
+
+def main() -> None:
+    """Parse arguments, replay the journals and report the results."""
+    parser = argparse.ArgumentParser(prog="python -m game.replay")
+    parser.add_argument("journals", nargs="+", metavar="JOURNAL")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--country", default=Game.COUNTRY, help="ISO country code, 'world' for all"
+    )
+    args = parser.parse_args()
+
+    world = World.load(None if args.country == "world" else args.country)
+    results = replay_files(args.journals, world, workers=args.workers)
+    for r in results:
+        verdict = "ok" if r.ok else f"DIVERGED at record {r.diverged_at}: {r.reason}"
+        print(
+            f"{r.path}: seed={r.seed} commands={r.commands} checkpoints={r.checkpoints}"
+            f" {r.seconds * 1e3:.1f} ms {verdict}"
+        )
+    sys.exit(0 if all(r.ok for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
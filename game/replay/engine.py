@@ -0,0 +1,137 @@
+"""
+replay/engine.py
+================
+Headless, full-speed re-execution of game journals.
+
+A journal is replayed by creating a `Game` with the recorded seed over the
+same airport set, restarting it at every START record and feeding every
+COMMAND through `handle_input()`, exactly as it was played. After each
+record the state hash is compared with the recorded one; the first
+mismatch is reported with its position.
+
+Includes:
+    - `ReplayResult`: outcome of one replay.
+    - `ReplayError`: the journal cannot be replayed against the given world.
+    - `replay_journal`: replay one journal file.
+    - `replay_files`: replay many journals, optionally across processes.
+"""
+
+from __future__ import annotations
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+from game import config
+from game.core.game import Game
+from game.core.input.input_handler import handle_input
+from game.core.world import World
+from .journal import CHECKPOINT, COMMAND, START, read_journal, state_hash
+
+
+class ReplayError(Exception):
+    """Raised when a journal does not match the world it is replayed in."""
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of replaying one journal."""
+
+    path: str
+    seed: int
+    commands: int
+    checkpoints: int
+    seconds: float
+    # Index (0-based, among START/COMMAND/CHECKPOINT records) of the first mismatch.
+    diverged_at: Optional[int] = None
+    reason: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """True when every recorded hash and status was reproduced."""
+        return self.diverged_at is None
+
+
+def replay_journal(path: str, world: World) -> ReplayResult:
+    """
+    Replay a journal and verify it against the recorded state hashes.
+
+    The recorded distance tier, route planner, quest difficulty and weather
+    model (with its grid) are used for the replay.
+
+    Args:
+        path (str): Journal file.
+        world (World): Airport world the journal was recorded in.
+
+    Raises:
+        ReplayError: If `world` holds a different airport set.
+        ValueError: If the file is not a journal.
+    """
+    header, records = read_journal(path)
+    if header.fingerprint and header.fingerprint != world.airports.fingerprint():
+        raise ReplayError(f"{path}: recorded with a different airport set")
+
+    tier, config.DISTANCE_TIER = config.DISTANCE_TIER, header.distance_tier
+    game = Game(world=world, seed=header.seed)
+    game.ROUTE_PLANNER = header.route_planner
+    game.QUEST_DIFFICULTY = header.quest_difficulty
+    game.WEATHER_MODEL = header.weather_model
+    game.WEATHER_CELL_DEG = header.weather_cell_deg
+    result = ReplayResult(path, header.seed, 0, 0, 0.0)
+    started = time.perf_counter()
+    try:
+        for i, rec in enumerate(records):
+            if rec.kind == START:
+                game.start()
+                actual, reason = state_hash(game), "state after start"
+            elif rec.kind == COMMAND:
+                outcome = handle_input(game, rec.text)
+                result.commands += 1
+                if outcome.status.value != ("ok" if rec.ok else "error"):
+                    result.diverged_at = i
+                    result.reason = f"status of command {result.commands} ({rec.text!r})"
+                    break
+                actual = state_hash(game)
+                reason = f"state after command {result.commands} ({rec.text!r})"
+            elif rec.kind == CHECKPOINT:
+                result.checkpoints += 1
+                actual, reason = state_hash(game, full=True), f"checkpoint {rec.commands}"
+            else:
+                continue
+            if actual != rec.state_hash:
+                result.diverged_at, result.reason = i, reason
+                break
+    finally:
+        game.exit_game()
+        config.DISTANCE_TIER = tier
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+_WORKER_WORLD: Optional[World] = None
+
+
+def _init_worker(world: World) -> None:
+    """Process pool initializer: keep one world per worker."""
+    global _WORKER_WORLD
+    _WORKER_WORLD = world
+
+
+def _replay_in_worker(path: str) -> ReplayResult:
+    return replay_journal(path, _WORKER_WORLD)
+
+
+def replay_files(paths: Sequence[str], world: World, workers: int = 1) -> List[ReplayResult]:
+    """
+    Replay several journals.
+
+    Args:
+        paths (Sequence[str]): Journal files.
+        world (World): Airport world they were recorded in.
+        workers (int): Worker processes (1 replays in this process).
+    """
+    if workers <= 1:
+        return [replay_journal(path, world) for path in paths]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(world,)
+    ) as pool:
+        return list(pool.map(_replay_in_worker, paths))
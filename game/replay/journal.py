@@ -0,0 +1,253 @@
+"""
+replay/journal.py
+=================
+Append-only binary journal of the commands played in a game.
+
+A journal starts with `MAGIC`, followed by records of the form
+`<kind:u8><length:u32><payload>` (little endian):
+
+    HEADER      seed:i64, created:f64 (unix time), then u8-length-prefixed
+                UTF-8 strings: airport fingerprint, distance tier, route planner,
+                quest difficulty, weather model, weather cell size (the last
+                three are absent in older journals, which used random weather)
+    START       state hash:u64 after `Game.start()` (written again on restart)
+    COMMAND     status:u8 (0 ok, 1 error), state hash:u64, input line (rest of record)
+    CHECKPOINT  commands so far:u32, full hash:u64 (state and random streams)
+
+Each record is flushed as it is written, so a crashed process leaves a
+journal that replays up to its last command.
+
+Includes:
+    - `state_hash`: 64-bit hash of a game's state (optionally its random streams).
+    - `JournalWriter`: appends records while a game is played.
+    - `JournalHeader` / `JournalRecord` / `read_journal`: decode a journal file.
+    - `open_journal`: per-game journal under `config.JOURNAL_DIR`, if enabled.
+"""
+
+from __future__ import annotations
+import hashlib
+import itertools
+import os
+import struct
+import time
+from dataclasses import dataclass, replace
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+from game import config
+from game.core.commands.result import CommandResult, CommandStatus
+
+MAGIC = b"FGJ\x01"
+
+HEADER = 1
+START = 2
+COMMAND = 3
+CHECKPOINT = 4
+
+_RECORD = struct.Struct("<BI")
+_HEADER = struct.Struct("<qd")
+_HASH = struct.Struct("<Q")
+_COMMAND = struct.Struct("<BQ")
+_CHECKPOINT = struct.Struct("<IQ")
+
+_journal_ids = itertools.count(1)
+
+
+def state_hash(game, full: bool = False) -> int:
+    """
+    Hash the replay-relevant state of `game` to 64 bits.
+
+    Covers the player (location, exact fuel and distance, hops), points,
+    quests and whether the game runs; `full` also covers the random streams.
+    """
+    s = game.state
+    parts: List[str] = [str(game.is_running())]
+    if s is not None:
+        p = s.player
+        parts += [
+            p.location.icao,
+            float(p.fuel).hex(),
+            float(p.km_total).hex(),
+            str(p.hops),
+            str(s.points),
+            s.active_quest.target_icao if s.active_quest else "",
+            ",".join(q.target_icao for q in s.completed_quests),
+        ]
+    if full:
+        parts.append(repr(game.streams.getstate()))
+    digest = hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=8).digest()
+    return _HASH.unpack(digest)[0]
+
+
+def _pack_str(text: str) -> bytes:
+    raw = text.encode("utf-8")[:255]
+    return bytes((len(raw),)) + raw
+
+
+def _unpack_str(data: bytes, pos: int) -> Tuple[str, int]:
+    n = data[pos]
+    return data[pos + 1 : pos + 1 + n].decode("utf-8"), pos + 1 + n
+
+
+class JournalWriter:
+    """Appends the records of one game to a journal file."""
+
+    def __init__(self, path: str, checkpoint_every: int = 64) -> None:
+        """
+        Open (create or append to) a journal file.
+
+        Args:
+            path (str): Journal file.
+            checkpoint_every (int): Commands between full-hash checkpoints.
+        """
+        self.path = path
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.commands = 0
+        self._header_written = False
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file: Optional[BinaryIO] = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+
+    def _write(self, kind: int, payload: bytes) -> None:
+        if self._file is None:
+            return
+        self._file.write(_RECORD.pack(kind, len(payload)) + payload)
+        self._file.flush()
+
+    def start(self, game) -> None:
+        """Record a (re)started game; the first call also writes the header."""
+        if not self._header_written:
+            self._header_written = True
+            world = game.world
+            self._write(
+                HEADER,
+                _HEADER.pack(game.seed, time.time())
+                + _pack_str(world.airports.fingerprint() if world is not None else "")
+                + _pack_str(config.DISTANCE_TIER)
+                + _pack_str(game.ROUTE_PLANNER)
+                + _pack_str(game.QUEST_DIFFICULTY)
+                + _pack_str(game.WEATHER_MODEL)
+                + _pack_str(repr(float(game.WEATHER_CELL_DEG))),
+            )
+        self._write(START, _HASH.pack(state_hash(game)))
+
+    def command(self, game, raw: str, result: CommandResult) -> None:
+        """Record one executed command with its status and the resulting state."""
+        status = 0 if result.status is CommandStatus.OK else 1
+        self._write(
+            COMMAND, _COMMAND.pack(status, state_hash(game)) + raw.encode("utf-8")
+        )
+        self.commands += 1
+        if self.commands % self.checkpoint_every == 0:
+            self.checkpoint(game)
+
+    def checkpoint(self, game) -> None:
+        """Record a full state hash, including the random streams."""
+        self._write(CHECKPOINT, _CHECKPOINT.pack(self.commands, state_hash(game, full=True)))
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@dataclass(frozen=True)
+class JournalHeader:
+    """Settings a journal was recorded with."""
+
+    seed: int
+    created: float
+    fingerprint: str
+    distance_tier: str
+    route_planner: str
+    quest_difficulty: str = ""
+    # Journals written before the weather field existed used uniform random weather.
+    weather_model: str = "random"
+    weather_cell_deg: float = 1.0
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    """One START, COMMAND or CHECKPOINT record."""
+
+    kind: int
+    state_hash: int
+    text: str = ""
+    ok: bool = True
+    commands: int = 0
+
+
+def read_journal(path: str) -> Tuple[JournalHeader, List[JournalRecord]]:
+    """
+    Decode a journal file.
+
+    A truncated last record (e.g. from a crash mid-write) is ignored.
+
+    Raises:
+        ValueError: If the file is not a journal or has no header.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a game journal")
+
+    header: Optional[JournalHeader] = None
+    records: List[JournalRecord] = []
+    for kind, payload in _iter_records(data, len(MAGIC)):
+        if kind == HEADER:
+            seed, created = _HEADER.unpack_from(payload)
+            pos = _HEADER.size
+            fingerprint, pos = _unpack_str(payload, pos)
+            tier, pos = _unpack_str(payload, pos)
+            planner, pos = _unpack_str(payload, pos)
+            extra = []
+            while pos < len(payload):
+                value, pos = _unpack_str(payload, pos)
+                extra.append(value)
+            header = JournalHeader(seed, created, fingerprint, tier, planner)
+            if len(extra) >= 1:
+                header = replace(header, quest_difficulty=extra[0])
+            if len(extra) >= 3:
+                header = replace(
+                    header, weather_model=extra[1], weather_cell_deg=float(extra[2])
+                )
+        elif kind == START:
+            records.append(JournalRecord(START, _HASH.unpack(payload)[0]))
+        elif kind == COMMAND:
+            status, h = _COMMAND.unpack_from(payload)
+            text = payload[_COMMAND.size :].decode("utf-8")
+            records.append(JournalRecord(COMMAND, h, text, ok=status == 0))
+        elif kind == CHECKPOINT:
+            commands, h = _CHECKPOINT.unpack(payload)
+            records.append(JournalRecord(CHECKPOINT, h, commands=commands))
+    if header is None:
+        raise ValueError(f"{path} has no journal header")
+    return header, records
+
+
+def _iter_records(data: bytes, pos: int) -> Iterator[Tuple[int, bytes]]:
+    """Yield `(kind, payload)` of every complete record from `pos` on."""
+    while pos + _RECORD.size <= len(data):
+        kind, length = _RECORD.unpack_from(data, pos)
+        pos += _RECORD.size
+        if pos + length > len(data):
+            return
+        yield kind, data[pos : pos + length]
+        pos += length
+
+
+def open_journal(game) -> Optional[JournalWriter]:
+    """
+    Attach a new journal under `config.JOURNAL_DIR` to `game` (before `start()`).
+
+    Returns:
+        Optional[JournalWriter]: The journal, or None when journaling is disabled.
+    """
+    if not config.JOURNAL_DIR:
+        return None
+    name = (
+        f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_journal_ids)}"
+        f"-{game.seed}.fgj"
+    )
+    game.journal = JournalWriter(os.path.join(config.JOURNAL_DIR, name))
+    return game.journal
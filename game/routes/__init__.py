@@ -0,0 +1 @@
+"""Precomputation of ideal routes between every pair of airports."""
@@ -0,0 +1,52 @@
+"""
+routes/__main__.py
+==================
+Command line entry point for precomputing route tables.
+
+Example::
+
+    python -m game.routes --planner optimal --workers 4
+
+Builds the table for the game's fuel constants and neighbour count; games
+then serve their ideal routes from it (see `ROUTE_TABLE_DIR`).
+"""
+
+import argparse
+import json
+from dataclasses import asdict
+from game.core.game import Game
+from game.core.planning.route_table import TABLE_PLANNERS
+from game.core.world import World
+from .builder import build_route_table
+
+
+def main() -> None:
+    """Parse arguments, build the table and print the build statistics as JSON."""
+    parser = argparse.ArgumentParser(prog="python -m game.routes")
+    parser.add_argument(
+        "--planner",
+        choices=TABLE_PLANNERS,
+        default=Game.ROUTE_PLANNER if Game.ROUTE_PLANNER in TABLE_PLANNERS else "optimal",
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--directory", default=None, help="table root (default: ROUTE_TABLE_DIR)")
+    parser.add_argument(
+        "--country", default=Game.COUNTRY, help="ISO country code, 'world' for all"
+    )
+    args = parser.parse_args()
+
+    world = World.load(None if args.country == "world" else args.country)
+    stats = build_route_table(
+        world,
+        args.planner,
+        Game.FUEL_PER_KM,
+        Game.FUEL_TAKEOFF_LANDING,
+        Game.K_NEIGHBORS,
+        workers=args.workers,
+        directory=args.directory,
+    )
+    print(json.dumps(asdict(stats), indent=2))
+
+
+if __name__ == "__main__":
+    main()
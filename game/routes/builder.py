@@ -0,0 +1,175 @@
+"""
+routes/builder.py
+=================
+Builds route tables (see `game.core.planning.route_table`).
+
+The arrays are created as memory maps in a temporary directory next to the
+final one; worker processes each open them and fill the rows of the
+targets they are given, so no route data passes through the pool. The
+directory replaces any older table in one step once every row is written.
+"""
+
+from __future__ import annotations
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import numpy as np
+from game import config
+from game.core.planning.route_table import (
+    ARRAYS,
+    TABLE_PLANNERS,
+    route_table_path,
+    routes_to_target,
+    table_settings,
+)
+from game.core.world import World
+
+
+@dataclass
+class BuildStats:
+    """Outcome of one table build."""
+
+    path: str
+    planner: str
+    airports: int
+    pairs: int
+    reached: int
+    bytes: int
+    seconds: float
+
+
+# Per-worker job: world, planner settings and the open output arrays.
+_WORKER: Optional[dict] = None
+
+
+def _init_worker(world: World, job: dict, tmp: str) -> None:
+    """Process pool initializer: open the output arrays once per worker."""
+    global _WORKER
+    arrays = {
+        name: np.load(os.path.join(tmp, f"{name}.npy"), mmap_mode="r+") for name in ARRAYS
+    }
+    _WORKER = {"world": world, "job": job, "arrays": arrays}
+
+
+def _fill_targets(targets: List[int]) -> int:
+    """Write the rows of `targets`; returns the number of connected pairs."""
+    world, job, arrays = _WORKER["world"], _WORKER["job"], _WORKER["arrays"]
+    graph = world.graph
+    reached = 0
+    for t in targets:
+        rows = routes_to_target(
+            job["planner"],
+            world.airports,
+            t,
+            job["fuel_per_km"],
+            job["fuel_fixed"],
+            job["k_neighbors"],
+            world.index,
+            graph,
+        )
+        for name, values in rows.items():
+            arrays[name][t] = values
+        reached += int(rows["reached"].sum()) - 1
+    for a in arrays.values():
+        a.flush()
+    return reached
+
+
+def build_route_table(
+    world: World,
+    planner: str,
+    fuel_per_km: float,
+    fuel_fixed: float,
+    k_neighbors: int,
+    workers: int = 1,
+    directory: Optional[str] = None,
+) -> BuildStats:
+    """
+    Precompute and store the routes of `planner` between every pair of airports.
+
+    Memory and disk use grow with the square of the airport count (about
+    25 bytes per pair), so tables are meant for country-sized worlds.
+
+    Args:
+        world (World): Airport world to plan in.
+        planner (str): "rule" or "optimal".
+        fuel_per_km (float): Fuel cost per kilometer.
+        fuel_fixed (float): Fixed cost per leg.
+        k_neighbors (int): Nearest forward airports reachable from each airport.
+        workers (int): Worker processes (1 runs in this process).
+        directory (Optional[str]): Table root (default: config.ROUTE_TABLE_DIR).
+
+    Returns:
+        BuildStats: Where the table was written and what it holds.
+    """
+    global _WORKER
+    if planner not in TABLE_PLANNERS:
+        raise ValueError(f"Route planner {planner!r} cannot be precomputed")
+    root = directory or config.ROUTE_TABLE_DIR
+    if not root:
+        raise ValueError("No route table directory configured (ROUTE_TABLE_DIR)")
+    airports = world.airports
+    n = len(airports)
+    settings = table_settings(
+        planner,
+        fuel_per_km,
+        fuel_fixed,
+        k_neighbors,
+        config.DISTANCE_TIER,
+        airports.fingerprint(),
+    )
+    target = route_table_path(root, **{k: v for k, v in settings.items() if k != "version"})
+    job = {
+        "planner": planner,
+        "fuel_per_km": fuel_per_km,
+        "fuel_fixed": fuel_fixed,
+        "k_neighbors": k_neighbors,
+    }
+
+    started = time.perf_counter()
+    os.makedirs(root, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=root)
+    try:
+        for name, dtype in ARRAYS.items():
+            out = np.lib.format.open_memmap(
+                os.path.join(tmp, f"{name}.npy"), mode="w+", dtype=dtype, shape=(n, n)
+            )
+            del out
+        chunk = max(1, n // (max(1, workers) * 8))
+        chunks = [list(range(lo, min(n, lo + chunk))) for lo in range(0, n, chunk)]
+        if workers <= 1:
+            _init_worker(world, job, tmp)
+            try:
+                reached = sum(_fill_targets(c) for c in chunks)
+            finally:
+                _WORKER = None
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(world, job, tmp)
+            ) as pool:
+                reached = sum(pool.map(_fill_targets, chunks))
+
+        meta: Dict[str, object] = dict(settings, rows=n, reached=reached)
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        size = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp))
+        # Replace the old table (if any) in one step.
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(tmp, target)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return BuildStats(
+        path=target,
+        planner=planner,
+        airports=n,
+        pairs=n * (n - 1),
+        reached=reached,
+        bytes=size,
+        seconds=time.perf_counter() - started,
+    )
@@ -0,0 +1 @@
+"""Multi-session TCP game server hosting many concurrent games."""
@@ -0,0 +1,60 @@
+"""
+server/__main__.py
+==================
+Command line entry point for the game server.
+
+Example::
+
+    python -m game.server --host 0.0.0.0 --port 7777
+    telnet localhost 7777
+"""
+
+import argparse
+import asyncio
+from game import config
+from game.core.game import Game
+from game.core.world import World
+from game.utils import colors
+from .server import GameServer
+
+
+def main() -> None:
+    """Parse arguments, load the shared world and serve until interrupted."""
+    parser = argparse.ArgumentParser(prog="python -m game.server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--idle-timeout", type=float, default=600.0, help="seconds")
+    parser.add_argument(
+        "--park-dir",
+        default=config.SESSION_DIR,
+        help="park idle sessions here so players can resume them (default: $SESSION_DIR)",
+    )
+    parser.add_argument("--max-sessions", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=4, help="threads running game commands")
+    parser.add_argument("--color", action="store_true", help="send ANSI colors to clients")
+    parser.add_argument(
+        "--country", default=Game.COUNTRY, help="ISO country code, 'world' for all"
+    )
+    args = parser.parse_args()
+
+    # Output goes to sockets, so the local terminal check does not apply.
+    colors.ENABLE_COLOR = args.color
+    world = World.load(None if args.country == "world" else args.country)
+    server = GameServer(
+        world,
+        idle_timeout=args.idle_timeout,
+        park_dir=args.park_dir,
+        max_sessions=args.max_sessions,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    print(f"Serving {len(world.airports)} airports on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+server/server.py
+================
+Asyncio TCP server with a line-oriented protocol, one `Game` per session.
+
+Every client line is handed to `handle_input()`, exactly as typed in the
+CLI, and answered with the command output, the updated status and the
+move list, followed by a `> ` prompt. All sessions share one read-only
+`World` (airport table and spatial index); only the per-game state is
+allocated per connection. Game calls run on a small thread pool, so a slow
+command (e.g. planning a new quest) never stalls the event loop that reads
+the other sessions' input.
+
+With a park directory, idle sessions are not just dropped: the game is
+saved as a snapshot under a one-time code, and `resume <code>` on a new
+connection continues it.
+
+Includes:
+    - `ServerStats`: snapshot of sessions, memory and command latency.
+    - `GameServer`: accepts connections, runs sessions and evicts (or parks) idle ones.
+"""
+
+from __future__ import annotations
+import asyncio
+import itertools
+import os
+import secrets
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from game.cli.renderer import Renderer
+from game.core.game import Game
+from game.core.input.input_handler import handle_input
+from game.core.planning.route_cache import RouteCacheStats, get_route_cache
+from game.core.state.snapshot import dump_game, load_game
+from game.core.world import World
+from game.replay.journal import open_journal
+from game.utils.colors import bold, dim, err, info, warn
+from .session import Session
+
+MAX_LINE_BYTES: int = 1024
+
+
+@dataclass
+class ServerStats:
+    """Snapshot of server load."""
+
+    sessions: int
+    sessions_total: int
+    evicted_idle: int
+    parked_idle: int
+    commands: int
+    memory_bytes: int
+    max_session_bytes: int
+    latency_p50_us: float
+    latency_p99_us: float
+    route_cache: RouteCacheStats
+
+
+class GameServer:
+    """Hosts one game per TCP connection over a shared airport world."""
+
+    def __init__(
+        self,
+        world: World,
+        idle_timeout: float = 600.0,
+        park_dir: str = "",
+        max_sessions: int = 5000,
+        sweep_interval: float = 5.0,
+        seed: Optional[int] = None,
+        workers: int = 4,
+    ) -> None:
+        """
+        Create the server (call `start()` to listen).
+
+        Args:
+            world (World): Airport world shared by every session.
+            idle_timeout (float): Disconnect sessions without input for this many seconds.
+            park_dir (str): Directory for snapshots of idle sessions; empty disconnects them.
+            max_sessions (int): Refuse connections beyond this many open sessions.
+            sweep_interval (float): Seconds between idle checks.
+            seed (Optional[int]): Seed for reproducible session games (session id is mixed in).
+            workers (int): Threads executing game commands.
+        """
+        self.world = world
+        self.idle_timeout = idle_timeout
+        self.park_dir = park_dir
+        self.max_sessions = max_sessions
+        self.sweep_interval = sweep_interval
+        self.seed = seed
+        self.sessions: Dict[int, Session] = {}
+        self._ids = itertools.count(1)
+        self._renderer = Renderer()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._sweeper: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="game")
+        self._latencies: Deque[float] = deque(maxlen=10000)
+        self._commands = 0
+        self._evicted = 0
+        self._parked = 0
+        self._sessions_total = 0
+
+    # Lifecycle
+    # ------------------------------------------------------------------------- #
+    async def start(self, host: str = "127.0.0.1", port: int = 7777) -> asyncio.AbstractServer:
+        """Start listening and the idle sweeper; returns the asyncio server."""
+        self._server = await asyncio.start_server(
+            self._handle_client, host, port, limit=MAX_LINE_BYTES
+        )
+        self._sweeper = asyncio.create_task(self._sweep_idle())
+        return self._server
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 7777) -> None:
+        """Start the server and run until cancelled."""
+        server = await self.start(host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop accepting connections and disconnect every session."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._sweeper
+            self._sweeper = None
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for session in list(self.sessions.values()):
+            session.writer.close()
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> ServerStats:
+        """Return current load figures (memory is measured on demand)."""
+        sizes = [s.memory_bytes() for s in self.sessions.values()]
+        lat = sorted(self._latencies)
+
+        def pct(q: float) -> float:
+            return lat[min(len(lat) - 1, int(q * len(lat)))] * 1e6 if lat else 0.0
+
+        return ServerStats(
+            sessions=len(self.sessions),
+            sessions_total=self._sessions_total,
+            evicted_idle=self._evicted,
+            parked_idle=self._parked,
+            commands=self._commands,
+            memory_bytes=sum(sizes),
+            max_session_bytes=max(sizes, default=0),
+            latency_p50_us=pct(0.50),
+            latency_p99_us=pct(0.99),
+            route_cache=get_route_cache().stats(),
+        )
+
+    # Connections
+    # ------------------------------------------------------------------------- #
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Run one session until the client quits, disconnects or is evicted."""
+        if len(self.sessions) >= self.max_sessions:
+            writer.write(b"Server full, try again later.\r\n")
+            with suppress(ConnectionError):
+                await writer.drain()
+            writer.close()
+            return
+
+        session_id = next(self._ids)
+        seed = None if self.seed is None else self.seed * 1_000_003 + session_id
+        session = Session(session_id, Game(world=self.world, seed=seed), writer)
+        open_journal(session.game)
+        self.sessions[session_id] = session
+        self._sessions_total += 1
+        try:
+            await session.send(await self._call(session, self._welcome, session.game))
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # line longer than MAX_LINE_BYTES
+                    await session.send([err("Line too long.")], prompt="")
+                    break
+                if not line:
+                    break
+                session.touch()
+                text = line.decode("utf-8", "replace").strip()
+                started = time.perf_counter()
+                lines, done = await self._call(session, self._respond, session.game, text)
+                self._latencies.append(time.perf_counter() - started)
+                self._commands += 1
+                await session.send(lines, prompt="" if done else "> ")
+                if done:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            del self.sessions[session_id]
+            if session.game.journal is not None:
+                session.game.journal.close()
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _call(self, session: Session, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a game call for `session` on the worker threads."""
+        session.busy = True
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            session.busy = False
+
+    def _welcome(self, game: Game) -> List[str]:
+        """Start the session's game and return the greeting."""
+        game.start()
+        lines = [bold(info("Welcome to Flight Game!"))]
+        if self.park_dir:
+            lines.append(dim("Type 'resume <code>' to continue a parked game."))
+        return lines + self._turn_view(game)
+
+    def _respond(self, game: Game, text: str) -> Tuple[List[str], bool]:
+        """
+        Execute one input line.
+
+        Returns:
+            Tuple[List[str], bool]: Output lines, and whether to close the session.
+        """
+        if text.lower().startswith("resume ") and self.park_dir:
+            return self._resume(game, text.split(None, 1)[1].strip()), False
+        if not game.is_running():
+            # Game over prompt: anything but "retry" ends the session.
+            if text.lower() in ("retry", "y", "yes"):
+                game.start()
+                return [info("New game started.")] + self._turn_view(game), False
+            return [info("Goodbye - game ended.")], True
+
+        result = handle_input(game, text)
+        lines = list(result.messages)
+        if game.is_running():
+            return lines + self._turn_view(game), False
+        if game.state is not None and game.state.player.fuel <= 0:
+            if game.state.system_msg:
+                lines.append(warn(game.state.system_msg))
+                game.state.system_msg = ""
+            lines.append(err("GAME OVER: you ran out of fuel."))
+            lines.append(dim("Type 'retry' for a new game or anything else to quit."))
+            return lines, False
+        return lines, True  # exit command
+
+    def _parked_path(self, code: str) -> Optional[str]:
+        """Snapshot file of a park code, or None if the code is malformed."""
+        if len(code) != 16 or not all(c in "0123456789abcdef" for c in code):
+            return None
+        return os.path.join(self.park_dir, f"{code}.fgs")
+
+    def _park(self, game: Game) -> str:
+        """Save `game` under a new park code and return the code."""
+        os.makedirs(self.park_dir, exist_ok=True)
+        code = secrets.token_hex(8)
+        with open(self._parked_path(code), "wb") as f:
+            f.write(dump_game(game))
+        return code
+
+    def _resume(self, game: Game, code: str) -> List[str]:
+        """Replace the session's game with a parked one (each code works once)."""
+        path = self._parked_path(code.lower())
+        try:
+            if path is None:
+                raise FileNotFoundError(code)
+            with open(path, "rb") as f:
+                data = f.read()
+            os.remove(path)
+        except OSError:
+            return [err("Unknown park code.")]
+        try:
+            load_game(game, data)
+        except ValueError as e:
+            return [err(f"Cannot resume: {e}.")]
+        # A journal replays from the seed, which no longer describes this game.
+        if game.journal is not None:
+            game.journal.close()
+            game.journal = None
+        return [info("Game resumed.")] + self._turn_view(game)
+
+    def _turn_view(self, game: Game) -> List[str]:
+        """Status, pending system message and move list for the next turn."""
+        ctx = game.turn_context()
+        lines = ["", self._renderer.draw_game_status(ctx.status)]
+        if game.state.system_msg:
+            lines.append(warn(game.state.system_msg))
+            game.state.system_msg = ""
+        if not ctx.options:
+            return lines
+        for o in ctx.options:
+            lines.append(
+                f"{o.number:2}. {o.airport.name} ({o.airport.icao})  ~{o.leg_km:.0f} km  "
+                f"{dim(f'Δdist: {o.delta_km:+d} km')}"
+            )
+        lines.append(self._renderer.draw_command_list(len(ctx.options)))
+        return lines
+
+    # Idle eviction
+    # ------------------------------------------------------------------------- #
+    async def _sweep_idle(self) -> None:
+        """Periodically disconnect (or park) sessions idle for longer than `idle_timeout`."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            for session in list(self.sessions.values()):
+                if not session.busy and session.idle_seconds() > self.idle_timeout:
+                    self._evicted += 1
+                    notice = f"\r\nDisconnected after {self.idle_timeout:.0f} s idle.\r\n"
+                    if self.park_dir and session.game.is_running():
+                        try:
+                            code = self._park(session.game)
+                        except OSError:
+                            pass
+                        else:
+                            self._parked += 1
+                            notice += f"Game parked - reconnect and type 'resume {code}'.\r\n"
+                    with suppress(ConnectionError):
+                        session.writer.write(notice.encode())
+                    # Closing the transport ends the session's readline with EOF.
+                    session.writer.close()
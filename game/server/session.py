@@ -0,0 +1,104 @@
+"""
+server/session.py
+=================
+Per-connection state of the game server.
+
+A session owns one `Game` over the shared `World` and tracks activity for
+idle eviction and the memory it holds on top of the shared dataset.
+
+Includes:
+    - `deep_sizeof`: approximate memory of an object graph, skipping shared objects.
+    - `Session`: one connected player.
+"""
+
+from __future__ import annotations
+import asyncio
+import sys
+import time
+from typing import Any, Iterable, List
+import numpy as np
+from game.core.entities.airport import Airport
+from game.core.game import Game
+
+
+def deep_sizeof(obj: Any, shared: Iterable[Any] = ()) -> int:
+    """
+    Approximate the bytes held by `obj` and everything it references.
+
+    Objects in `shared` (and everything reachable only through them) are
+    not counted. `Airport` values are counted without their strings, which
+    belong to the shared airport table.
+
+    Args:
+        obj (Any): Root object.
+        shared (Iterable[Any]): Objects owned by someone else.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    seen = {id(s) for s in shared}
+    stack = [obj]
+    total = 0
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+        if isinstance(o, (np.ndarray, Airport, str, bytes, int, float)):
+            continue  # ndarray sizes include their own buffer
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif hasattr(o, "__dict__"):
+            stack.append(vars(o))
+    return total
+
+
+class Session:
+    """One connected player with its own game."""
+
+    def __init__(self, session_id: int, game: Game, writer: asyncio.StreamWriter) -> None:
+        """
+        Create a session for an accepted connection.
+
+        Args:
+            session_id (int): Server-unique id.
+            game (Game): Game played in this session (sharing the server's world).
+            writer (asyncio.StreamWriter): Connection to the client.
+        """
+        self.id = session_id
+        self.game = game
+        self.writer = writer
+        self.created = time.monotonic()
+        # Last input from, or prompt sent to, the client.
+        self.last_active = self.created
+        self.commands = 0
+        # True while the server is executing a command for this session.
+        self.busy = False
+
+    def touch(self) -> None:
+        """Record client input."""
+        self.last_active = time.monotonic()
+        self.commands += 1
+
+    def idle_seconds(self) -> float:
+        """Seconds the client has left the latest prompt unanswered."""
+        return time.monotonic() - self.last_active
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by this session's game, excluding the shared world."""
+        world = self.game.world
+        shared: List[Any] = [self.writer]
+        if world is not None:
+            shared += [world, world.airports, world.index]
+        return deep_sizeof(self.game, shared)
+
+    async def send(self, lines: Iterable[str], prompt: str = "> ") -> None:
+        """Write a block of lines followed by the input prompt."""
+        text = "".join(f"{line}\r\n" for line in lines) + prompt
+        self.writer.write(text.encode("utf-8"))
+        await self.writer.drain()
+        self.last_active = time.monotonic()
@@ -0,0 +1 @@
+"""Headless simulation of Flight Game runs with bot policies."""
@@ -0,0 +1,54 @@
+"""
+sim/__main__.py
+===============
+Command line entry point for headless simulations.
+
+Example::
+
+    python -m game.sim --policy greedy --games 1000 --workers 4
+"""
+
+import argparse
+import json
+from dataclasses import asdict
+from game.core.game import Game
+from game.utils.distance import TIERS
+from game.core.world import World
+from .engine import run_batch
+from .policies import POLICIES
+
+
+def main() -> None:
+    """Parse arguments, run a batch and print the summary as JSON."""
+    parser = argparse.ArgumentParser(prog="python -m game.sim")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--country", default=Game.COUNTRY, help="ISO country code, 'world' for all"
+    )
+    parser.add_argument(
+        "--distance-tier",
+        choices=TIERS,
+        default=None,
+        help="distance formula (default: DISTANCE_TIER); 'ellipsoidal' is faster",
+    )
+    args = parser.parse_args()
+
+    world = World.load(None if args.country == "world" else args.country)
+    summary = run_batch(
+        world,
+        args.policy,
+        args.games,
+        seed=args.seed,
+        max_turns=args.max_turns,
+        workers=args.workers,
+        distance_tier=args.distance_tier,
+    )
+    print(json.dumps(asdict(summary), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+sim/engine.py
+=============
+Headless engine that plays full games with bot policies.
+
+Games run through the public `Game.start()/options()/pick()` API with a
+seeded random source and no terminal I/O. Batches fan out across a
+process pool; every worker loads the airport world once.
+"""
+
+from __future__ import annotations
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+from game import config
+from game.core.game import Game
+from game.core.world import World
+from .policies import make_policy
+
+
+@dataclass
+class GameStats:
+    """Outcome of one simulated game."""
+
+    seed: int
+    policy: str
+    turns: int
+    points: int
+    hops: int
+    km_total: float
+    fuel_used: float
+    scores: List[int] = field(default_factory=list)
+    out_of_fuel: bool = False
+
+
+@dataclass
+class SimSummary:
+    """Aggregated statistics over a batch of simulated games."""
+
+    games: int
+    turns: int
+    seconds: float
+    turns_per_second: float
+    points: Dict[str, float]
+    fuel_used: Dict[str, float]
+    hops: Dict[str, float]
+    score: Dict[str, float]
+    out_of_fuel_rate: float
+
+
+def play_game(
+    world: World, policy: str, seed: int, max_turns: int = 200
+) -> GameStats:
+    """
+    Play one game to the end (out of fuel) or `max_turns`.
+
+    Args:
+        world (World): Shared airport world.
+        policy (str): Registered policy name.
+        seed (int): Seed for the game and policy random sources.
+        max_turns (int): Turn limit.
+
+    Returns:
+        GameStats: Outcome of the game.
+    """
+    # Options and rule routes read candidates from the graph once it is built.
+    world.graph
+    game = Game(world=world, seed=seed)
+    bot = make_policy(policy, random.Random(seed ^ 0x5EED))
+    game.start()
+
+    turns = 0
+    while game.is_running() and turns < max_turns:
+        if game.state.active_quest is None:
+            break
+        opts = game.options()
+        if not opts:
+            break
+        game.pick(bot.choose(game, opts))
+        turns += 1
+
+    p = game.state.player
+    return GameStats(
+        seed=seed,
+        policy=policy,
+        turns=turns,
+        points=game.state.points,
+        hops=p.hops,
+        km_total=p.km_total,
+        fuel_used=game.total_fuel_used,
+        scores=list(game.quest_scores),
+        out_of_fuel=p.fuel <= 0,
+    )
+
+
+_WORKER_WORLD: Optional[World] = None
+
+
+def _init_worker(world: World, distance_tier: str) -> None:
+    """Process pool initializer: keep one world per worker."""
+    global _WORKER_WORLD
+    _WORKER_WORLD = world
+    config.DISTANCE_TIER = distance_tier
+
+
+def _play_in_worker(args) -> GameStats:
+    policy, seed, max_turns = args
+    return play_game(_WORKER_WORLD, policy, seed, max_turns)
+
+
+def _describe(values: List[float]) -> Dict[str, float]:
+    """Mean and percentiles of a sample."""
+    if not values:
+        return {"mean": 0.0, "p10": 0.0, "p50": 0.0, "p90": 0.0}
+    ordered = sorted(values)
+
+    def pct(q: float) -> float:
+        return float(ordered[min(len(ordered) - 1, int(q * len(ordered)))])
+
+    return {
+        "mean": float(statistics.fmean(ordered)),
+        "p10": pct(0.10),
+        "p50": pct(0.50),
+        "p90": pct(0.90),
+    }
+
+
+def summarize(results: Iterable[GameStats], seconds: float) -> SimSummary:
+    """Aggregate per-game statistics."""
+    results = list(results)
+    turns = sum(r.turns for r in results)
+    return SimSummary(
+        games=len(results),
+        turns=turns,
+        seconds=seconds,
+        turns_per_second=turns / seconds if seconds > 0 else 0.0,
+        points=_describe([r.points for r in results]),
+        fuel_used=_describe([r.fuel_used for r in results]),
+        hops=_describe([r.hops for r in results]),
+        score=_describe([s for r in results for s in r.scores]),
+        out_of_fuel_rate=(
+            sum(r.out_of_fuel for r in results) / len(results) if results else 0.0
+        ),
+    )
+
+
+def run_batch(
+    world: World,
+    policy: str,
+    games: int,
+    seed: int = 0,
+    max_turns: int = 200,
+    workers: int = 1,
+    distance_tier: Optional[str] = None,
+) -> SimSummary:
+    """
+    Play `games` games with consecutive seeds and aggregate the results.
+
+    Args:
+        world (World): Airport world to play in.
+        policy (str): Registered policy name.
+        games (int): Number of games.
+        seed (int): Seed of the first game; game i uses `seed + i`.
+        max_turns (int): Turn limit per game.
+        workers (int): Worker processes (1 runs in this process).
+        distance_tier (Optional[str]): Distance formula for the batch (default:
+            config.DISTANCE_TIER); "ellipsoidal" plays faster within about 1.5 m.
+
+    Returns:
+        SimSummary: Aggregated statistics.
+    """
+    jobs = [(policy, seed + i, max_turns) for i in range(games)]
+    tier, config.DISTANCE_TIER = config.DISTANCE_TIER, distance_tier or config.DISTANCE_TIER
+    started = time.perf_counter()
+    try:
+        if workers <= 1:
+            results = [play_game(world, *job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(world, config.DISTANCE_TIER),
+            ) as pool:
+                chunk = max(1, games // (workers * 4))
+                results = list(pool.map(_play_in_worker, jobs, chunksize=chunk))
+    finally:
+        config.DISTANCE_TIER = tier
+    return summarize(results, time.perf_counter() - started)
@@ -0,0 +1,167 @@
+"""
+sim/policies.py
+===============
+Bot policies that choose the next hop in headless games.
+
+Includes `Policy` interface and concrete policies (greedy, random, optimal,
+weather) plus a registry used by the simulation engine.
+"""
+
+from __future__ import annotations
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from game.core.entities.airport import Airport
+from game.core.planning.optimal_route import compute_optimal_route
+from game.core.planning.weather_costs import WeatherCosts
+from game.utils.distance import ellipsoidal_km
+
+
+class Policy(ABC):
+    """Abstract base class for bot policies."""
+
+    name: str
+
+    def __init__(self, rng: random.Random) -> None:
+        """Initialize the policy with its own random source."""
+        self.rng = rng
+
+    @abstractmethod
+    def choose(self, game, options: Sequence[Tuple[Airport, float]]) -> int:
+        """
+        Pick the next hop.
+
+        Args:
+            game (Game): The running game.
+            options (Sequence[Tuple[Airport, float]]): Current `game.options()`.
+        Returns:
+            int: 1-based option number passed to `game.pick()`.
+        """
+        ...
+
+
+POLICIES: Dict[str, type] = {}
+
+
+def register_policy(cls: type) -> type:
+    """Decorator to register a Policy class in the POLICIES registry."""
+    POLICIES[cls.name] = cls
+    return cls
+
+
+@register_policy
+class GreedyPolicy(Policy):
+    """Fly to the option that gets closest to the target (shorter leg on ties)."""
+
+    name = "greedy"
+
+    def choose(self, game, options) -> int:
+        best = min(
+            range(len(options)),
+            key=lambda i: (game.distance_to_target(options[i][0]), options[i][1]),
+        )
+        return best + 1
+
+
+@register_policy
+class RandomPolicy(Policy):
+    """Fly to a uniformly random option."""
+
+    name = "random"
+
+    def choose(self, game, options) -> int:
+        return self.rng.randrange(len(options)) + 1
+
+
+@register_policy
+class OptimalPolicy(Policy):
+    """Follow the minimum-fuel route, replanning whenever the player leaves it."""
+
+    name = "optimal"
+
+    def __init__(self, rng: random.Random) -> None:
+        super().__init__(rng)
+        self._path: List[str] = []
+        self._fallback = GreedyPolicy(rng)
+        # Planner distances to the current target, kept while the target stays.
+        self._target: Optional[Tuple[str, np.ndarray]] = None
+
+    def choose(self, game, options) -> int:
+        here = game.state.player.location
+        target = game.get_target_airport()
+        if here.icao not in self._path or self._path[-1] != target.icao:
+            route = compute_optimal_route(
+                start_airport=here,
+                target_airport=target,
+                all_airports=game.get_airports(),
+                fuel_per_km=game.FUEL_PER_KM,
+                fuel_fixed=game.FUEL_TAKEOFF_LANDING,
+                graph=game.world.graph,
+                target_dist_km=self._target_distances(game, target),
+            )
+            self._path = [a.icao for a in route.path] if route.success else []
+
+        nxt = self._next_hop(here.icao)
+        for i, (a, _) in enumerate(options, start=1):
+            if a.icao == nxt:
+                return i
+        return self._fallback.choose(game, options)
+
+    def _target_distances(self, game, target: Airport) -> np.ndarray:
+        """Distances the planner measures to `target` (as it would compute them itself)."""
+        if self._target is None or self._target[0] != target.icao:
+            airports = game.get_airports()
+            dist = ellipsoidal_km(airports.lat, airports.lon, target.lat, target.lon)
+            dist.flags.writeable = False
+            self._target = (target.icao, dist)
+        return self._target[1]
+
+    def _next_hop(self, icao: str) -> Optional[str]:
+        if icao in self._path:
+            pos = self._path.index(icao)
+            if pos + 1 < len(self._path):
+                return self._path[pos + 1]
+        return None
+
+
+@register_policy
+class WeatherPolicy(OptimalPolicy):
+    """Replan the minimum expected-fuel route under the current weather every hop."""
+
+    name = "weather"
+
+    def __init__(self, rng: random.Random) -> None:
+        super().__init__(rng)
+        self._costs: Optional[WeatherCosts] = None
+
+    def choose(self, game, options) -> int:
+        world = game.world
+        if self._costs is None:
+            self._costs = WeatherCosts(world.weather_edges_on(game.WEATHER_CELL_DEG))
+        # Only edges crossing cells whose weather changed are re-priced.
+        self._costs.update(game.weather_field().frame(game.weather_tick() + 1))
+        target = game.get_target_airport()
+        route = compute_optimal_route(
+            start_airport=game.state.player.location,
+            target_airport=target,
+            all_airports=game.get_airports(),
+            fuel_per_km=game.FUEL_PER_KM,
+            fuel_fixed=game.FUEL_TAKEOFF_LANDING,
+            target_dist_km=self._target_distances(game, target),
+            costs=self._costs,
+        )
+        self._path = [a.icao for a in route.path] if route.success else []
+        nxt = self._next_hop(game.state.player.location.icao)
+        for i, (a, _) in enumerate(options, start=1):
+            if a.icao == nxt:
+                return i
+        return self._fallback.choose(game, options)
+
+
+def make_policy(name: str, rng: random.Random) -> Policy:
+    """Instantiate a registered policy by name."""
+    try:
+        return POLICIES[name](rng)
+    except KeyError:
+        raise ValueError(f"Unknown policy: {name}") from None
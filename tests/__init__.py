@@ -0,0 +1 @@
+"""Tests of the game's invariants, run against the in-memory backend."""
@@ -0,0 +1,36 @@
+"""
+tests/conftest.py
+=================
+Shared fixtures. The environment is pinned before `game.config` is imported,
+so the suite needs no database server and leaves no files behind: airports
+come from the synthetic generators of `benchmarks.synthetic` and every
+on-disk cache is disabled.
+"""
+
+import os
+
+os.environ.update(
+    DB_BACKEND="memory",
+    AIRPORTS_CSV="",
+    SNAPSHOT_DIR="",
+    ROUTE_CACHE_PATH="",
+    ROUTE_TABLE_DIR="",
+    JOURNAL_DIR="",
+    SESSION_DIR="",
+)
+
+import pytest  # noqa: E402
+from benchmarks.synthetic import finland  # noqa: E402
+from game.core.world import World  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def world() -> World:
+    """Finland-shaped world of 300 airports shared by the whole run."""
+    return World(finland(300))
+
+
+@pytest.fixture(scope="session")
+def small_world() -> World:
+    """World small enough to check every airport pair."""
+    return World(finland(60))
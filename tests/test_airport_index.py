@@ -0,0 +1,84 @@
+"""KD-tree queries against brute force over every airport."""
+
+import random
+import numpy as np
+import pytest
+from benchmarks.synthetic import clustered, uniform
+from game.core.planning.airport_index import (
+    AirportIndex,
+    chord_to_km,
+    forward_neighbors,
+    to_xyz,
+)
+from game.core.world import World
+from game.utils.distance import one_to_many_km
+
+
+@pytest.fixture(scope="module", params=["uniform", "clustered"])
+def table(request):
+    return uniform(1500, seed=1) if request.param == "uniform" else clustered(1500, seed=1)
+
+
+def _chord2(table, lat, lon):
+    diff = to_xyz(table.lat, table.lon) - to_xyz(lat, lon)
+    return np.einsum("ij,ij->i", diff, diff)
+
+
+def _queries(count, seed):
+    rng = random.Random(seed)
+    return [(rng.uniform(-89.0, 89.0), rng.uniform(-180.0, 180.0)) for _ in range(count)]
+
+
+def test_nearest(table):
+    index = AirportIndex(table.lat, table.lon)
+    mask = np.random.default_rng(2).random(len(table)) < 0.5
+    for lat, lon in _queries(40, 3):
+        d2 = _chord2(table, lat, lon)
+        rows, km = index.nearest(lat, lon, 7)
+        assert rows.tolist() == np.argsort(d2, kind="stable")[:7].tolist()
+        assert (np.diff(km) >= 0).all()
+        rows, _ = index.nearest(lat, lon, 7, mask=mask)
+        expected = np.flatnonzero(mask)[np.argsort(d2[mask], kind="stable")[:7]]
+        assert rows.tolist() == expected.tolist()
+
+
+def test_within(table):
+    index = AirportIndex(table.lat, table.lon)
+    for lat, lon in _queries(40, 4):
+        d2 = _chord2(table, lat, lon)
+        rows, km = index.within(lat, lon, 900.0)
+        expected = np.flatnonzero(chord_to_km(np.sqrt(d2)) <= 900.0)
+        assert sorted(rows.tolist()) == expected.tolist()
+        assert (np.diff(d2[rows]) >= 0).all()
+        assert km == pytest.approx(chord_to_km(np.sqrt(d2[rows])))
+
+
+def test_cone(table):
+    index = AirportIndex(table.lat, table.lon)
+    queries = _queries(41, 5)
+    for (lat, lon), (t_lat, t_lon) in zip(queries, queries[1:]):
+        rows, _ = index.closer_to(lat, lon, t_lat, t_lon, 5)
+        here = np.sum((to_xyz(lat, lon) - to_xyz(t_lat, t_lon)) ** 2)
+        closer = _chord2(table, t_lat, t_lon) < here
+        d2 = _chord2(table, lat, lon)
+        expected = np.flatnonzero(closer)[np.argsort(d2[closer], kind="stable")[:5]]
+        assert rows.tolist() == expected.tolist()
+
+
+def test_forward_neighbors(table):
+    world = World(table)
+    a = world.airports
+    rng = random.Random(6)
+    for _ in range(60):
+        s, t = rng.randrange(len(a)), rng.randrange(len(a))
+        dist = one_to_many_km(a.lat[t], a.lon[t], a.lat, a.lon)
+        legs = one_to_many_km(a.lat[s], a.lon[s], a.lat, a.lon)
+        closer = np.flatnonzero(dist < dist[s])
+        closer = closer[closer != s]
+        expected = closer[np.argsort(legs[closer], kind="stable")[:5]].tolist()
+        for graph in (None, world.graph):
+            found = forward_neighbors(
+                world.index, a, a[s], a[t], dist, float(dist[s]), 5, exclude_row=s, graph=graph
+            )
+            assert [row for row, _ in found] == expected
+            assert [km for _, km in found] == legs[expected].tolist()
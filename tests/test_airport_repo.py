@@ -0,0 +1,97 @@
+"""The MariaDB repository streams rows in batches (with a fake server)."""
+
+import pytest
+from game.db import config as db_config
+from game.db.airport_repo import AirportRepository
+from game.db.config import ConnectionPool
+
+ROWS = [(f"EF{i:02d}", f"Field {i:02d}", "FI", 60.0 + i / 10, 25.0) for i in range(23)]
+
+
+class FakeCursor:
+    """Unbuffered cursor handing out rows as they are fetched."""
+
+    def __init__(self, rows) -> None:
+        self.rows = rows
+        self.read = 0
+        self.fetches = []
+        self.query = None
+
+    def execute(self, sql, params) -> None:
+        self.query = (sql, params)
+
+    def fetchmany(self, size):
+        self.fetches.append(size)
+        batch = self.rows[self.read : self.read + size]
+        self.read += len(batch)
+        return batch
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.cursors = []
+        self.closed = False
+
+    def cursor(self, buffered=True, **kwargs):
+        assert not buffered
+        self.cursors.append(FakeCursor(ROWS))
+        return self.cursors[-1]
+
+    def ping(self, reconnect=False) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def server(monkeypatch):
+    made = []
+
+    def connect():
+        made.append(FakeConnection())
+        return made[-1]
+
+    pool = ConnectionPool(connect, size=1, timeout=0.05)
+    monkeypatch.setattr(db_config, "_pool", pool)
+    return pool, made
+
+
+def test_rows_are_read_one_batch_at_a_time(server):
+    _, made = server
+    stream = AirportRepository.iter_row_batches("FI", batch_size=10)
+    first = next(stream)
+    cursor = made[0].cursors[0]
+    assert first == ROWS[:10]
+    assert cursor.read == 10
+    rest = list(stream)
+    assert [len(b) for b in [first, *rest]] == [10, 10, 3]
+    assert cursor.fetches == [10, 10, 10, 10]
+    sql, params = cursor.query
+    assert "ORDER BY name" in sql
+    assert params == ("FI", "small_airport", "medium_airport", "large_airport")
+
+
+def test_table_and_airports_stream_the_same_rows(server):
+    table = AirportRepository.load_table(None, batch_size=4)
+    assert list(table.icao) == [r[0] for r in ROWS]
+    assert table.lat.tolist() == [r[3] for r in ROWS]
+    airports = list(AirportRepository.iter_airports(batch_size=7))
+    assert [a.icao for a in airports] == [r[0] for r in ROWS]
+    _, made = server
+    assert len(made) == 1
+
+
+def test_abandoned_stream_discards_its_connection(server):
+    pool, made = server
+    stream = AirportRepository.iter_row_batches(batch_size=5)
+    next(stream)
+    stream.close()
+    assert made[0].closed
+    assert pool.metrics().discarded == 1
+    assert len(list(AirportRepository.iter_row_batches(batch_size=50))) == 1
+    assert len(made) == 2 and not made[1].closed
+    assert pool.metrics().idle == 1
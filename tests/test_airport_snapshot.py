@@ -0,0 +1,57 @@
+"""Airport snapshots load the query result and follow changes to the database."""
+
+import pytest
+from game import config
+from game.db import repository
+from game.db.airport_snapshot import load_airports, load_snapshot, save_snapshot
+from game.db.sqlite_repo import SQLiteAirportRepository
+
+RECORDS = [
+    ("EFHK", "Helsinki Vantaa Airport", "FI", "large_airport", 60.3172, 24.963301),
+    ("EFTU", "Turku Airport", "FI", "medium_airport", 60.514099, 22.2628),
+    ("EFOU", "Oulu Airport", "FI", "medium_airport", 64.930099, 25.354601),
+    ("ESSA", "Stockholm-Arlanda Airport", "SE", "large_airport", 59.651901, 17.9186),
+]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    repo = SQLiteAirportRepository(":memory:")
+    repo.import_records(RECORDS)
+    monkeypatch.setattr(config, "DB_BACKEND", "sqlite")
+    monkeypatch.setattr(config, "SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(repository, "_repository", repo)
+    yield repo
+    repo.close()
+
+
+def _columns(table):
+    return list(table.icao), list(table.name), list(table.country), list(table.lat), list(table.lon)
+
+
+def test_round_trip(store, tmp_path):
+    table = store.load_table("FI")
+    save_snapshot(table, "FI", directory=str(tmp_path))
+    assert _columns(load_snapshot("FI", directory=str(tmp_path))) == _columns(table)
+    assert load_snapshot("SE", directory=str(tmp_path)) is None
+    assert load_snapshot("FI", directory=str(tmp_path), expected_rows=2) is None
+
+
+def test_corrupt_snapshot_is_ignored(store, tmp_path):
+    path = save_snapshot(store.load_table("FI"), "FI", directory=str(tmp_path))
+    with open(f"{path}/strings.bin", "r+b") as f:
+        f.write(b"X")
+    assert load_snapshot("FI", directory=str(tmp_path)) is None
+
+
+def test_snapshot_is_rebuilt_when_the_database_changes(store):
+    assert list(load_airports("FI").icao) == ["EFHK", "EFOU", "EFTU"]
+    store.import_records([("EFIV", "Ivalo Airport", "FI", "small_airport", 68.6073, 27.4053)])
+    assert list(load_airports("FI").icao) == ["EFHK", "EFIV", "EFOU", "EFTU"]
+
+
+def test_validation_can_be_skipped(store, monkeypatch):
+    load_airports("FI")
+    store.import_records([("EFIV", "Ivalo Airport", "FI", "small_airport", 68.6073, 27.4053)])
+    monkeypatch.setattr(config, "SNAPSHOT_VALIDATE", False)
+    assert len(load_airports("FI")) == 3
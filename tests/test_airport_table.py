@@ -0,0 +1,74 @@
+"""AirportTable lookups, slicing and construction."""
+
+import numpy as np
+import pytest
+from game.core.entities.airport import Airport
+from game.core.entities.airport_table import AirportTable, as_table
+
+AIRPORTS = [
+    Airport("EFHK", "Helsinki Vantaa Airport", "FI", 60.3172, 24.963301),
+    Airport("EFTU", "Turku Airport", "FI", 60.514099, 22.2628),
+    Airport("EFOU", "Oulu Airport", "FI", 64.930099, 25.354601),
+    Airport("ESSA", "Stockholm-Arlanda Airport", "SE", 59.651901, 17.9186),
+    Airport("EFIV", "Ivalo Airport", "FI", 68.607299, 27.4053),
+]
+
+
+@pytest.fixture
+def table():
+    return AirportTable.from_airports(AIRPORTS)
+
+
+def test_rows_and_lookups(table):
+    assert len(table) == 5
+    assert list(table) == AIRPORTS
+    assert table[2] == AIRPORTS[2]
+    assert table[-1] == AIRPORTS[-1]
+    for row, airport in enumerate(AIRPORTS):
+        assert table.row_of(airport.icao) == row
+        assert table.get(airport.icao) == airport
+        assert airport.icao in table
+    assert table.row_of("XXXX") is None
+    assert table.row_of("efhk") is None
+    assert table.get("XXXX") is None
+    assert "XXXX" not in table
+
+
+def test_slices_are_tables(table):
+    part = table[1:4]
+    assert isinstance(part, AirportTable)
+    assert list(part) == AIRPORTS[1:4]
+    assert part.row_of("EFOU") == 1
+    assert part.row_of("EFHK") is None
+    assert list(table[::-2]) == AIRPORTS[::-2]
+    assert len(table[5:]) == 0
+
+
+def test_first_duplicate_wins():
+    table = AirportTable.from_airports(AIRPORTS + [Airport("EFHK", "Copy", "FI", 0.0, 0.0)])
+    assert table.row_of("EFHK") == 0
+
+
+def test_row_batches_build_the_same_table(table):
+    rows = [(a.icao, a.name, a.country, a.lat, a.lon) for a in AIRPORTS]
+    built = AirportTable.from_row_batches([rows[:2], [], rows[2:]])
+    assert list(built) == AIRPORTS
+    assert built.fingerprint() == table.fingerprint()
+    assert len(AirportTable.from_row_batches([])) == 0
+
+
+def test_fingerprint_follows_codes_and_coordinates(table):
+    moved = AirportTable(table.icao, table.name, table.country, table.lat + 1e-9, table.lon)
+    assert moved.fingerprint() != table.fingerprint()
+    renamed = AirportTable(table.icao, ["x"] * 5, table.country, table.lat, table.lon)
+    assert renamed.fingerprint() == table.fingerprint()
+
+
+def test_columns_must_match(table):
+    with pytest.raises(ValueError):
+        AirportTable(table.icao, table.name, table.country, table.lat, np.zeros(4))
+
+
+def test_as_table(table):
+    assert as_table(table) is table
+    assert list(as_table(AIRPORTS)) == AIRPORTS
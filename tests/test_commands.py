@@ -0,0 +1,66 @@
+"""Input lines resolve to the right command and arguments."""
+
+import pytest
+from game.core.commands.command import (
+    ExitCommand,
+    FlyCommand,
+    MapCommand,
+    QuestLogCommand,
+    RefreshCommand,
+    get_command,
+    parse_command,
+)
+from game.core.game import Game
+from game.core.input.input_handler import handle_input
+
+
+@pytest.mark.parametrize(
+    "line, command, args",
+    [
+        ("fly 3", FlyCommand, "3"),
+        ("FLY 3", FlyCommand, "3"),
+        ("f 3", FlyCommand, "3"),
+        ('fly "3"', FlyCommand, "3"),
+        ("  7  ", FlyCommand, "7"),
+        ("m", MapCommand, ""),
+        ("ma", MapCommand, ""),
+        ("quests", QuestLogCommand, ""),
+        ("quest", QuestLogCommand, ""),
+        ("questl", QuestLogCommand, ""),
+        ("que", QuestLogCommand, ""),
+        ("ref", RefreshCommand, ""),
+        ("i", RefreshCommand, ""),
+        ("exit", ExitCommand, ""),
+        ("Quit", ExitCommand, ""),
+        ("q", ExitCommand, ""),
+        ('fly "3', FlyCommand, '"3'),
+    ],
+)
+def test_names_aliases_and_prefixes(line, command, args):
+    cmd, rest = parse_command(line)
+    assert type(cmd) is command
+    assert rest == args
+    assert get_command(line) is cmd
+
+
+def test_commands_are_shared_instances():
+    assert parse_command("map")[0] is parse_command("m")[0]
+
+
+@pytest.mark.parametrize("line", ["", "   ", "bogus", "x 3", "3a"])
+def test_unknown_input(line):
+    assert parse_command(line) == (None, "")
+
+
+@pytest.mark.parametrize("line", ["e", "ex", "exi", "qui", "exit2"])
+def test_exit_needs_its_exact_name_or_alias(line):
+    assert not isinstance(parse_command(line)[0], ExitCommand)
+
+
+def test_typo_does_not_end_the_game(world):
+    game = Game(world=world, seed=1)
+    game.start()
+    assert handle_input(game, "ex").status.value == "error"
+    assert game.is_running()
+    handle_input(game, "quit")
+    assert not game.is_running()
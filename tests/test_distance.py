@@ -0,0 +1,86 @@
+"""Distance tiers against the exact geodesic, within their documented errors."""
+
+import numpy as np
+import pytest
+from game import config
+from game.utils import distance
+from game.utils.distance import TIERS, batch_km, distance_km, many_to_many_km, one_to_many_km
+
+
+def _pairs(seed):
+    """Random global pairs, pairs up to ~1000 km apart and nearly antipodal pairs."""
+    rng = np.random.default_rng(seed)
+    n = 1500
+    lat1 = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, 3 * n)))
+    lon1 = rng.uniform(-180.0, 180.0, 3 * n)
+    lat2 = np.concatenate(
+        (
+            np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, n))),
+            np.clip(lat1[n : 2 * n] + rng.uniform(-9.0, 9.0, n), -90.0, 90.0),
+            -lat1[2 * n :] + rng.uniform(-0.5, 0.5, n),
+        )
+    )
+    lon2 = np.concatenate(
+        (
+            rng.uniform(-180.0, 180.0, n),
+            lon1[n : 2 * n] + rng.uniform(-9.0, 9.0, n),
+            lon1[2 * n :] + 180.0 + rng.uniform(-0.5, 0.5, n),
+        )
+    )
+    lon2 = (lon2 + 180.0) % 360.0 - 180.0
+    return lat1, lon1, lat2, lon2
+
+
+@pytest.fixture(scope="module")
+def pairs():
+    coords = _pairs(0)
+    return coords, distance.geodesic_km(*coords)
+
+
+def test_haversine_error(pairs):
+    coords, exact = pairs
+    err = np.abs(batch_km(*coords, tier="haversine") - exact)
+    assert (err <= 0.0057 * exact + 1e-9).all()
+    assert err.max() <= 38.0
+
+
+def test_ellipsoidal_error(pairs):
+    coords, exact = pairs
+    err = np.abs(batch_km(*coords, tier="ellipsoidal") - exact)
+    assert err[exact <= 1000.0].max() <= 1.5e-3
+    assert err[exact <= 10000.0].max() <= 13e-3
+    assert err.max() <= 30.0
+
+
+def test_vincenty_error(pairs):
+    coords, exact = pairs
+    err = np.abs(batch_km(*coords, tier="vincenty") - exact)
+    assert err.max() < 1e-7
+
+
+@pytest.mark.parametrize("tier", TIERS)
+def test_scalar_matches_batch(pairs, tier):
+    (lat1, lon1, lat2, lon2), _ = pairs
+    picks = range(0, len(lat1), 45)
+    batch = batch_km(lat1[picks], lon1[picks], lat2[picks], lon2[picks], tier=tier)
+    scalar = [distance_km(lat1[i], lon1[i], lat2[i], lon2[i], tier=tier) for i in picks]
+    assert scalar == pytest.approx(batch.tolist(), rel=1e-12, abs=1e-12)
+
+
+def test_same_point_is_zero():
+    for tier in TIERS:
+        assert distance_km(60.3, 24.9, 60.3, 24.9, tier=tier) == 0.0
+
+
+def test_shapes_and_defaults(monkeypatch):
+    lats, lons = np.array([60.0, 61.0, 62.0]), np.array([24.0, 25.0, 26.0])
+    assert one_to_many_km(60.0, 24.0, lats, lons).shape == (3,)
+    matrix = many_to_many_km(lats[:2], lons[:2], lats, lons)
+    assert matrix.shape == (2, 3)
+    assert matrix[1, 1] == 0.0
+    monkeypatch.setattr(config, "DISTANCE_TIER", "haversine")
+    assert one_to_many_km(60.0, 24.0, lats, lons).tolist() == (
+        distance.haversine_km(60.0, 24.0, lats, lons).tolist()
+    )
+    with pytest.raises(ValueError):
+        distance_km(0.0, 0.0, 1.0, 1.0, tier="flat")
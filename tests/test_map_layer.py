@@ -0,0 +1,89 @@
+"""MapLayer bins every airport into the cell of its coordinates."""
+
+import re
+import pytest
+from benchmarks.synthetic import clustered
+from game.cli.renderer import MAP_PADDING_DEG, MapLayer, Renderer, get_map_layer
+from game.core.entities.airport import Airport
+from game.core.entities.airport_table import AirportTable
+from game.utils import colors
+
+
+def _cell(layer, lat, lon):
+    x = (lon - layer.min_lon) / (layer.max_lon - layer.min_lon) * (layer.width - 1)
+    y = (1 - (lat - layer.min_lat) / (layer.max_lat - layer.min_lat)) * (layer.height - 1)
+    return round(x), round(y)
+
+
+def test_counts_match_per_airport_cells():
+    airports = clustered(500, seed=3)
+    layer = MapLayer(airports, 40, 30)
+    expected = [[0] * 40 for _ in range(30)]
+    for ap in airports:
+        x, y = _cell(layer, ap.lat, ap.lon)
+        assert layer.cell(ap.lat, ap.lon) == (x, y)
+        expected[y][x] += 1
+    assert layer.counts.tolist() == expected
+    assert layer.min_lat == pytest.approx(airports.lat.min() - MAP_PADDING_DEG)
+    assert layer.max_lon == pytest.approx(airports.lon.max() + MAP_PADDING_DEG)
+
+
+def test_glyphs_follow_density():
+    airports = clustered(500, seed=3)
+    layer = MapLayer(airports, 40, 30)
+    assert [len(row) for row in layer.rows] == [40] * 30
+    for row, counts in zip(layer.rows, layer.counts):
+        for glyph, count in zip(row, counts):
+            assert (glyph == " ") == (count == 0)
+    y, x = divmod(int(layer.counts.argmax()), 40)
+    assert layer.rows[y][x] == "#"
+    singles = {layer.rows[y][x] for y, x in zip(*(layer.counts == 1).nonzero())}
+    assert singles <= {"."}
+
+
+def test_sparse_layer_uses_the_lightest_glyph():
+    airports = AirportTable.from_airports(
+        [Airport("AAAA", "A", "FI", 60.0, 20.0), Airport("BBBB", "B", "FI", 65.0, 30.0)]
+    )
+    layer = MapLayer(airports, 10, 5)
+    assert sorted("".join(layer.rows).replace(" ", "")) == [".", "."]
+    assert (layer.cell(60.0, 20.0), layer.cell(65.0, 30.0)) == ((0, 4), (9, 0))
+    # Padding keeps edge airports off the frame.
+    assert layer.min_lat < 60.0 and layer.max_lon > 30.0
+
+
+def test_layers_are_cached_per_airport_set_and_size():
+    airports = clustered(200, seed=4)
+    layer = get_map_layer(airports, 40, 30)
+    assert get_map_layer(AirportTable.from_airports(list(airports)), 40, 30) is layer
+    assert get_map_layer(airports, 20, 10) is not layer
+
+
+def test_overlay_marks_player_and_target():
+    airports = clustered(200, seed=5)
+    renderer_ = Renderer()
+    layer = get_map_layer(airports, renderer_.map_width, renderer_.map_height)
+    current, target = airports[0], airports[1]
+    rows = renderer_.draw_map(current, target, airports).split("\n")
+    cx, cy = layer.cell(current.lat, current.lon)
+    tx, ty = layer.cell(target.lat, target.lon)
+    assert rows[ty][tx] == "X"
+    if (cx, cy) != (tx, ty):
+        assert rows[cy][cx] == "@"
+    shared = renderer_.draw_map(current, current, airports).split("\n")
+    assert shared[cy][cx] == "X"
+    # The cached layer itself is never drawn on.
+    assert layer.rows[cy][cx] not in "@X"
+
+
+def test_styled_map(monkeypatch):
+    airports = clustered(200, seed=5)
+    renderer_ = Renderer()
+    current, target = airports[0], airports[1]
+    monkeypatch.setattr(colors, "ENABLE_COLOR", False)
+    plain = renderer_.draw_map(current, target, airports)
+    assert renderer_.draw_map_styled(current, target, airports) == plain
+    monkeypatch.setattr(colors, "ENABLE_COLOR", True)
+    styled = renderer_.draw_map_styled(current, target, airports)
+    assert "\033[" in styled
+    assert re.sub(r"\033\[[0-9;]*m", "", styled) == plain
@@ -0,0 +1,93 @@
+"""A* routes against a brute-force Dijkstra over the same move rule and prices."""
+
+import random
+from heapq import heappop, heappush
+import pytest
+from game.core.game import Game
+from game.core.planning.optimal_route import compute_optimal_route
+from game.core.planning.weather_costs import WeatherCosts
+from game.utils.distance import one_to_many_km
+
+K = Game.K_NEIGHBORS
+
+
+def _dijkstra(graph, s, t, dist, costs=None):
+    """Cheapest fuel from `s` to `t` expanding every node with the game's move rule."""
+    best = {s: 0.0}
+    heap = [(0.0, s)]
+    while heap:
+        cost, u = heappop(heap)
+        if u == t:
+            return cost
+        if cost > best[u]:
+            continue
+        rows, legs, positions = graph.forward_edges(u, dist, K)
+        prices = Game.FUEL_TAKEOFF_LANDING + Game.FUEL_PER_KM * legs
+        if costs is not None:
+            prices = prices * costs.factors(u, rows, positions)
+        for v, price in zip(rows.tolist(), prices.tolist()):
+            if cost + price < best.get(v, float("inf")):
+                best[v] = cost + price
+                heappush(heap, (cost + price, v))
+    return None
+
+
+def _pairs(world, count, seed=0):
+    rng = random.Random(seed)
+    n = len(world.airports)
+    return [(rng.randrange(n), rng.randrange(n)) for _ in range(count)]
+
+
+def _plan(world, s, t, **kwargs):
+    a = world.airports
+    dist = one_to_many_km(a.lat[t], a.lon[t], a.lat, a.lon)
+    route = compute_optimal_route(
+        start_airport=a[s],
+        target_airport=a[t],
+        all_airports=a,
+        fuel_per_km=Game.FUEL_PER_KM,
+        fuel_fixed=Game.FUEL_TAKEOFF_LANDING,
+        k_neighbors=K,
+        index=world.index,
+        target_dist_km=dist,
+        **kwargs,
+    )
+    return route, dist
+
+
+def test_matches_dijkstra(world):
+    for s, t in _pairs(world, 60):
+        route, dist = _plan(world, s, t, graph=world.graph)
+        expected = _dijkstra(world.graph, s, t, dist)
+        assert route.success == (expected is not None)
+        if expected is not None:
+            assert route.base_fuel == pytest.approx(expected, rel=1e-9)
+
+
+def test_route_is_consistent(world):
+    for s, t in _pairs(world, 20, seed=1):
+        route, _ = _plan(world, s, t, graph=world.graph)
+        assert route.path[0].icao == world.airports.icao[s]
+        assert route.path[-1].icao == world.airports.icao[t]
+        assert route.hops == len(route.path) - 1
+        fuel = Game.FUEL_TAKEOFF_LANDING * route.hops + Game.FUEL_PER_KM * route.distance_km
+        assert route.base_fuel == pytest.approx(fuel, rel=1e-9)
+
+
+def test_weather_matches_dijkstra(world):
+    costs = WeatherCosts(world.weather_edges)
+    for tick, (s, t) in enumerate(_pairs(world, 30, seed=2)):
+        costs.update(world.weather.frame(1000 + tick))
+        route, dist = _plan(world, s, t, costs=costs)
+        expected = _dijkstra(world.graph, s, t, dist, costs)
+        assert route.expected_fuel == pytest.approx(expected, rel=1e-9)
+
+
+def test_incremental_weather_prices_match_full_pricing(world):
+    incremental = WeatherCosts(world.weather_edges)
+    for tick in range(500, 520):
+        frame = world.weather.frame(tick)
+        incremental.update(frame)
+        full = WeatherCosts(world.weather_edges)
+        full.update(frame)
+        assert (incremental.cell_mod == full.cell_mod).all()
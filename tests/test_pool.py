@@ -0,0 +1,94 @@
+"""Connection pool limits, timeouts and health checks (with fake connections)."""
+
+import threading
+import time
+import pytest
+from game.db.config import ConnectionPool
+
+
+class FakeConnection:
+    """Stands in for a DB-API connection."""
+
+    def __init__(self) -> None:
+        self.healthy = True
+        self.closed = False
+
+    def ping(self, reconnect: bool = False) -> None:
+        if not self.healthy:
+            raise OSError("gone")
+
+    def cursor(self, *args, **kwargs):
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _pool(size=2, timeout=0.05, health_check_after=30.0):
+    made = []
+
+    def connect():
+        made.append(FakeConnection())
+        return made[-1]
+
+    pool = ConnectionPool(
+        connect, size=size, timeout=timeout, health_check_after=health_check_after
+    )
+    return pool, made
+
+
+def test_size_limit_and_timeout():
+    pool, made = _pool(size=2)
+    a, b = pool.acquire(), pool.acquire()
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+    assert time.monotonic() - started >= 0.05
+    assert len(made) == 2
+    pool.release(a)
+    assert pool.acquire() is a
+    pool.release(b)
+
+
+def test_waiter_gets_released_connection():
+    pool, _ = _pool(size=1, timeout=2.0)
+    held = pool.acquire()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+    waiter.start()
+    time.sleep(0.05)
+    pool.release(held)
+    waiter.join(1.0)
+    assert got == [held]
+    assert pool.metrics().waits == 1
+
+
+def test_connections_are_reused():
+    pool, made = _pool(size=4)
+    for _ in range(10):
+        with pool.connection():
+            pass
+    assert len(made) == 1
+    m = pool.metrics()
+    assert (m.checkouts, m.created, m.in_use, m.idle) == (10, 1, 0, 1)
+
+
+def test_stale_unhealthy_connection_is_replaced():
+    pool, made = _pool(size=1, health_check_after=0.0)
+    with pool.connection():
+        pass
+    made[0].healthy = False
+    conn = pool.acquire()
+    assert made[0].closed and conn.raw is made[1]
+    assert pool.metrics().discarded == 1
+
+
+def test_failed_query_discards_broken_connection():
+    pool, made = _pool(size=1)
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            made[0].healthy = False
+            raise RuntimeError("query failed")
+    assert made[0].closed
+    with pool.connection() as conn:
+        assert conn.raw is made[1]
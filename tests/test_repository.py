@@ -0,0 +1,106 @@
+"""The SQLite and in-memory backends answer every query the same way."""
+
+import csv
+import pytest
+from game import config
+from game.db import repository
+from game.db.memory_repo import InMemoryAirportRepository, read_airports_csv
+from game.db.sqlite_repo import SQLiteAirportRepository
+
+RECORDS = [
+    ("EFHK", "Helsinki Vantaa Airport", "FI", "large_airport", 60.3172, 24.963301),
+    ("EFTU", "turku Airport", "FI", "medium_airport", 60.514099, 22.2628),
+    ("EFOU", "Oulu Airport", "FI", "medium_airport", 64.930099, 25.354601),
+    ("EFIV", "Ivalo Airport", "FI", "small_airport", 68.607299, 27.4053),
+    ("EFXX", "Abandoned Field", "FI", "closed", 61.0, 25.0),
+    ("EFNC", "Nowhere Heliport", "FI", "heliport", 62.0, 26.0),
+    ("EFZZ", "Zero Island", "FI", "small_airport", 0.0, 0.0),
+    ("EFNL", "Lost Strip", "FI", "small_airport", None, None),
+    ("ESSA", "Stockholm-Arlanda Airport", "SE", "large_airport", 59.651901, 17.918600),
+    ("NZCH", "Christchurch Airport", "NZ", "large_airport", -43.489399, 172.531998),
+    ("NFFN", "Nadi Airport", "FJ", "large_airport", -17.755399, 177.442993),
+    ("NSFA", "Faleolo Airport", "WS", "large_airport", -13.83, -172.008003),
+]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repo(request):
+    if request.param == "memory":
+        yield InMemoryAirportRepository(RECORDS)
+    else:
+        store = SQLiteAirportRepository(":memory:")
+        store.import_records(RECORDS)
+        yield store
+        store.close()
+
+
+def test_listing_is_filtered_and_ordered_by_name(repo):
+    names = [a.name for a in repo.list_airports("FI")]
+    assert names == [
+        "Helsinki Vantaa Airport",
+        "Ivalo Airport",
+        "Oulu Airport",
+        "turku Airport",
+    ]
+    assert repo.count_airports("FI") == 4
+    assert repo.count_airports(None) == 8
+    assert repo.count_airports("FI", ["small_airport"]) == 1
+
+
+def test_batches_cover_every_row(repo):
+    batches = list(repo.iter_row_batches(None, batch_size=3))
+    assert [len(b) for b in batches] == [3, 3, 2]
+    assert [row[0] for b in batches for row in b] == [a.icao for a in repo.list_airports(None)]
+    table = repo.load_table(None, batch_size=2)
+    assert list(table.icao) == [a.icao for a in repo.list_airports(None)]
+
+
+def test_get_by_icao(repo):
+    found = repo.get_by_icao("efou")
+    assert (found.icao, found.country) == ("EFOU", "FI")
+    assert found.lat == pytest.approx(64.930099)
+    assert repo.get_by_icao("XXXX") is None
+
+
+def test_bbox(repo):
+    table = repo.within_bbox(59.0, 20.0, 65.0, 26.0)
+    assert sorted(table.icao) == ["EFHK", "EFOU", "EFTU"]
+    assert list(repo.within_bbox(59.0, 20.0, 65.0, 26.0, country="SE").icao) == []
+
+
+def test_bbox_across_the_antimeridian(repo):
+    table = repo.within_bbox(-50.0, 170.0, -10.0, -170.0)
+    assert list(table.icao) == ["NZCH", "NSFA", "NFFN"]
+
+
+def test_sqlite_import_updates_existing_rows():
+    store = SQLiteAirportRepository(":memory:")
+    assert store.is_empty()
+    store.import_records(RECORDS)
+    store.import_records([("EFHK", "Helsinki Airport", "FI", "large_airport", 60.3, 24.9)])
+    assert store.count_airports("FI") == 4
+    assert store.get_by_icao("EFHK").name == "Helsinki Airport"
+    assert sorted(store.within_bbox(60.2, 24.8, 60.4, 25.0).icao) == ["EFHK"]
+    store.close()
+
+
+def test_csv_backends_agree(tmp_path, monkeypatch):
+    path = tmp_path / "airports.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        out = csv.writer(f)
+        out.writerow(
+            ["id", "ident", "type", "name", "latitude_deg", "longitude_deg", "iso_country"]
+        )
+        for i, (icao, name, country, kind, lat, lon) in enumerate(RECORDS):
+            coords = ["" if lat is None else lat, "" if lon is None else lon]
+            out.writerow([i, icao, kind, name, *coords, country])
+    assert list(read_airports_csv(str(path))) == RECORDS
+
+    monkeypatch.setattr(config, "AIRPORTS_CSV", str(path))
+    monkeypatch.setattr(config, "SQLITE_PATH", str(tmp_path / "airports.db"))
+    memory = repository._create_repository("memory")
+    sqlite = repository._create_repository("sqlite")
+    assert memory.list_airports(None) == sqlite.list_airports(None)
+    sqlite.close()
+    with pytest.raises(ValueError):
+        repository._create_repository("oracle")
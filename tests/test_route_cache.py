@@ -0,0 +1,95 @@
+"""RouteCache memoizes planned routes in an LRU and an optional SQLite file."""
+
+import pytest
+from game.core.entities.airport import Airport
+from game.core.game import Game
+from game.core.planning import route_cache
+from game.core.planning.player_rule_route import RouteResult
+from game.core.planning.route_cache import RouteCache, route_key
+from game.core.world import World
+
+HOME = Airport("EFHK", "Helsinki Vantaa Airport", "FI", 60.3172, 24.963301)
+
+
+def _key(target, weather=""):
+    return route_key("rule", "EFHK", target, 0.1, 2.0, 8, "ellipsoidal", "abc", weather)
+
+
+def _route(km):
+    return RouteResult([HOME], 1, km, km / 10, True)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = RouteCache(capacity=2)
+    cache.put(_key("A"), _route(1.0))
+    cache.put(_key("B"), _route(2.0))
+    assert cache.get(_key("A")).distance_km == 1.0
+    cache.put(_key("C"), _route(3.0))
+    assert cache.get(_key("B")) is None
+    assert cache.get(_key("A")) is not None and cache.get(_key("C")) is not None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (3, 1, 1, 2)
+
+
+def test_get_or_compute_calls_the_planner_once():
+    cache = RouteCache(capacity=8)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return _route(5.0)
+
+    first = cache.get_or_compute(_key("A"), compute)
+    assert cache.get_or_compute(_key("A"), compute) is first
+    assert cache.get_or_compute(_key("A", weather="1.0@3"), compute) is not first
+    assert len(calls) == 2
+
+
+def test_disabled_memory_tier_keeps_nothing():
+    cache = RouteCache(capacity=0)
+    cache.put(_key("A"), _route(1.0))
+    assert cache.get(_key("A")) is None
+    assert cache.stats().size == 0
+
+
+def test_routes_persist_across_processes(tmp_path):
+    path = str(tmp_path / "sub" / "routes.db")
+    cache = RouteCache(capacity=8, path=path)
+    cache.put(_key("A"), _route(1.5))
+    cache.close()
+
+    reopened = RouteCache(capacity=8, path=path)
+    route = reopened.get(_key("A"))
+    assert route == _route(1.5)
+    assert reopened.get(_key("A")) is route
+    assert reopened.get(_key("B")) is None
+    stats = reopened.stats()
+    assert (stats.disk_hits, stats.hits, stats.misses) == (1, 1, 1)
+    reopened.clear()
+    assert reopened.get(_key("A")) == route
+    reopened.close()
+
+
+@pytest.mark.parametrize("planner", ["rule", "optimal"])
+def test_games_share_planned_routes(small_world, monkeypatch, planner):
+    cache = RouteCache(capacity=64)
+    monkeypatch.setattr(route_cache, "_cache", cache)
+    monkeypatch.setattr(Game, "ROUTE_PLANNER", planner)
+    # No background planning of the next quest, so the counters are exact.
+    monkeypatch.setattr(Game, "PREFETCH_HOPS", 0)
+
+    first = Game(world=World(small_world.airports), seed=11)
+    first.start()
+    misses = cache.stats().misses
+    assert misses >= 1 and cache.stats().hits == 0
+
+    second = Game(world=World(small_world.airports), seed=11)
+    second.start()
+    assert cache.stats().misses == misses
+    assert cache.stats().hits >= 1
+    assert second.status() == first.status()
+
+    start, target = first.state.player.location, first.get_target_airport()
+    key = first._route_key(start.icao, target.icao, first.weather_tick)
+    distances = first._target_distances(target)
+    assert cache.get(key) == first._compute_route(start, target, distances, first.weather_tick)
@@ -0,0 +1,133 @@
+"""Precomputed route tables against the planners they replace."""
+
+import random
+import pytest
+from game import config
+from game.core.game import Game
+from game.core.planning.optimal_route import compute_optimal_route
+from game.core.planning.player_rule_route import compute_player_rule_route
+from game.core.planning.quest_index import QuestIndex, parse_difficulty
+from game.core.planning.route_table import load_route_table
+from game.core.world import World
+from game.routes.builder import build_route_table
+from game.utils.distance import one_to_many_km
+
+SETTINGS = (Game.FUEL_PER_KM, Game.FUEL_TAKEOFF_LANDING, Game.K_NEIGHBORS)
+
+
+def _load(world, planner, directory):
+    return load_route_table(
+        world.airports, planner, *SETTINGS, config.DISTANCE_TIER, str(directory)
+    )
+
+
+@pytest.mark.parametrize("planner", ["rule", "optimal"])
+def test_table_matches_planner(small_world, tmp_path, planner):
+    stats = build_route_table(small_world, planner, *SETTINGS, directory=str(tmp_path))
+    table = _load(small_world, planner, tmp_path)
+    assert table is not None
+    a = small_world.airports
+    n = len(a)
+    assert stats.pairs == n * (n - 1)
+    for t in range(n):
+        dist = one_to_many_km(a.lat[t], a.lon[t], a.lat, a.lon)
+        for s in range(n):
+            common = dict(
+                start_airport=a[s],
+                target_airport=a[t],
+                all_airports=a,
+                fuel_per_km=Game.FUEL_PER_KM,
+                fuel_fixed=Game.FUEL_TAKEOFF_LANDING,
+                k_neighbors=Game.K_NEIGHBORS,
+                index=small_world.index,
+                target_dist_km=dist,
+            )
+            if planner == "rule":
+                live = compute_player_rule_route(**common)
+            else:
+                live = compute_optimal_route(**common, graph=small_world.graph)
+            got = table.route(s, t)
+            assert [x.icao for x in got.path] == [x.icao for x in live.path]
+            assert (got.hops, got.success) == (live.hops, live.success)
+            assert got.message == live.message
+            assert got.distance_km == pytest.approx(live.distance_km, rel=1e-9, abs=1e-9)
+            assert got.base_fuel == pytest.approx(live.base_fuel, rel=1e-9, abs=1e-9)
+
+
+def test_table_is_keyed_by_settings(small_world, tmp_path):
+    build_route_table(small_world, "optimal", *SETTINGS, directory=str(tmp_path))
+    assert _load(small_world, "rule", tmp_path) is None
+    assert (
+        load_route_table(
+            small_world.airports,
+            "optimal",
+            Game.FUEL_PER_KM * 2,
+            Game.FUEL_TAKEOFF_LANDING,
+            Game.K_NEIGHBORS,
+            config.DISTANCE_TIER,
+            str(tmp_path),
+        )
+        is None
+    )
+
+
+def test_build_with_workers_matches_single_process(small_world, tmp_path):
+    build_route_table(small_world, "optimal", *SETTINGS, directory=str(tmp_path / "one"))
+    build_route_table(
+        small_world, "optimal", *SETTINGS, workers=2, directory=str(tmp_path / "two")
+    )
+    one = _load(small_world, "optimal", tmp_path / "one")
+    two = _load(small_world, "optimal", tmp_path / "two")
+    for name in ("cost", "km", "hops", "next", "reached"):
+        assert (getattr(one, name) == getattr(two, name)).all()
+
+
+def test_quest_difficulty_draws_from_table(small_world, tmp_path, monkeypatch):
+    build_route_table(small_world, "optimal", *SETTINGS, directory=str(tmp_path))
+    monkeypatch.setattr(config, "ROUTE_TABLE_DIR", str(tmp_path))
+    game = Game(world=World(small_world.airports), seed=4)
+    game.ROUTE_PLANNER = "optimal"
+    game.QUEST_DIFFICULTY = "hard"
+    game.start()
+    assert game.state.active_quest is not None
+    assert game._ideal_route.success
+
+
+@pytest.mark.parametrize(
+    "planner, difficulty, with_table",
+    [("optimal", "medium,far", True), ("optimal", "medium", False), ("weather", "medium", True)],
+)
+def test_unservable_quest_difficulty_fails_at_start(
+    small_world, tmp_path, monkeypatch, planner, difficulty, with_table
+):
+    build_route_table(small_world, "optimal", *SETTINGS, directory=str(tmp_path))
+    monkeypatch.setattr(config, "ROUTE_TABLE_DIR", str(tmp_path) if with_table else "")
+    game = Game(world=World(small_world.airports), seed=4)
+    game.ROUTE_PLANNER = planner
+    game.QUEST_DIFFICULTY = difficulty
+    with pytest.raises(ValueError):
+        game.start()
+
+
+def test_empty_difficulty_widens_to_any_reachable_target(small_world, tmp_path):
+    build_route_table(small_world, "optimal", *SETTINGS, directory=str(tmp_path))
+    table = _load(small_world, "optimal", tmp_path)
+    index = QuestIndex(table)
+    nowhere = parse_difficulty("0-1km")
+    rng = random.Random(3)
+    for start in range(len(small_world.airports)):
+        assert index.count(start, nowhere) == 0
+        target = index.sample(start, nowhere, rng)
+        assert target is not None and target != start
+        assert table.reached[target, start]
+
+
+def test_start_reaching_nothing_gets_no_quest(small_world, tmp_path, monkeypatch):
+    build_route_table(small_world, "optimal", *SETTINGS, directory=str(tmp_path))
+    monkeypatch.setattr(config, "ROUTE_TABLE_DIR", str(tmp_path))
+    monkeypatch.setattr(QuestIndex, "sample", lambda self, start, difficulty, rng: None)
+    game = Game(world=World(small_world.airports), seed=4)
+    game.ROUTE_PLANNER = "optimal"
+    game.QUEST_DIFFICULTY = "hard"
+    game.start()
+    assert game.state.active_quest is None
@@ -0,0 +1,78 @@
+"""Screen writes only the lines that changed since the previous frame."""
+
+import io
+import os
+import pytest
+from game.cli import renderer
+from game.cli.renderer import CLEAR_SCREEN, Screen
+
+
+@pytest.fixture(autouse=True)
+def terminal(monkeypatch):
+    monkeypatch.setattr(renderer.shutil, "get_terminal_size", lambda: os.terminal_size((80, 24)))
+
+
+def _frame(screen, *lines, prompt="> "):
+    screen.add(*lines)
+    return screen.render(prompt, interactive=True)
+
+
+def test_first_frame_is_drawn_in_full():
+    assert _frame(Screen(io.StringIO()), "a", "b\nc") == CLEAR_SCREEN + "a\nb\nc\n> "
+
+
+def test_only_changed_lines_are_rewritten():
+    screen = Screen(io.StringIO())
+    _frame(screen, "status", "options", "output 1")
+    out = _frame(screen, "status", "options", "output 2")
+    assert out == "\033[3;1Houtput 2\033[K\033[4;1H\033[J> "
+    assert _frame(screen, "status", "options", "output 2") == "\033[4;1H\033[J> "
+
+
+def test_shorter_frame_clears_the_rest():
+    screen = Screen(io.StringIO())
+    _frame(screen, "a", "b", "c", "d")
+    assert _frame(screen, "a", "x") == "\033[2;1Hx\033[K\033[3;1H\033[J> "
+
+
+def test_longer_frame_adds_lines():
+    screen = Screen(io.StringIO())
+    _frame(screen, "a")
+    assert _frame(screen, "a", "b") == "\033[2;1Hb\033[K\033[3;1H\033[J> "
+
+
+def test_invalidate_and_tall_frames_redraw_in_full():
+    screen = Screen(io.StringIO())
+    _frame(screen, "a")
+    screen.invalidate()
+    assert _frame(screen, "a").startswith(CLEAR_SCREEN)
+    tall = [str(i) for i in range(23)]
+    assert _frame(screen, *tall).startswith(CLEAR_SCREEN)
+    # The terminal scrolled, so the next frame cannot be diffed either.
+    assert _frame(screen, "a").startswith(CLEAR_SCREEN)
+
+
+def test_plain_stream_gets_plain_text():
+    stream = io.StringIO()
+    screen = Screen(stream)
+    screen.add("a", "b")
+    screen.flush("> ")
+    screen.add("a", "b")
+    screen.flush("> ")
+    assert stream.getvalue() == "a\nb\n> a\nb\n> "
+    assert screen.bytes_written == len(stream.getvalue())
+
+
+def test_flush_writes_once():
+    class Stream(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            self.writes += 1
+            return super().write(text)
+
+    stream = Stream()
+    screen = Screen(stream)
+    screen.add("status", "options", "output")
+    screen.flush("> ")
+    assert stream.writes == 1
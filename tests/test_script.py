@@ -0,0 +1,63 @@
+"""Script mode plays commands through the command layer, one record each."""
+
+import io
+import json
+import sys
+from game.cli import __main__ as cli_main
+from game.cli.script import format_record, run_script
+from game.core.game import Game
+from game.core.world import World
+from game.utils import colors
+
+COMMANDS = ["# scripted run", "", "1", "bogus", "quests", "2", "exit", "1"]
+
+
+def _play(small_world, as_json, seed=7):
+    game = Game(world=World(small_world.airports), seed=seed)
+    game.start()
+    out = io.StringIO()
+    summary = run_script(game, COMMANDS, out, as_json=as_json)
+    return game, out.getvalue().splitlines(), summary
+
+
+def test_json_records(small_world):
+    game, lines, summary = _play(small_world, as_json=True)
+    records = [json.loads(line) for line in lines]
+    turns, end = records[:-1], records[-1]
+    # Comments and blank lines are skipped, nothing is read after `exit`.
+    assert [r["input"] for r in turns] == ["1", "bogus", "quests", "2", "exit"]
+    assert [r["turn"] for r in turns] == [1, 2, 3, 4, 5]
+    assert [r["status"] for r in turns] == ["ok", "error", "ok", "ok", "ok"]
+    assert [r["hops"] for r in turns] == [1, 1, 1, 2, 2]
+    assert [r["running"] for r in turns] == [True, True, True, True, False]
+    assert all(r["messages"] and "\n" not in "".join(r["messages"]) for r in turns)
+    assert turns[-1]["icao"] == game.status()["icao"]
+    assert end == summary
+    assert (end["end"], end["turns"], end["errors"], end["hops"]) == (True, 5, 1, 2)
+
+
+def test_text_records_match_json(small_world):
+    _, text, _ = _play(small_world, as_json=False)
+    _, lines, _ = _play(small_world, as_json=True)
+    records = [json.loads(line) for line in lines[:-1]]
+    assert text[:-1] == [format_record(r) for r in records]
+    assert text[-1].startswith("end turns=5 errors=1 ")
+    assert "\033[" not in "".join(text)
+
+
+def test_same_seed_replays_identically(small_world):
+    first = _play(small_world, as_json=True)[1][:-1]
+    assert _play(small_world, as_json=True)[1][:-1] == first
+    assert _play(small_world, as_json=True, seed=8)[1][:-1] != first
+
+
+def test_cli_reads_stdin(small_world, monkeypatch, capsys):
+    monkeypatch.setattr(colors, "ENABLE_COLOR", colors.ENABLE_COLOR)
+    monkeypatch.setattr(
+        World, "load", classmethod(lambda cls, country: World(small_world.airports))
+    )
+    monkeypatch.setattr(sys, "argv", ["game.cli", "--script", "-", "--seed", "7", "--json"])
+    monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(COMMANDS) + "\n"))
+    cli_main.cli()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:-1] == _play(small_world, as_json=True)[1][:-1]
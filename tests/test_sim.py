@@ -0,0 +1,81 @@
+"""Simulated games are reproducible from their seed, however the prefetch threads run."""
+
+import random
+import threading
+import time
+import pytest
+from game import config
+from game.core.game import Game
+from game.replay.journal import state_hash
+from game.sim.engine import play_game, run_batch
+from game.sim.policies import make_policy
+
+TURNS = 120
+
+
+def _hashes(world, policy, seed, planner="optimal"):
+    """State hash after every turn of a bot-played game."""
+    game = Game(world=world, seed=seed)
+    game.ROUTE_PLANNER = planner
+    bot = make_policy(policy, random.Random(seed ^ 0x5EED))
+    game.start()
+    hashes = []
+    while game.is_running() and game.state.active_quest and len(hashes) < TURNS:
+        opts = game.options()
+        if not opts:
+            break
+        game.pick(bot.choose(game, opts))
+        hashes.append(state_hash(game, full=True))
+    return hashes, game.quest_scores
+
+
+def _delay_prefetch(monkeypatch, seconds):
+    """Make quests planned on prefetch threads finish several turns late."""
+    prepare = Game._prepare_quest
+
+    def delayed(self, *args):
+        if threading.current_thread() is not threading.main_thread():
+            time.sleep(seconds)
+        return prepare(self, *args)
+
+    monkeypatch.setattr(Game, "_prepare_quest", delayed)
+
+
+def test_weather_routes_ignore_prefetch_timing(world, monkeypatch):
+    expected = _hashes(world, "greedy", 2, planner="weather")
+    assert expected[1], "game completed no quest"
+    _delay_prefetch(monkeypatch, 0.02)
+    assert _hashes(world, "greedy", 2, planner="weather") == expected
+
+
+@pytest.mark.parametrize("policy", ["greedy", "random", "optimal"])
+def test_same_seed_replays_identically(world, monkeypatch, policy):
+    expected = _hashes(world, policy, 8)
+    assert _hashes(world, policy, 8) == expected
+    _delay_prefetch(monkeypatch, 0.005)
+    assert _hashes(world, policy, 8) == expected
+
+
+def test_failed_prefetch_plans_the_same_quest(world, monkeypatch):
+    expected = _hashes(world, "greedy", 8)
+    prepare = Game._prepare_quest
+
+    def failing(self, *args):
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError("worker failed")
+        return prepare(self, *args)
+
+    monkeypatch.setattr(Game, "_prepare_quest", failing)
+    assert _hashes(world, "greedy", 8) == expected
+
+
+def test_play_game_is_reproducible(world):
+    first = play_game(world, "random", 5, max_turns=80)
+    assert play_game(world, "random", 5, max_turns=80) == first
+
+
+def test_batch_distance_tier_is_restored(world):
+    tier = config.DISTANCE_TIER
+    summary = run_batch(world, "greedy", 2, max_turns=20, distance_tier="ellipsoidal")
+    assert summary.games == 2
+    assert config.DISTANCE_TIER == tier
@@ -0,0 +1,61 @@
+"""Game snapshots restore a game that continues exactly like the original."""
+
+import pytest
+from game.core.game import Game
+from game.core.input.input_handler import handle_input
+from game.core.state.snapshot import dump_game, load_game
+from game.replay.journal import state_hash
+
+MOVES = ["1", "2", "1", "3", "2", "1", "1", "2", "3", "1"]
+
+
+def _played(world, seed, moves, planner="optimal"):
+    game = Game(world=world, seed=seed)
+    game.ROUTE_PLANNER = planner
+    game.start()
+    for move in moves:
+        handle_input(game, move)
+    return game
+
+
+@pytest.mark.parametrize("planner", ["optimal", "weather"])
+def test_round_trip_continues_identically(world, planner):
+    original = _played(world, 11, MOVES[:4], planner)
+    restored = Game(world=world, seed=999)
+    restored.ROUTE_PLANNER = planner
+    load_game(restored, dump_game(original))
+    assert restored.seed == original.seed
+    assert state_hash(restored, full=True) == state_hash(original, full=True)
+    for move in MOVES[4:]:
+        handle_input(original, move)
+        handle_input(restored, move)
+        assert state_hash(restored, full=True) == state_hash(original, full=True)
+    assert restored.quest_scores == original.quest_scores
+    assert restored.total_fuel_used == original.total_fuel_used
+
+
+def test_snapshot_is_stable(world):
+    game = _played(world, 5, MOVES[:3])
+    data = dump_game(game)
+    restored = Game(world=world)
+    load_game(restored, data)
+    assert dump_game(restored) == data
+
+
+@pytest.mark.parametrize(
+    "mangle",
+    [
+        lambda d: b"XXX" + d[3:],
+        lambda d: d[:3] + bytes([d[3] + 1]) + d[4:],
+        lambda d: d[:40],
+    ],
+)
+def test_bad_snapshots_are_rejected(world, mangle):
+    data = dump_game(_played(world, 3, MOVES[:2]))
+    with pytest.raises(ValueError):
+        load_game(Game(world=world), mangle(data))
+
+
+def test_unstarted_game_cannot_be_saved(world):
+    with pytest.raises(RuntimeError):
+        dump_game(Game(world=world))
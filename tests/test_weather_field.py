@@ -0,0 +1,17 @@
+"""Legs sampled without a rendered frame match the rendered frame exactly."""
+
+import random
+from game.core.events.weather_field import WeatherField
+
+
+def test_unrendered_legs_match_the_frame(world):
+    a = world.airports
+    rng = random.Random(4)
+    legs = [(rng.randrange(len(a)), rng.randrange(len(a))) for _ in range(40)]
+    for tick in (0, 7, 1000, 123456):
+        lazy = WeatherField.from_airports(a, seed=9)
+        rendered = WeatherField.from_airports(a, seed=9)
+        rendered.frame(tick)
+        for s, t in legs:
+            args = (tick, a.lat[s], a.lon[s], a.lat[t], a.lon[t])
+            assert lazy.sample_leg(*args) == rendered.sample_leg(*args)